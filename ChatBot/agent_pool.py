@@ -0,0 +1,99 @@
+import threading
+import time
+from collections import deque
+
+from . import config
+from .counseling_agent import CounselingAgent
+from Common.metrics import metrics
+
+
+class CounselingAgentPool:
+    def __init__(self, model_id=config.MODEL_ID, max_idle=config.AGENT_POOL_SIZE):
+        """
+        Pool of pre-built CounselingAgent scaffolds.
+
+        Building the eight agno agents, the empathizer and the decision maker
+        of a CounselingAgent does not depend on the session, so sessions take
+        a scaffold from the pool and only attach their own state (knowledge
+        base, context, employee data, topics, history). Ended sessions give
+        their agent back after its agno memory is cleared.
+
+        Args:
+            model_id: ID of the LLM used by the scaffolds
+            max_idle: Maximum number of idle scaffolds kept (0 disables pooling)
+        """
+        self.model_id = model_id
+        self.max_idle = max_idle
+        self._idle = deque()
+        self._lock = threading.Lock()
+
+    def _build(self):
+        started = time.perf_counter()
+        agent = CounselingAgent.scaffold(self.model_id)
+        metrics.observe("agent_pool.build_seconds", time.perf_counter() - started)
+        return agent
+
+    def acquire(self, kb_manager, context=None, report_file_path=None):
+        """
+        Return a counseling agent for a new session.
+
+        Args:
+            kb_manager: Knowledge base manager of the session
+            context: Previous conversation context/summary (if any)
+            report_file_path: Path of the employee report
+
+        Returns:
+            A CounselingAgent with the session attached
+        """
+        with self._lock:
+            agent = self._idle.popleft() if self._idle else None
+            metrics.set_gauge("agent_pool.idle", len(self._idle))
+        if agent is None:
+            metrics.increment("agent_pool.misses")
+            agent = self._build()
+        else:
+            metrics.increment("agent_pool.hits")
+        agent.attach_session(kb_manager, context, report_file_path)
+        return agent
+
+    def release(self, agent):
+        """Reset an ended session's agent and keep it for the next session if there is room."""
+        if agent is None or agent.model_id != self.model_id:
+            return
+        try:
+            agent.reset_agents()
+        except Exception as e:
+            print(f"Could not reset counseling agent, dropping it: {str(e)}")
+            return
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(agent)
+                metrics.increment("agent_pool.released")
+            else:
+                metrics.increment("agent_pool.dropped")
+            metrics.set_gauge("agent_pool.idle", len(self._idle))
+
+    def prewarm(self, count=config.AGENT_POOL_PREWARM):
+        """Build scaffolds until count are idle (call from a background thread)."""
+        while True:
+            with self._lock:
+                if len(self._idle) >= min(count, self.max_idle):
+                    return
+            agent = self._build()
+            with self._lock:
+                self._idle.append(agent)
+                metrics.set_gauge("agent_pool.idle", len(self._idle))
+
+
+_agent_pool = None
+_agent_pool_lock = threading.Lock()
+
+
+def get_agent_pool():
+    """Return the shared counseling agent pool."""
+    global _agent_pool
+    if _agent_pool is None:
+        with _agent_pool_lock:
+            if _agent_pool is None:
+                _agent_pool = CounselingAgentPool()
+    return _agent_pool
@@ -1,8 +1,8 @@
 from agno.agent import Agent
-from agno.models.openai import OpenAIChat
-from agno.tools.thinking import ThinkingTools
+from .llm_models import get_chat_model
+from .reasoning import reasoning_agent_kwargs
 from .prompt_templates import DECISION_MAKER_DESCRIPTION, DECISION_MAKER_INSTRUCTIONS, DECISION_MAKER_QUERY
-import os
+from Common.response_cache import cached_agent_run
 
 class ChatDecisionMaker:
     def __init__(self, model_id=None):
@@ -12,14 +12,12 @@ class ChatDecisionMaker:
         Args:
             model_id: ID of the OpenAI model to use
         """
-        api_key = os.getenv("OPENAI_API_KEY")
-        model = OpenAIChat(id=model_id, api_key=api_key) if model_id else OpenAIChat(api_key=api_key)
+        model = get_chat_model(model_id)
         
         self.agent = Agent(
-            model=model,
+            **reasoning_agent_kwargs("decision_maker", model, model_id),
             description=DECISION_MAKER_DESCRIPTION,
             instructions=DECISION_MAKER_INSTRUCTIONS,
-            tools=[ThinkingTools()],
             markdown=True,
         )
     
@@ -31,7 +29,7 @@ class ChatDecisionMaker:
         3. Whether to end the chat
         
         Args:
-            conversation_history: List of conversation exchanges
+            conversation_history: Transcript of the session
             employee_data: Employee information
             context: Previous conversation context (if any)
             
@@ -39,12 +37,7 @@ class ChatDecisionMaker:
             Tuple of (change_topic, escalate_to_hr, end_chat) as boolean values
         """
         # Format conversation history
-        history_text = "\n".join(
-            [
-                f"{'Counselor' if item['role'] == 'counselor' else 'Employee'}: {item['content']}"
-                for item in conversation_history
-            ]
-        )
+        history_text = conversation_history.history_text()
         
         # Create query for decision making
         query = DECISION_MAKER_QUERY.format(
@@ -53,9 +46,8 @@ class ChatDecisionMaker:
             context=context if context else ""
         )
         
-        # Get decision from the agent
-        response = self.agent.run(query)
-        response_text = response.content if hasattr(response, "content") else str(response)
+        # Get decision from the agent (identical histories are served from the response cache)
+        response_text = cached_agent_run(self.agent, query, "decision_maker")
         
         # Parse the response to extract decisions
         decisions = self._parse_decision(response_text)
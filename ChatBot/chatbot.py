@@ -1,6 +1,8 @@
+import asyncio
 import os
+import time
 import traceback
-from fastapi import FastAPI, HTTPException, BackgroundTasks, APIRouter
+from fastapi import FastAPI, HTTPException, BackgroundTasks, APIRouter, WebSocket, WebSocketDisconnect
 from pydantic import BaseModel
 from . import config
 from pathlib import Path
@@ -9,31 +11,67 @@ import json
 from typing import List, Optional
 from dotenv import load_dotenv
 from datetime import datetime, timezone
-from google.cloud import storage
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
 
-from .daily_report import DailyReportAgent,SenderType, Message
+from .daily_report import DailyReportAgent
+from Common.metrics import metrics
+from Common.rate_limiter import Priority, llm_priority
 
 # Load environment variables
 load_dotenv()
 
-try:
-    from .knowledge_base import KnowledgeBaseManager
-except TypeError:
-    print("Using simple knowledge base manager without chunking parameters...")
-    from .knowledge_base import KnowledgeBaseManager
-
-from .counseling_agent import CounselingAgent
+# The knowledge base (sentence-transformers/torch, lancedb) and GCS client are
+# imported lazily where they are used so that importing the router stays cheap
+from .agent_pool import get_agent_pool
 from .conversation_manager import ConversationManager
-from .summary_agent import SummarizerAgent, Message, SenderType
+from .summary_agent import SummarizerAgent
+from .session_reaper import find_reapable_sessions, last_activity, start_reaper_thread
+from .transcript import SenderType
 
 router = APIRouter()
 
 # Store active sessions
 active_sessions = {}
 
-# Initialize components
-summarizer_agent = SummarizerAgent(model="gpt-4o-mini")
-daily_report_agent = DailyReportAgent(model="gpt-4o-mini")
+# Session starts in progress: session_id -> (chain_id, Future of the first message)
+_session_starts = {}
+_session_starts_lock = threading.Lock()
+
+# Session ends in progress: session_id -> Future of (updated context, report path)
+_session_ends = {}
+_session_ends_lock = threading.Lock()
+
+# Results of the sessions freed by the reaper, for a late end_session:
+# session_id -> {"chain_id", "updated_context", "report_file_path", ...}
+reaped_sessions = OrderedDict()
+_reaped_sessions_lock = threading.Lock()
+
+# Components are created on first use (see get_summarizer_agent / get_daily_report_agent)
+_summarizer_agent = None
+_daily_report_agent = None
+_components_lock = threading.Lock()
+
+
+def get_summarizer_agent() -> SummarizerAgent:
+    """Return the shared summarizer agent, creating it on first use."""
+    global _summarizer_agent
+    if _summarizer_agent is None:
+        with _components_lock:
+            if _summarizer_agent is None:
+                _summarizer_agent = SummarizerAgent(model="gpt-4o-mini")
+    return _summarizer_agent
+
+
+def get_daily_report_agent() -> DailyReportAgent:
+    """Return the shared daily report agent, creating it on first use."""
+    global _daily_report_agent
+    if _daily_report_agent is None:
+        with _components_lock:
+            if _daily_report_agent is None:
+                _daily_report_agent = DailyReportAgent(model="gpt-4o-mini")
+    return _daily_report_agent
 
 # Define reports directory paths
 REPORTS_DIR = Path(__file__).parent.parent / "emp_reports"
@@ -56,6 +94,11 @@ class SessionRequest(BaseModel):
 class SessionResponse(BaseModel):
     session_id: str
     message: str
+    # True when the session already existed (or was being started) and was reused
+    resumed: bool = False
+    # State of a resumed session (always False for a new one)
+    complete: bool = False
+    escalated: bool = False
 
 class MessageRequest(BaseModel):
     session_id: str
@@ -90,6 +133,11 @@ class ChainEscalationRequest(BaseModel):
     reason: str
 
 def initialize_session(chain_id: str, session_id: str, background_tasks: BackgroundTasks, context: Optional[str] = None):
+    try:
+        config.validate_chain_id(chain_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
     try:
         # Check if required files exist
         questions_pdf_path = Path(__file__).parent.parent / "ChatBot" / config.QUESTIONS_PDF_PATH
@@ -106,10 +154,13 @@ def initialize_session(chain_id: str, session_id: str, background_tasks: Backgro
         
         # Initialize knowledge bases
         print("Setting up knowledge bases...")
+        from .knowledge_base import KnowledgeBaseManager
+
         kb_manager = KnowledgeBaseManager(
             employee_data_path=str(report_path),
             questions_pdf_path=str(questions_pdf_path),
-            db_uri=f"tmp/counselling_db_{chain_id}"
+            db_uri=config.employee_db_uri(chain_id),
+            chain_id=config.employee_chain_scope(chain_id)
         )
         
         # Load knowledge bases - will skip if already loaded
@@ -121,10 +172,9 @@ def initialize_session(chain_id: str, session_id: str, background_tasks: Backgro
         # Prepare context for the counseling agent
         agent_context = context if context else ""
         
-        counseling_agent = CounselingAgent(
-            model_id=config.MODEL_ID,
+        # Pre-built agents from the pool; only the session state is attached here
+        counseling_agent = get_agent_pool().acquire(
             kb_manager=kb_manager,
-            system_prompt=config.CUSTOM_SYSTEM_PROMPT,
             context=agent_context,
             report_file_path=report_path
         )
@@ -141,18 +191,24 @@ def initialize_session(chain_id: str, session_id: str, background_tasks: Backgro
             "chain_id": chain_id,
             "complete": False,
             "escalated": False,
+            # Summarized and reported by end_session (or the reaper)
+            "ended": False,
+            # Guards "ending" and "turns_in_flight": once a session is ending no
+            # new turn starts, and its agent is released after the running ones
+            "lock": threading.Condition(),
+            "ending": False,
+            "turns_in_flight": 0,
             "context": context,
-            "messages": [],
+            "first_message": first_question,
+            # Shared with the counseling agent, which records the turns it processes
+            "messages": counseling_agent.conversation_history,
             "start_time": datetime.now(),
             "end_time": None
         }
         
-        # Add the first question to messages
-        active_sessions[session_id]["messages"].append({
-            "sender": "bot",
-            "text": first_question,
-            "timestamp": datetime.now(timezone.utc)
-        })
+        # The first question is on record unless the interview failed to start
+        if counseling_agent.conversation_history.last_sender is not SenderType.BOT:
+            counseling_agent.conversation_history.append(SenderType.BOT, first_question)
         
         return first_question
     except Exception as e:
@@ -160,6 +216,71 @@ def initialize_session(chain_id: str, session_id: str, background_tasks: Backgro
         print(traceback.format_exc())
         raise HTTPException(status_code=500, detail=str(e))
 
+def resumed_session_state(session):
+    """
+    Where a session stands, for a client resuming it.
+
+    Returns:
+        Dict with the latest counselor message, complete and escalated
+    """
+    latest = session["messages"].recent_texts(SenderType.BOT, 1)
+    return {
+        "message": latest[0] if latest else session["first_message"],
+        "complete": session["complete"],
+        "escalated": session.get("escalated", False),
+    }
+
+def start_or_resume_session(chain_id: str, session_id: str, background_tasks: BackgroundTasks, context: Optional[str] = None):
+    """
+    Start a session once per session_id.
+
+    A start for a session that already exists returns its latest counselor
+    message and state without initializing anything. Concurrent starts of
+    the same session share a single initialize_session call.
+
+    Returns:
+        Tuple of (dict with message, complete and escalated, whether an
+        existing session was reused)
+
+    Raises:
+        HTTPException: 409 if the session_id belongs to another chain
+    """
+    with _session_starts_lock:
+        session = active_sessions.get(session_id)
+        if session is not None:
+            if session["chain_id"] != chain_id:
+                raise HTTPException(status_code=409, detail="Session already exists for another chain")
+            metrics.increment("chatbot.start_session.reused")
+            return resumed_session_state(session), True
+
+        in_flight = _session_starts.get(session_id)
+        if in_flight is None:
+            future = Future()
+            _session_starts[session_id] = (chain_id, future)
+
+    if in_flight is not None:
+        started_chain_id, future = in_flight
+        if started_chain_id != chain_id:
+            raise HTTPException(status_code=409, detail="Session is being started for another chain")
+        metrics.increment("chatbot.start_session.deduplicated")
+        first_message = future.result()
+        session = active_sessions.get(session_id)
+        if session is not None:
+            return resumed_session_state(session), True
+        return {"message": first_message, "complete": False, "escalated": False}, True
+
+    try:
+        first_message = initialize_session(chain_id, session_id, background_tasks, context)
+        future.set_result(first_message)
+        return {"message": first_message, "complete": False, "escalated": False}, False
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    finally:
+        # The session is in active_sessions by now, so later starts reuse it
+        with _session_starts_lock:
+            _session_starts.pop(session_id, None)
+
 def save_counselling_report_to_gcs(chain_id: str, session_id: str, report: str, escalated: bool):
     """Save the counseling report to a Google Cloud Storage bucket."""
     try:
@@ -177,6 +298,8 @@ def save_counselling_report_to_gcs(chain_id: str, session_id: str, report: str,
         )
 
         # Initialize Google Cloud Storage client
+        from google.cloud import storage
+
         storage_client = storage.Client()
         bucket = storage_client.bucket(GCS_BUCKET_NAME)
         blob = bucket.blob(filename)
@@ -196,6 +319,8 @@ def save_session_report_to_gcs(session_id: str, report: str):
     """Save the counseling report to a Google Cloud Storage bucket."""
     try:
         filename = f"{session_id}.md"
+        from google.cloud import storage
+
         storage_client = storage.Client()
         bucket = storage_client.bucket(GCS_BUCKET_NAME)
         blob = bucket.blob(filename)
@@ -207,171 +332,459 @@ def save_session_report_to_gcs(session_id: str, report: str):
         print(traceback.format_exc())
         return None
 
+def save_session_context_to_gcs(session_id: str, context: str):
+    """Save the updated context of a session that was never ended to a Google Cloud Storage bucket."""
+    try:
+        filename = f"{session_id}_context.md"
+        from google.cloud import storage
+
+        storage_client = storage.Client()
+        bucket = storage_client.bucket(GCS_BUCKET_NAME)
+        blob = bucket.blob(filename)
+        blob.upload_from_string(context, content_type="text/markdown")
+        print(f"Context uploaded to GCS as {filename}")
+        return f"gs://{GCS_BUCKET_NAME}/{filename}"
+    except Exception as e:
+        print(f"Error uploading context to GCS: {str(e)}")
+        print(traceback.format_exc())
+        return None
+
+def session_activity():
+    """
+    Summarize the in-memory sessions for the vector database retention.
+
+    Returns:
+        Tuple of (chain ids with an open session, {chain_id: UNIX time of last activity})
+    """
+    active_chain_ids, last_activity = set(), {}
+    for session in list(active_sessions.values()):
+        chain_id = session.get("chain_id")
+        if not chain_id:
+            continue
+        if not session["complete"]:
+            active_chain_ids.add(chain_id)
+        moment = session.get("end_time") or session.get("start_time")
+        if moment:
+            last_activity[chain_id] = max(last_activity.get(chain_id, 0), moment.timestamp())
+    return active_chain_ids, last_activity
+
+
+@router.on_event("startup")
+def start_db_retention():
+    """Compact and expire the per-chain vector databases periodically."""
+    from .db_retention import start_retention_thread
+
+    start_retention_thread(session_activity)
+
+
+@router.on_event("startup")
+def prewarm_agent_pool():
+    """Build counseling agent scaffolds in the background, ahead of the first sessions."""
+    threading.Thread(target=get_agent_pool().prewarm, name="agent-pool-prewarm", daemon=True).start()
+
+
+@router.on_event("startup")
+def start_session_reaper():
+    """Summarize and free abandoned sessions periodically."""
+    start_reaper_thread(reap_idle_sessions)
+
+
+@router.post("/maintenance/retention")
+async def trigger_db_retention(background_tasks: BackgroundTasks):
+    """Run the vector database retention now, in the background."""
+    from .db_retention import run_retention
+
+    background_tasks.add_task(run_retention, *session_activity())
+    return {"status": "scheduled"}
+
 # health check
 @router.get("/")
 async def health_check():
     return {"status": "ok"}
 
 @router.post("/start_session", response_model=SessionResponse)
-async def start_session(request: SessionRequest, background_tasks: BackgroundTasks):
+def start_session(request: SessionRequest, background_tasks: BackgroundTasks):
+    # Sync endpoint: runs in the threadpool, so a slow start doesn't block other requests
     try:
-        first_message = initialize_session(
+        state, resumed = start_or_resume_session(
             request.chain_id, 
             request.session_id, 
             background_tasks, 
             request.context
         )
-        return {"session_id": request.session_id, "message": first_message}
+        return {"session_id": request.session_id, "resumed": resumed, **state}
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"Error in start_session: {str(e)}")
         print(traceback.format_exc())
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.post("/message", response_model=MessageResponse)
-async def process_message(request: MessageRequest):
-    try:
-        # Check if session exists
-        if request.session_id not in active_sessions:
-            raise HTTPException(status_code=404, detail="Session not found")
-        
-        session = active_sessions[request.session_id]
-        
+def handle_message(session_id: str, chain_id: Optional[str], message: str, on_token=None):
+    """
+    Run one counseling turn of a session and record it.
+
+    Args:
+        session_id: ID of the session
+        chain_id: ID of the chain (used to name the counseling report)
+        message: The employee's message
+        on_token: Optional callable receiving the next question's text as it is generated
+
+    Returns:
+        Dict with the MessageResponse fields
+    """
+    # Check if session exists
+    if session_id not in active_sessions:
+        raise HTTPException(status_code=404, detail="Session not found")
+
+    session = active_sessions[session_id]
+
+    with session["lock"]:
         # Check if conversation is already complete
         if session["complete"]:
             raise HTTPException(status_code=400, detail="Conversation is already complete")
+        if session["ending"]:
+            raise HTTPException(status_code=409, detail="Session is ending")
+        session["turns_in_flight"] += 1
+    try:
+        return _run_turn(session_id, session, chain_id, message, on_token)
+    finally:
+        with session["lock"]:
+            session["turns_in_flight"] -= 1
+            session["lock"].notify_all()
+
+def _run_turn(session_id: str, session: dict, chain_id: Optional[str], message: str, on_token=None):
+    """Body of handle_message, run while the turn is counted in flight."""
+    # Process the message
+    transcript = session["messages"]
+    recorded = len(transcript)
+    conversation_manager = session["conversation_manager"]
+    next_question = conversation_manager.handle_response(message, on_token=on_token)
+
+    # The counseling agent records the turns it processes; rejected messages
+    # and the closing or error replies are only known here
+    if len(transcript) == recorded:
+        transcript.append(SenderType.EMPLOYEE, message)
+    if transcript.last_sender is not SenderType.BOT:
+        transcript.append(SenderType.BOT, next_question)
+
+    complete_the_chain = False
+    escalate_the_chain = False
+
+    
+    # Check if conversation is now complete
+    if conversation_manager.is_conversation_complete():
+        session["complete"] = True
+        session["end_time"] = datetime.now(timezone.utc)
         
-        # Store the user message in the session
-        session["messages"].append({
-            "sender": "employee",
-            "text": request.message,
-            "timestamp": datetime.now(timezone.utc)
-        })
+        # Check if conversation is escalated
+        session["escalated"] = conversation_manager.is_conversation_escalated()
+        escalate_the_chain = session["escalated"]
         
-        # Process the message
-        conversation_manager = session["conversation_manager"]
-        next_question = conversation_manager.handle_response(request.message)
+        # Generate report in the background
+        report = conversation_manager.generate_final_report()
+        session["report"] = report
         
-        # Store the bot response in the session
-        session["messages"].append({
-            "sender": "bot",
-            "text": next_question,
-            "timestamp": datetime.now(timezone.utc)
-        })
-
-        complete_the_chain = False
-        escalate_the_chain = False
-
-        
-        # Check if conversation is now complete
-        if conversation_manager.is_conversation_complete():
-            session["complete"] = True
-            session["end_time"] = datetime.now(timezone.utc)
-            
-            # Check if conversation is escalated
-            session["escalated"] = conversation_manager.is_conversation_escalated()
-            escalate_the_chain = session["escalated"]
-            
-            # Generate report in the background
-            report = conversation_manager.generate_final_report()
-            session["report"] = report
-            
-            # Save the report to a file
-            report_path = save_counselling_report_to_gcs(
-                request.chain_id,                
-                request.session_id,
-                report,
-                session["escalated"]
-            )
-            session["report_file_path"] = report_path
-            
-            # If chain_id is provided, complete the chain
-            if session.get("chain_id"):
-                complete_the_chain = True
+        # Save the report to a file
+        report_path = save_counselling_report_to_gcs(
+            chain_id,                
+            session_id,
+            report,
+            session["escalated"]
+        )
+        session["report_file_path"] = report_path
         
-        # Check if conversation needs to be escalated
-        if conversation_manager.is_conversation_escalated():
-            session["escalated"] = True
-            
-            # If chain_id is provided, escalate the chain
-            if session.get("chain_id"):
-                complete_the_chain = True
-                escalate_the_chain = True
+        # If chain_id is provided, complete the chain
+        if session.get("chain_id"):
+            complete_the_chain = True
+    
+    # Check if conversation needs to be escalated
+    if conversation_manager.is_conversation_escalated():
+        session["escalated"] = True
         
-        # print("Escalation: ", escalate_the_chain)
-        # print("Completion: ", complete_the_chain)
-        return {"message": next_question, "complete_the_chain": complete_the_chain, "escalate_the_chain": escalate_the_chain}
+        # If chain_id is provided, escalate the chain
+        if session.get("chain_id"):
+            complete_the_chain = True
+            escalate_the_chain = True
+    
+    # print("Escalation: ", escalate_the_chain)
+    # print("Completion: ", complete_the_chain)
+    return {"message": next_question, "complete_the_chain": complete_the_chain, "escalate_the_chain": escalate_the_chain}
+
+
+@router.post("/message", response_model=MessageResponse)
+def process_message(request: MessageRequest):
+    # Sync endpoint: a turn may wait for the LLM governor, so it runs in the threadpool
+    try:
+        return handle_message(request.session_id, request.chain_id, request.message)
     except Exception as e:
         print(f"Error in process_message: {str(e)}")
         print(traceback.format_exc())
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.post("/end_session", response_model=EndSessionResponse)
-async def end_session(request: EndSessionRequest):
+@router.websocket("/ws/{session_id}")
+async def stream_messages(websocket: WebSocket, session_id: str):
+    """
+    Counseling turns over a WebSocket, streaming the reply as it is generated.
+
+    The client sends {"message": ..., "chain_id": ...} per turn. The server
+    answers with {"type": "token", "text": ...} events (empathetic preface
+    first, then the question tokens) and a final {"type": "done", "message",
+    "complete_the_chain", "escalate_the_chain"} event whose message is the
+    complete reply (closing messages arrive only there), or
+    {"type": "error", "status_code", "detail"}. A malformed frame gets a 400
+    error event and the socket stays open for the next turn.
+    """
+    await websocket.accept()
+    loop = asyncio.get_running_loop()
     try:
-        # Check if session exists
-        if request.session_id not in active_sessions:
-            raise HTTPException(status_code=404, detail="Session not found")
-        
-        session = active_sessions[request.session_id]
-        
+        while True:
+            frame = await websocket.receive_text()
+            try:
+                request = json.loads(frame)
+            except ValueError:
+                request = None
+            if not (
+                isinstance(request, dict)
+                and isinstance(request.get("message", ""), str)
+                and isinstance(request.get("chain_id"), (str, type(None)))
+            ):
+                metrics.increment("chatbot.stream.malformed_frames")
+                await websocket.send_json({
+                    "type": "error",
+                    "status_code": 400,
+                    "detail": 'Expected a JSON object {"message": str, "chain_id": str}',
+                })
+                continue
+            tokens = asyncio.Queue()
+            started = time.perf_counter()
+
+            def run_turn():
+                try:
+                    return handle_message(
+                        session_id,
+                        request.get("chain_id"),
+                        request.get("message", ""),
+                        on_token=lambda text: loop.call_soon_threadsafe(tokens.put_nowait, text),
+                    )
+                finally:
+                    # End of stream marker, queued after the last token
+                    loop.call_soon_threadsafe(tokens.put_nowait, None)
+
+            turn = loop.run_in_executor(None, run_turn)
+            first_token = True
+            while (text := await tokens.get()) is not None:
+                if first_token:
+                    metrics.observe("chatbot.stream.first_token_seconds", time.perf_counter() - started)
+                    first_token = False
+                await websocket.send_json({"type": "token", "text": text})
+
+            try:
+                result = await turn
+            except HTTPException as e:
+                await websocket.send_json({"type": "error", "status_code": e.status_code, "detail": e.detail})
+                continue
+            except Exception as e:
+                print(f"Error in stream_messages: {str(e)}")
+                print(traceback.format_exc())
+                await websocket.send_json({"type": "error", "status_code": 500, "detail": str(e)})
+                continue
+            metrics.observe("chatbot.stream.turn_seconds", time.perf_counter() - started)
+            await websocket.send_json({"type": "done", **result})
+    except WebSocketDisconnect:
+        print(f"WebSocket closed for session {session_id}")
+
+def _stop_session_turns(session):
+    """Refuse new turns of a session and wait for the running ones to finish."""
+    with session["lock"]:
+        session["ending"] = True
+        session["lock"].wait_for(lambda: session["turns_in_flight"] == 0)
+
+def _release_counseling_agent(session):
+    """Give an ended session's counseling agent back to the pool (once no turn is using it)."""
+    _stop_session_turns(session)
+    conversation_manager = session.get("conversation_manager")
+    if conversation_manager is not None:
+        session["conversation_manager"] = None
+        get_agent_pool().release(conversation_manager.agent)
+
+def finalize_session(session_id: str, current_context: Optional[str] = None):
+    """
+    Summarize a session into an updated context, save its daily report and
+    release its counseling agent (the end_session path, shared with the reaper).
+
+    Concurrent calls for the same session (an end_session racing the reaper)
+    share a single run.
+
+    Args:
+        session_id: ID of the session (must be in active_sessions)
+        current_context: Context to update (default: the session's context)
+
+    Returns:
+        Tuple of (updated context, daily report path or None)
+    """
+    with _session_ends_lock:
+        future = _session_ends.get(session_id)
+        owner = future is None
+        if owner:
+            future = Future()
+            _session_ends[session_id] = future
+    if not owner:
+        metrics.increment("chatbot.end_session.deduplicated")
+        return future.result()
+
+    try:
+        session = active_sessions[session_id]
+
+        # No new turns; the transcript is complete once the running ones finish
+        _stop_session_turns(session)
+
         # Set end time if not already set
         if not session["end_time"]:
             session["end_time"] = datetime.now()
-        
-        # print(session)
-        
-        # Get all messages from the session
-        messages = []
-        for msg in session["messages"]:
-            # print(msg)
-            # print(msg.keys())
-
-            messages.append(Message(
-                sender_type=SenderType.EMPLOYEE if msg["sender"] == "employee" else SenderType.BOT,
-                text=msg["text"],
-                timestamp=msg["timestamp"]
-            ))
-        
+
+        # Transcript of the session, read as-is by the summarizer and the daily report
+        messages = session["messages"]
+
         # Get the current context
-        current_context = request.current_context or session.get("context", "")
-        
+        current_context = current_context or session.get("context") or ""
+
         # Summarize the conversation
-        updated_context = summarizer_agent.summarize_conversation(current_context, messages)
-        
+        updated_context = get_summarizer_agent().summarize_conversation(current_context, messages)
+
         session["complete"] = True
         session["end_time"] = datetime.now(timezone.utc)
 
-        # print("Session message: ", session["messages"])
+        report = get_daily_report_agent().generate_daily_report(updated_context, messages)
 
-        msgs = [
-            Message(
-                sender_type=msg['sender'],
-                text=msg['text'],
-                timestamp=msg['timestamp']
-            ) for msg in session["messages"]
-        ]
-        
-        
-        # print("Updated messages: ", msgs)
-        report = daily_report_agent.generate_daily_report(updated_context, msgs)
+        # The session is over: its counseling agent goes back to the pool
+        _release_counseling_agent(session)
 
         # Save the report to a file
-        report_path = save_session_report_to_gcs(
-            request.session_id,
-            report
-        )
+        report_path = save_session_report_to_gcs(session_id, report)
         session["report_file_path"] = report_path
-        
+        session["ended"] = True
+
+        future.set_result((updated_context, report_path))
+        return updated_context, report_path
+    except Exception as e:
+        # The session stays usable if it could not be summarized
+        session = active_sessions.get(session_id)
+        if session is not None and session["conversation_manager"] is not None:
+            with session["lock"]:
+                session["ending"] = False
+        future.set_exception(e)
+        raise
+    finally:
+        with _session_ends_lock:
+            _session_ends.pop(session_id, None)
+
+@router.post("/end_session", response_model=EndSessionResponse)
+def end_session(request: EndSessionRequest):
+    # Sync endpoint: finalize_session may wait on the reaper's summary of the same session
+    try:
+        # Check if session exists
+        if request.session_id not in active_sessions:
+            with _reaped_sessions_lock:
+                reaped = reaped_sessions.get(request.session_id)
+            if reaped is None:
+                raise HTTPException(status_code=404, detail="Session not found")
+            # Already summarized by the reaper after the session went idle
+            return {
+                "chain_id": request.chain_id,
+                "updated_context": reaped["updated_context"],
+                "message": "Session ended successfully (summarized after inactivity)"
+            }
+
+        updated_context, _ = finalize_session(request.session_id, request.current_context)
+
         return {
             "chain_id": request.chain_id,
             "updated_context": updated_context,
             "message": "Session ended successfully"
         }
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"Error in end_session: {str(e)}")
         print(traceback.format_exc())
         raise HTTPException(status_code=500, detail=str(e))
 
+def _remember_reaped_session(session_id: str, result: dict):
+    """Keep a reaped session's result for a late end_session (bounded, oldest dropped first)."""
+    with _reaped_sessions_lock:
+        reaped_sessions[session_id] = result
+        while len(reaped_sessions) > config.SESSION_REAPER_KEEP_RESULTS:
+            reaped_sessions.popitem(last=False)
+
+def reap_idle_sessions():
+    """
+    Summarize and free idle sessions, and free ended ones.
+
+    Sessions without a message for SESSION_IDLE_TIMEOUT_SECONDS go through
+    the end_session path at batch priority, so the LLM governor admits
+    interactive turns first. Their updated context and daily report are
+    saved to GCS and kept in reaped_sessions for a late end_session, then
+    the session is dropped from active_sessions. Sessions already ended are
+    dropped SESSION_ENDED_TTL_SECONDS after their end.
+
+    Returns:
+        Dict summarizing the run
+    """
+    started = time.perf_counter()
+    idle, ended = find_reapable_sessions(active_sessions)
+    summarized, failed, abandoned = [], [], []
+
+    for session_id in ended:
+        active_sessions.pop(session_id, None)
+    metrics.increment("chatbot.reaper.freed", len(ended))
+
+    for session_id in idle:
+        session = active_sessions.get(session_id)
+        if session is None or session.get("ended"):
+            # Ended or freed since the scan
+            continue
+        metrics.observe("chatbot.reaper.idle_seconds", time.time() - last_activity(session))
+        summary_started = time.perf_counter()
+        try:
+            with llm_priority(Priority.BATCH):
+                updated_context, report_path = finalize_session(session_id)
+        except Exception as e:
+            print(f"Error summarizing idle session {session_id}: {str(e)}")
+            metrics.increment("chatbot.reaper.errors")
+            session["reap_attempts"] = session.get("reap_attempts", 0) + 1
+            if session["reap_attempts"] < config.SESSION_REAPER_MAX_ATTEMPTS:
+                failed.append(session_id)
+                continue
+            # Give up on the summary but still free the session
+            print(f"Freeing idle session {session_id} without a summary")
+            _release_counseling_agent(session)
+            updated_context, report_path, context_path = session.get("context") or "", None, None
+            abandoned.append(session_id)
+        else:
+            metrics.observe("chatbot.reaper.summary_seconds", time.perf_counter() - summary_started)
+            context_path = save_session_context_to_gcs(session_id, updated_context)
+            summarized.append(session_id)
+
+        _remember_reaped_session(session_id, {
+            "chain_id": session["chain_id"],
+            "updated_context": updated_context,
+            "report_file_path": report_path,
+            "context_file_path": context_path,
+            "reaped_at": datetime.now(timezone.utc),
+        })
+        active_sessions.pop(session_id, None)
+
+    metrics.increment("chatbot.reaper.runs")
+    metrics.increment("chatbot.reaper.summarized", len(summarized))
+    metrics.increment("chatbot.reaper.abandoned", len(abandoned))
+    metrics.set_gauge("chatbot.active_sessions", len(active_sessions))
+    metrics.observe("chatbot.reaper.seconds", time.perf_counter() - started)
+    summary = {"summarized": summarized, "freed": ended, "failed": failed, "abandoned": abandoned}
+    if summarized or ended or failed or abandoned:
+        print(f"Session reaper: {summary}")
+    return summary
+
 @router.get("/report/{session_id}")
 async def get_report(session_id: str):
     try:
@@ -23,5 +23,156 @@ QUESTIONS_PDF_PATH = "Questions.pdf"  # Updated path based on your error message
 # Database settings
 DB_URI = "tmp/counselling_db"
 
+
+# Employee report storage: "per_chain" (one database directory per chain) or
+# "shared" (all chains in one table of EMPLOYEE_SHARED_DB_URI, filtered by a
+# chain_id column)
+EMPLOYEE_KB_LAYOUT = os.getenv("EMPLOYEE_KB_LAYOUT", "per_chain")
+EMPLOYEE_SHARED_DB_URI = os.getenv("EMPLOYEE_SHARED_DB_URI", f"{DB_URI}_employees")
+# Approximate nearest-neighbour index over the shared employee table ("none",
+# "ivf_pq" or "hnsw"), built once it holds EMPLOYEE_INDEX_MIN_ROWS rows
+EMPLOYEE_INDEX_TYPE = os.getenv("EMPLOYEE_INDEX_TYPE", "none")
+EMPLOYEE_INDEX_MIN_ROWS = int(os.getenv("EMPLOYEE_INDEX_MIN_ROWS", 5000))
+
+
+# Per-chain databases are named f"{DB_URI}_{chain_id}", next to the shared
+# f"{DB_URI}_questions" and f"{DB_URI}_employees" ones, so these chain ids are refused
+RESERVED_CHAIN_IDS = frozenset({"questions", "employees"})
+
+
+def validate_chain_id(chain_id):
+    """
+    Refuse chain ids whose per-chain database would be a shared one.
+
+    Raises:
+        ValueError: If chain_id is reserved or its database path is a shared database
+    """
+    shared = {os.path.abspath(QUESTIONS_DB_URI), os.path.abspath(EMPLOYEE_SHARED_DB_URI)}
+    if chain_id in RESERVED_CHAIN_IDS or os.path.abspath(f"{DB_URI}_{chain_id}") in shared:
+        raise ValueError(f"chain_id {chain_id!r} is reserved for a shared database")
+
+
+def employee_db_uri(chain_id):
+    """Vector database directory holding a chain's employee report (see validate_chain_id)."""
+    validate_chain_id(chain_id)
+    if EMPLOYEE_KB_LAYOUT == "shared":
+        return EMPLOYEE_SHARED_DB_URI
+    return f"{DB_URI}_{chain_id}"
+
+
+def employee_chain_scope(chain_id):
+    """chain_id to filter the employee table on (None when each chain has its own database)."""
+    return chain_id if EMPLOYEE_KB_LAYOUT == "shared" else None
+
+
+# Vector database directory holding the question templates, shared by all chains
+QUESTIONS_DB_URI = os.getenv("QUESTIONS_DB_URI", f"{DB_URI}_questions")
+
+# Question templates search: "vector", "hybrid" (full-text + vector) or "keyword"
+QUESTIONS_SEARCH_TYPE = os.getenv("QUESTIONS_SEARCH_TYPE", "vector")
+# Approximate nearest-neighbour index on the question templates table:
+# "none" (brute-force scan), "ivf_pq" or "hnsw". The index is only built once
+# the table holds at least QUESTIONS_INDEX_MIN_ROWS rows (PQ needs training data).
+QUESTIONS_INDEX_TYPE = os.getenv("QUESTIONS_INDEX_TYPE", "none")
+QUESTIONS_INDEX_MIN_ROWS = int(os.getenv("QUESTIONS_INDEX_MIN_ROWS", 1000))
+# Number of IVF partitions probed per query (higher: better recall, slower)
+QUESTIONS_INDEX_NPROBES = int(os.getenv("QUESTIONS_INDEX_NPROBES", 20))
+
+# Number of query embeddings kept in the process-wide LRU cache
+QUERY_EMBEDDING_CACHE_SIZE = int(os.getenv("QUERY_EMBEDDING_CACHE_SIZE", 512))
+
+# Number of retrieval results kept in the process-wide LRU cache
+RETRIEVAL_CACHE_SIZE = int(os.getenv("RETRIEVAL_CACHE_SIZE", 256))
+
+# Chunking strategy per knowledge base: "structured" (local, splits on the
+# report's **Issue N:** headings), "agentic" (LLM-driven), "document" or "fixed"
+EMPLOYEE_KB_CHUNKING = os.getenv("EMPLOYEE_KB_CHUNKING", "structured")
+QUESTIONS_KB_CHUNKING = os.getenv("QUESTIONS_KB_CHUNKING", "agentic")
+
+# Vector database retention: per-chain databases unused for KB_RETENTION_TTL_HOURS
+# (and without an open session) are deleted; remaining tables are compacted and
+# versions older than KB_VERSION_RETENTION_MINUTES pruned every
+# KB_RETENTION_INTERVAL_SECONDS (0 disables the periodic run)
+KB_RETENTION_TTL_HOURS = float(os.getenv("KB_RETENTION_TTL_HOURS", 72))
+KB_VERSION_RETENTION_MINUTES = float(os.getenv("KB_VERSION_RETENTION_MINUTES", 60))
+KB_RETENTION_INTERVAL_SECONDS = float(os.getenv("KB_RETENTION_INTERVAL_SECONDS", 3600))
+
+# How a counseling turn is planned: "multi_call" (empathizer, decision maker
+# and question agents) or "single_call" (one structured call, see turn_planner)
+TURN_PLANNING_MODE = os.getenv("TURN_PLANNING_MODE", "multi_call")
+
+# Work done for the next counseling turn while the employee types: "off",
+# "state" (topic tracking) or "draft" (also a change-topic question drafted
+# at BATCH priority, used if the decision maker changes topic). Drafts that
+# are not used cost one LLM call.
+PREFETCH_MODE = os.getenv("PREFETCH_MODE", "off")
+PREFETCH_WORKERS = int(os.getenv("PREFETCH_WORKERS", 4))
+# Longest a turn waits for an unfinished draft before generating the question
+# itself at interactive priority (the draft may be queued behind batch work)
+PREFETCH_DRAFT_WAIT_SECONDS = float(os.getenv("PREFETCH_DRAFT_WAIT_SECONDS", 0.5))
+
+# Pool of pre-built CounselingAgent scaffolds (agno agents and model clients):
+# at most AGENT_POOL_SIZE idle scaffolds are kept (0 disables the pool) and
+# AGENT_POOL_PREWARM are built at startup
+AGENT_POOL_SIZE = int(os.getenv("AGENT_POOL_SIZE", 8))
+AGENT_POOL_PREWARM = int(os.getenv("AGENT_POOL_PREWARM", 2))
+
+# Idle-session reaper, run every SESSION_REAPER_INTERVAL_SECONDS (0 disables it):
+# sessions without a message for SESSION_IDLE_TIMEOUT_SECONDS are summarized
+# like end_session (at batch priority) and freed; sessions already ended are
+# freed SESSION_ENDED_TTL_SECONDS after their end. A failed summary is retried
+# on the next runs, SESSION_REAPER_MAX_ATTEMPTS times in all. The results of the
+# last SESSION_REAPER_KEEP_RESULTS reaped sessions are kept for a late end_session.
+SESSION_REAPER_INTERVAL_SECONDS = float(os.getenv("SESSION_REAPER_INTERVAL_SECONDS", 60))
+SESSION_IDLE_TIMEOUT_SECONDS = float(os.getenv("SESSION_IDLE_TIMEOUT_SECONDS", 1800))
+SESSION_ENDED_TTL_SECONDS = float(os.getenv("SESSION_ENDED_TTL_SECONDS", 3600))
+SESSION_REAPER_MAX_ATTEMPTS = int(os.getenv("SESSION_REAPER_MAX_ATTEMPTS", 3))
+SESSION_REAPER_KEEP_RESULTS = int(os.getenv("SESSION_REAPER_KEEP_RESULTS", 1000))
+
+# Reasoning mode per agent role: "off" (one round-trip), "single_shot" (one
+# round-trip, reasoning requested in the prompt) or "tool" (ThinkingTools, at
+# most REASONING_TOOL_CALL_LIMIT extra tool round-trips per run). Overridden
+# with REASONING_MODE_<ROLE>, e.g. REASONING_MODE_DECISION_MAKER=tool
+DEFAULT_REASONING_MODE = os.getenv("REASONING_MODE", "off")
+REASONING_MODES = {
+    role: os.getenv(f"REASONING_MODE_{role.upper()}", default)
+    for role, default in {
+        "initial_question": DEFAULT_REASONING_MODE,
+        "context_question": DEFAULT_REASONING_MODE,
+        "next_question": DEFAULT_REASONING_MODE,
+        "continue_topic": DEFAULT_REASONING_MODE,
+        "change_topic": DEFAULT_REASONING_MODE,
+        "end_chat": DEFAULT_REASONING_MODE,
+        "escalation": DEFAULT_REASONING_MODE,
+        # Already reasons in its reply before the DECISION line
+        "decision_maker": "single_shot",
+        # Not on the interactive path
+        "report": "tool",
+    }.items()
+}
+REASONING_TOOL_CALL_LIMIT = int(os.getenv("REASONING_TOOL_CALL_LIMIT", 2))
+
+# Local escalation pre-screen (see risk_screen): flags high-risk employee
+# messages without an LLM call. With RISK_SCREEN_EMBEDDINGS, messages are also
+# compared to crisis exemplars with the knowledge base embedder. With
+# RISK_SCREEN_SKIP_BENIGN_DECISIONS, clearly benign turns skip the LLM decision maker.
+RISK_SCREEN_ENABLED = os.getenv("RISK_SCREEN_ENABLED", "true").lower() == "true"
+RISK_SCREEN_EMBEDDINGS = os.getenv("RISK_SCREEN_EMBEDDINGS", "false").lower() == "true"
+RISK_SCREEN_SKIP_BENIGN_DECISIONS = os.getenv("RISK_SCREEN_SKIP_BENIGN_DECISIONS", "false").lower() == "true"
+# Cosine similarity to the closest crisis exemplar above which a message is
+# high risk, and below which it may count as benign
+RISK_SCREEN_HIGH_SIMILARITY = float(os.getenv("RISK_SCREEN_HIGH_SIMILARITY", 0.65))
+RISK_SCREEN_BENIGN_SIMILARITY = float(os.getenv("RISK_SCREEN_BENIGN_SIMILARITY", 0.35))
+
+# Local empathy gate: the empathizer LLM is only called when the employee's
+# last message scores at least EMPATHY_GATE_THRESHOLD (0..1) on the emotion
+# lexicon. With EMPATHY_GATE_EMBEDDINGS, messages below the threshold are also
+# compared to emotional exemplars with the knowledge base embedder. Off by
+# default: check its recall with benchmarks/empathy_gate.py before enabling it.
+EMPATHY_GATE_ENABLED = os.getenv("EMPATHY_GATE_ENABLED", "false").lower() == "true"
+EMPATHY_GATE_THRESHOLD = float(os.getenv("EMPATHY_GATE_THRESHOLD", 0.5))
+EMPATHY_GATE_EMBEDDINGS = os.getenv("EMPATHY_GATE_EMBEDDINGS", "false").lower() == "true"
+EMPATHY_GATE_SIMILARITY = float(os.getenv("EMPATHY_GATE_SIMILARITY", 0.55))
+
 # Custom system prompt (optional, set to None to use default)
 CUSTOM_SYSTEM_PROMPT = None
@@ -23,12 +23,13 @@ class ConversationManager:
         except Exception as e:
             return f"Error starting conversation: {str(e)}"
 
-    def handle_response(self, user_response):
+    def handle_response(self, user_response, on_token=None):
         """
         Process the user's response and get the next question.
 
         Args:
             user_response: The user's response to the previous question
+            on_token: Optional callable receiving the next question's text as it is generated
 
         Returns:
             The next question or a closing message if the conversation is complete or escalated
@@ -37,7 +38,7 @@ class ConversationManager:
             return "Invalid response. Please provide a non-empty message."
 
         try:
-            next_question = self.agent.process_response(user_response)
+            next_question = self.agent.process_response(user_response, on_token=on_token)
 
             if next_question is None:
                 self.is_complete = True
@@ -1,9 +1,7 @@
 from agno.agent import Agent
-from agno.models.groq import Groq
 import re
-from agno.models.google import Gemini
-from agno.models.openai import OpenAIChat
-from agno.tools.thinking import ThinkingTools
+from .llm_models import count_llm_calls, get_chat_model
+from .reasoning import reasoning_agent_kwargs
 from .prompt_templates import (
     INITIAL_QUESTION_DESCRIPTION,
     CONTEXT_QUESTION_DESCRIPTION,
@@ -24,9 +22,24 @@ import os
 from . import config
 from .empathizer_agent import EmpathizerAgent
 from .chat_decision_maker import ChatDecisionMaker
+from .turn_planner import TurnPlanner
+from .risk_screen import BENIGN, HIGH, get_risk_screen
+from .turn_prefetch import TopicState, TurnPrefetch, get_prefetch_executor
+from .transcript import SenderType, Transcript
+from .report_parser import parse_report_file
+from Common.metrics import metrics
+from Common.rate_limiter import Priority, llm_priority
+import time
 
 load_dotenv()
 
+# Fixed retrieval queries used to build the first question of a session
+INITIAL_EMPLOYEE_DATA_QUERY = "Please extract all the issues from the text"
+INITIAL_QUESTION_TEMPLATES_QUERY = "initial counseling questions"
+
+# Sentence boundaries used to pick the question out of a model response
+SENTENCE_SPLIT_PATTERN = re.compile(r"(?<=[.!?])\s+")
+
 
 class CounselingAgent:
     def __init__(
@@ -36,6 +49,8 @@ class CounselingAgent:
         system_prompt=None,
         context=None,
         report_file_path=None,
+        turn_planning_mode=None,
+        prefetch_mode=None,
     ):
         """
         Initialize the counseling agent.
@@ -45,34 +60,50 @@ class CounselingAgent:
             kb_manager: Knowledge base manager for retrieving relevant information
             system_prompt: Custom system prompt for the agent
             context: Previous conversation context/summary (if any)
+            turn_planning_mode: "multi_call" or "single_call" (default: config.TURN_PLANNING_MODE)
+            prefetch_mode: "off", "state" or "draft" (default: config.PREFETCH_MODE)
         """
-        self.kb_manager = kb_manager
-        self.context = context if context else ""
+        self._build_agents(model_id, turn_planning_mode, prefetch_mode)
+        self.attach_session(kb_manager, context, report_file_path)
+
+    @classmethod
+    def scaffold(cls, model_id, turn_planning_mode=None, prefetch_mode=None):
+        """
+        Build the session-independent part of an agent (see agent_pool).
+
+        Returns:
+            A CounselingAgent without a session; call attach_session before use
+        """
+        agent = cls.__new__(cls)
+        agent._build_agents(model_id, turn_planning_mode, prefetch_mode)
+        return agent
 
-        # Set up the model
-        api_key = os.getenv("OPENAI_API_KEY")
-        model = OpenAIChat(id=model_id, api_key=api_key)
+    def _build_agents(self, model_id, turn_planning_mode=None, prefetch_mode=None):
+        """Create the agno agents, model clients and helpers, which hold no session state."""
+        self.turn_planning_mode = turn_planning_mode or config.TURN_PLANNING_MODE
+        self.prefetch_mode = prefetch_mode or config.PREFETCH_MODE
+
+        # Set up the model (shares the pooled OpenAI client with other sessions)
+        model = get_chat_model(model_id)
 
         # Initialize specialized agents for different tasks
         self.initial_agent = Agent(
-            model=model,
+            **reasoning_agent_kwargs("initial_question", model, model_id),
             add_history_to_messages=True,
             # Number of historical responses to add to the messages.
             num_history_responses=15,
             description=INITIAL_QUESTION_DESCRIPTION,
             instructions=INITIAL_QUESTION_INSTRUCTIONS,
-            tools=[ThinkingTools()],
             markdown=True,
         )
 
         self.context_agent = Agent(
-            model=model,
+            **reasoning_agent_kwargs("context_question", model, model_id),
             add_history_to_messages=True,
             # Number of historical responses to add to the messages.
             num_history_responses=15,
             description=CONTEXT_QUESTION_DESCRIPTION,
             instructions=CONTEXT_QUESTION_INSTRUCTIONS,
-            tools=[ThinkingTools()],
             markdown=True,
         )
 
@@ -81,50 +112,45 @@ class CounselingAgent:
         self.next_question_agent = None
 
         self.report_agent = Agent(
-            model=model,
+            **reasoning_agent_kwargs("report", model, model_id),
             add_history_to_messages=True,
             # Number of historical responses to add to the messages.
             num_history_responses=15,
             description=REPORT_GENERATION_DESCRIPTION,
             instructions=REPORT_GENERATION_INSTRUCTIONS,
-            tools=[ThinkingTools()],
             markdown=True,
         )
 
         # Initialize specialized agents for specific conversation tasks
         self.continue_topic_agent = Agent(
-            model=model,
+            **reasoning_agent_kwargs("continue_topic", model, model_id),
             description="Expert at exploring topics deeply in counseling conversations",
             instructions=[
                 "Create follow-up questions that deepen understanding while showing empathy"],
-            tools=[ThinkingTools()],
             markdown=True,
         )
 
         self.change_topic_agent = Agent(
-            model=model,
+            **reasoning_agent_kwargs("change_topic", model, model_id),
             description="Expert at smoothly transitioning between topics in counseling",
             instructions=[
                 "Create transition questions that acknowledge previous topics while introducing new ones"],
-            tools=[ThinkingTools()],
             markdown=True,
         )
 
         self.end_chat_agent = Agent(
-            model=model,
+            **reasoning_agent_kwargs("end_chat", model, model_id),
             description="Expert at closing counseling conversations meaningfully",
             instructions=[
                 "Create closing messages that summarize, acknowledge progress, and offer support"],
-            tools=[ThinkingTools()],
             markdown=True,
         )
 
         self.escalation_agent = Agent(
-            model=model,
+            **reasoning_agent_kwargs("escalation", model, model_id),
             description="Expert at handling sensitive HR escalations",
             instructions=[
                 "Create messages that show concern while explaining the need for additional support"],
-            tools=[ThinkingTools()],
             markdown=True,
         )
 
@@ -134,13 +160,39 @@ class CounselingAgent:
         # Initialize the decision maker agent
         self.decision_maker = ChatDecisionMaker(model_id)
 
-        # Prepare employee data
-        if report_file_path:
-            with open(report_file_path, "r") as file:
-                self.employee_data = file.read()
-        else:
-            with open(config.EMPLOYEE_DATA_PATH, "r") as file:
-                self.employee_data = file.read()
+        # Local escalation pre-screen, run before any LLM call of a turn
+        self.risk_screen = get_risk_screen() if config.RISK_SCREEN_ENABLED else None
+
+        # Single structured call replacing the empathizer, decision and question calls
+        self.turn_planner = TurnPlanner(model_id) if self.turn_planning_mode == "single_call" else None
+
+        # Instructions some agents are given per turn, restored when the scaffold is reused
+        self._initial_instructions = [
+            (agent, list(agent.instructions))
+            for agent in (self.continue_topic_agent, self.change_topic_agent)
+        ]
+
+        # Store the model reference for creating agents later
+        self.model = model
+        self.model_id = model_id
+
+    def attach_session(self, kb_manager, context=None, report_file_path=None):
+        """
+        Attach the per-session state: knowledge base, context, employee data and topics.
+
+        Args:
+            kb_manager: Knowledge base manager for retrieving relevant information
+            context: Previous conversation context/summary (if any)
+            report_file_path: Path of the employee report (default: config.EMPLOYEE_DATA_PATH)
+        """
+        self.kb_manager = kb_manager
+        self.context = context if context else ""
+        # Prefetch for the next turn, started after each question
+        self._prefetch = None
+
+        # Prepare employee data (parsed once per report content, shared by the chain's sessions)
+        self.report = parse_report_file(report_file_path or config.EMPLOYEE_DATA_PATH)
+        self.employee_data = self.report.text
 
         # Extract and store issues from employee data
         self.issues = self._extract_issues_from_data()
@@ -148,45 +200,73 @@ class CounselingAgent:
         self.topic_questions_count = {}  # Track questions per topic
         self.explored_topics = set()  # Keep track of fully explored topics
 
-        # Retrieve relevant question templates
+        # Retrieve relevant question templates together with the material for
+        # the first question, so session start does a single embedding pass
         search_query = f"""
         Summary of chat history of an employee's counselling sessions (note that this can be empty):
         {context}
 
         The most appropriate questions to ask the given employee based on the context:
         """
-        self.question_templates = self.kb_manager.retrieve_from_questions(
-            search_query, num_documents=1
+        (
+            self.question_templates,
+            self._initial_employee_data,
+            self._initial_question_templates,
+        ) = self.kb_manager.retrieve_many(
+            [
+                ("questions", search_query, 1),
+                ("employee", INITIAL_EMPLOYEE_DATA_QUERY, 1),
+                ("questions", INITIAL_QUESTION_TEMPLATES_QUERY, 1),
+            ]
         )
 
         self.current_topic = None
         self.explored_topics = set()
         self.remaining_topics = set()
-        self.conversation_history = []
+        self.conversation_history = Transcript()
         self.is_interview_complete = False
         self.is_escalated_to_hr = False
+        # (change_topic, escalate_to_hr, end_chat) decided for the last turn
+        self.last_turn_decisions = None
+        self.last_turn_llm_calls = 0
+        self.last_turn_tool_calls = 0
+
+    def agno_agents(self):
+        """Return every agno Agent of this counseling agent."""
+        agents = [
+            self.initial_agent,
+            self.context_agent,
+            self.report_agent,
+            self.continue_topic_agent,
+            self.change_topic_agent,
+            self.end_chat_agent,
+            self.escalation_agent,
+            self.empathizer_agent.agent,
+            self.decision_maker.agent,
+        ]
+        if self.turn_planner is not None:
+            agents.append(self.turn_planner.agent)
+        return agents
+
+    def reset_agents(self):
+        """
+        Clear everything a session left in the agents, so the scaffold can be reused.
 
-        # Store the model reference for creating agents later
-        self.model = model
+        The agno agents get a new session (empty memory, so no history leaks into
+        the next session) and their original instructions; the per-session state
+        is replaced by the next attach_session.
+        """
+        self._discard_draft(getattr(self, "_prefetch", None))
+        self._prefetch = None
+        for agent in self.agno_agents():
+            agent.new_session()
+        for agent, instructions in self._initial_instructions:
+            agent.instructions = list(instructions)
+        self.next_question_agent = None
 
     def _extract_issues_from_data(self):
-        """Extract the main issues from employee data"""
-        issues = []
-        # Looking for issue patterns like "Issue 1:", "Issue 2:", etc.
-        issue_pattern = r"Issue \d+:(.*?)(?=Issue \d+:|$)"
-        matches = re.findall(issue_pattern, self.employee_data, re.DOTALL)
-
-        if matches:
-            for match in matches:
-                issues.append(match.strip())
-        else:
-            # Fallback: try to find "**Issue" format
-            issue_pattern = r"\*\*Issue \d+:(.*?)(?=\*\*Issue \d+:|$)"
-            matches = re.findall(issue_pattern, self.employee_data, re.DOTALL)
-            if matches:
-                for match in matches:
-                    issues.append(match.strip())
-
+        """Extract the main issues (the report's issue titles) from employee data"""
+        issues = self.report.topics
         return issues if issues else ["general well-being"]  # Fallback topic
 
     def _get_response_text(self, run_response):
@@ -216,18 +296,50 @@ class CounselingAgent:
         # If all else fails, convert to string
         return str(run_response)
 
+    def _run_agent(self, agent, query, on_token=None):
+        """
+        Run an agent and return its text, streaming the tokens if on_token is given.
+
+        Args:
+            agent: The agno Agent to run
+            query: The prompt
+            on_token: Optional callable receiving every text chunk as it is generated
+
+        Returns:
+            The complete response text
+        """
+        if on_token is None:
+            return self._get_response_text(agent.run(query))
+
+        streaming = agent.stream
+        parts = []
+        try:
+            for chunk in agent.run(query, stream=True):
+                if isinstance(chunk.content, str) and chunk.content:
+                    parts.append(chunk.content)
+                    on_token(chunk.content)
+        finally:
+            # agno keeps stream=True on the agent after a streamed run
+            agent.stream = streaming
+        return "".join(parts)
+
     def start_interview(self):
         """
         Start the counseling interview with an initial question
         generated based on retrieved information and context (if available).
         """
-        # Retrieve relevant information from both knowledge bases
-        employee_data = self.kb_manager.retrieve_from_employee_data(
-            "Please extract all the issues from the text", num_documents=1
-        )
-        question_templates = self.kb_manager.retrieve_from_questions(
-            "initial counseling questions", num_documents=1
-        )
+        # Use the retrievals prefetched in __init__ (only valid for the first start)
+        if self._initial_employee_data is not None:
+            employee_data = self._initial_employee_data
+            question_templates = self._initial_question_templates
+            self._initial_employee_data = self._initial_question_templates = None
+        else:
+            employee_data, question_templates = self.kb_manager.retrieve_many(
+                [
+                    ("employee", INITIAL_EMPLOYEE_DATA_QUERY, 1),
+                    ("questions", INITIAL_QUESTION_TEMPLATES_QUERY, 1),
+                ]
+            )
 
         # Use appropriate agent based on context availability
         if self.context:
@@ -254,59 +366,90 @@ class CounselingAgent:
             self.current_topic = self.issues[0]
             self.topic_questions_count[self.current_topic] = 1
 
-        self.conversation_history.append(
-            {"role": "counselor", "content": initial_question}
-        )
+        self.conversation_history.append(SenderType.BOT, initial_question)
+        self._start_prefetch()
         return initial_question
 
-    def process_response(self, user_response):
+    def process_response(self, user_response, on_token=None):
         """
         Process the user's response and determine the next question to ask.
 
         Args:
             user_response: The user's response to the previous question
+            on_token: Optional callable receiving the empathetic preface and the
+                tokens of the next question as they are generated
 
         Returns:
             The next question to ask, or an indication that the interview is complete
             or has been escalated to HR
         """
-        self.conversation_history.append({"role": "employee", "content": user_response})
+        with count_llm_calls() as calls:
+            next_message = self._process_turn(user_response, on_token)
+        # Model round-trips and reasoning tool calls this turn cost
+        self.last_turn_llm_calls = calls.model_calls
+        self.last_turn_tool_calls = calls.tool_calls
+        metrics.observe("counseling.turn_llm_calls", calls.model_calls)
+        metrics.observe("counseling.turn_tool_calls", calls.tool_calls)
+        if next_message is not None:
+            # Prepare the next turn while the employee reads and answers
+            self._start_prefetch()
+        return next_message
+
+    def _process_turn(self, user_response, on_token=None):
+        """Run one turn of process_response."""
+        self.conversation_history.append(SenderType.EMPLOYEE, user_response)
+        prefetch = self._take_prefetch()
+
+        # Local pre-screen: high-risk messages are escalated without waiting for the LLM
+        screen = self.risk_screen.screen(user_response) if self.risk_screen else None
+        if screen is not None and screen.level == HIGH:
+            print(f"Risk screen escalation: {', '.join(screen.reasons)}")
+            metrics.increment("risk_screen.escalations")
+            self._discard_draft(prefetch)
+            self.last_turn_decisions = (False, True, False)
+            self.is_interview_complete = True
+            self.is_escalated_to_hr = True
+            return None
 
         # Create a condensed conversation history
-        history_text = "\n".join(
-            [
-                f"{'Counselor' if item['role'] == 'counselor' else 'Employee'}: {item['content']}"
-                for item in self.conversation_history
-            ]
-        )
+        history_text = self.conversation_history.history_text()
 
         # Determine if we need to change topics based on question count
-        if self.current_topic and self.current_topic in self.topic_questions_count:
-            if (
-                self.topic_questions_count[self.current_topic] >= 4
-            ):  # Max questions per topic
-                self.explored_topics.add(self.current_topic)
-                # Find a new unexplored topic
-                for topic in self.issues:
-                    if topic not in self.explored_topics:
-                        self.current_topic = topic
-                        self.topic_questions_count[self.current_topic] = 0
-                        break
-                # If all topics explored, mark interview as complete
-                if all(topic in self.explored_topics for topic in self.issues):
-                    self.is_interview_complete = True
-                    return None
+        # (precomputed while the employee was typing, if prefetching)
+        topic_state = prefetch.topic_state if prefetch is not None else self._next_topic_state()
+        self.current_topic = topic_state.current_topic
+        self.topic_questions_count = topic_state.topic_questions_count
+        self.explored_topics = topic_state.explored_topics
+        if topic_state.complete:
+            self._discard_draft(prefetch)
+            self.is_interview_complete = True
+            return None
 
         # Update agent with topic tracking information
-        topic_status = f"""
-        TOPIC TRACKING:
-        - Current topic: {self.current_topic}
-        - Questions asked on current topic: {self.topic_questions_count.get(self.current_topic, 0)}
-        - Topics explored: {', '.join(self.explored_topics) if self.explored_topics else 'None'}
-        - Remaining topics: {', '.join(topic for topic in self.issues if topic not in self.explored_topics)}
-        
-        REMEMBER: MUST change topics after 4 questions.
-        """
+        topic_status = topic_state.topic_status
+
+        started = time.perf_counter()
+        if self.turn_planner is not None:
+            try:
+                plan = self.turn_planner.plan_turn(
+                    self.conversation_history,
+                    self.employee_data,
+                    self.context,
+                    self.question_templates,
+                    topic_status,
+                )
+            except Exception as e:
+                # Fall back to the multi-call path for this turn
+                print(f"Turn planner failed, using separate calls: {str(e)}")
+                metrics.increment("counseling.turn_planner.fallbacks")
+            else:
+                self._discard_draft(prefetch)
+                next_message = self._apply_turn_plan(plan)
+                if on_token is not None and next_message:
+                    # Structured output cannot be streamed, send it in one piece
+                    on_token(next_message)
+                metrics.observe("counseling.turn_seconds.single_call", time.perf_counter() - started)
+                return next_message
 
         # Format the NEXT_QUESTION_INSTRUCTIONS with current conversation history and employee data
         formatted_instructions = []
@@ -321,13 +464,13 @@ class CounselingAgent:
         formatted_instructions.append(topic_status)
 
         # Create or update the next_question_agent with formatted instructions
+        # (multi-call path only, the turn planner builds its own prompt)
         self.next_question_agent = Agent(
-            model=self.model,
+            **reasoning_agent_kwargs("next_question", self.model, self.model_id),
             add_history_to_messages=True,
             num_history_responses=15,
             description=NEXT_QUESTION_DESCRIPTION,
             instructions=formatted_instructions,
-            tools=[ThinkingTools()],
             markdown=True,
         )
 
@@ -336,12 +479,27 @@ class CounselingAgent:
             self.conversation_history
         )
 
-        # Use the decision maker to determine next steps
-        change_topic, escalate_to_hr, end_chat = self.decision_maker.make_decision(
-            self.conversation_history,
-            self.employee_data,
-            self.context
-        )
+        # Use the decision maker to determine next steps (clearly benign turns
+        # can skip it: no escalation, no ending, move on if the reply is positive)
+        if (
+            screen is not None
+            and screen.level == BENIGN
+            and config.RISK_SCREEN_SKIP_BENIGN_DECISIONS
+        ):
+            change_topic, escalate_to_hr, end_chat = screen.change_topic, False, False
+            metrics.increment("risk_screen.decisions_skipped")
+        else:
+            change_topic, escalate_to_hr, end_chat = self.decision_maker.make_decision(
+                self.conversation_history,
+                self.employee_data,
+                self.context
+            )
+        self.last_turn_decisions = (change_topic, escalate_to_hr, end_chat)
+
+        # A drafted change-topic question is only useful if the topic changes
+        draft = self._take_draft(prefetch) if change_topic and not (escalate_to_hr or end_chat) else None
+        if draft is None:
+            self._discard_draft(prefetch)
 
         # Handle decisions based on the decision maker's output
         if escalate_to_hr:
@@ -353,27 +511,36 @@ class CounselingAgent:
             self.is_interview_complete = True
             return None
 
-        elif change_topic:
+        # The preface goes out first, while the question is still being generated
+        if on_token is not None and empathetic_response:
+            on_token(f"{empathetic_response} ")
+
+        if change_topic:
             # Extract current and potential next topics from employee data
             if not self.current_topic:
                 self.current_topic = "general well-being"  # Default initial topic
 
-            # Update the change_topic_agent instructions to use NEXT_QUESTION_INSTRUCTIONS
-            self.change_topic_agent.instructions = NEXT_QUESTION_INSTRUCTIONS
-
-            # Generate a question that changes the topic with properly formatted prompt including empathetic_response
-            change_topic_query = CHANGE_TOPIC_PROMPT.format(
-                conversation_history=history_text,
-                employee_data=self.employee_data,
-                context=self.context,
-                question_templates=self.question_templates,
-                previous_topic=self.current_topic,
-                next_topic="another aspect of your experience",
-                empathetic_response=empathetic_response
-            )
+            if draft is not None:
+                # Drafted from the same prompt without the reply and empathetic preface
+                response_text = draft
+                if on_token is not None:
+                    on_token(response_text)
+            else:
+                # Update the change_topic_agent instructions to use NEXT_QUESTION_INSTRUCTIONS
+                self.change_topic_agent.instructions = NEXT_QUESTION_INSTRUCTIONS
+
+                # Generate a question that changes the topic with properly formatted prompt including empathetic_response
+                change_topic_query = CHANGE_TOPIC_PROMPT.format(
+                    conversation_history=history_text,
+                    employee_data=self.employee_data,
+                    context=self.context,
+                    question_templates=self.question_templates,
+                    previous_topic=self.current_topic,
+                    next_topic="another aspect of your experience",
+                    empathetic_response=empathetic_response
+                )
 
-            response = self.change_topic_agent.run(change_topic_query)
-            response_text = self._get_response_text(response)
+                response_text = self._run_agent(self.change_topic_agent, change_topic_query, on_token)
             next_question = self._extract_question(response_text)
 
             # Update current topic - in practice, you'd extract this from the new question
@@ -393,17 +560,171 @@ class CounselingAgent:
                 empathetic_response=empathetic_response
             )
 
-            response = self.continue_topic_agent.run(continue_topic_query)
-            response_text = self._get_response_text(response)
+            response_text = self._run_agent(self.continue_topic_agent, continue_topic_query, on_token)
             next_question = self._extract_question(response_text)
 
         # Add the new question to conversation history
-        self.conversation_history.append(
-            {"role": "counselor", "content": next_question}
+        # Return the next question (empathetic response already included in the templates)
+        reply = f"{empathetic_response} {response_text}".strip()
+        # The transcript keeps the reply as delivered, the prompts only the question
+        self.conversation_history.append(SenderType.BOT, reply, prompt_text=next_question)
+
+        metrics.observe("counseling.turn_seconds.multi_call", time.perf_counter() - started)
+        return reply
+
+    def _next_topic_state(self):
+        """
+        Topic tracking for the next turn: move on after 4 questions on a topic.
+
+        Returns:
+            A TopicState (the agent's own state is not modified)
+        """
+        current_topic = self.current_topic
+        topic_questions_count = dict(self.topic_questions_count)
+        explored_topics = set(self.explored_topics)
+        complete = False
+        if current_topic and current_topic in topic_questions_count:
+            if topic_questions_count[current_topic] >= 4:  # Max questions per topic
+                explored_topics.add(current_topic)
+                # Find a new unexplored topic
+                for topic in self.issues:
+                    if topic not in explored_topics:
+                        current_topic = topic
+                        topic_questions_count[current_topic] = 0
+                        break
+                # If all topics explored, mark interview as complete
+                complete = all(topic in explored_topics for topic in self.issues)
+
+        topic_status = f"""
+        TOPIC TRACKING:
+        - Current topic: {current_topic}
+        - Questions asked on current topic: {topic_questions_count.get(current_topic, 0)}
+        - Topics explored: {', '.join(explored_topics) if explored_topics else 'None'}
+        - Remaining topics: {', '.join(topic for topic in self.issues if topic not in explored_topics)}
+        
+        REMEMBER: MUST change topics after 4 questions.
+        """
+        return TopicState(current_topic, topic_questions_count, explored_topics, complete, topic_status)
+
+    def _start_prefetch(self):
+        """Precompute the next turn's topic state and, in "draft" mode, a change-topic question."""
+        self._discard_draft(self._prefetch)
+        self._prefetch = None
+        if self.prefetch_mode == "off" or self.is_interview_complete:
+            return
+
+        topic_state = self._next_topic_state()
+        prefetch = TurnPrefetch(len(self.conversation_history), topic_state)
+        if self.prefetch_mode == "draft" and self.turn_planner is None and not topic_state.complete:
+            history_text = self.conversation_history.history_text()
+            query = CHANGE_TOPIC_PROMPT.format(
+                conversation_history=history_text,
+                employee_data=self.employee_data,
+                context=self.context,
+                question_templates=self.question_templates,
+                previous_topic=topic_state.current_topic or "general well-being",
+                next_topic="another aspect of your experience",
+                empathetic_response="",
+            )
+            prefetch.draft = get_prefetch_executor().submit(self._draft_change_topic, query)
+        self._prefetch = prefetch
+
+    def _draft_change_topic(self, query):
+        """Generate a change-topic question at BATCH priority (runs on the prefetch pool)."""
+        started = time.perf_counter()
+        # A separate agent and model, so the draft never shares run state with the turn
+        agent = Agent(
+            **reasoning_agent_kwargs("change_topic", get_chat_model(self.model_id), self.model_id),
+            description="Expert at smoothly transitioning between topics in counseling",
+            instructions=NEXT_QUESTION_INSTRUCTIONS,
+            markdown=True,
         )
+        with llm_priority(Priority.BATCH):
+            response_text = self._get_response_text(agent.run(query))
+        metrics.observe("counseling.prefetch.draft_seconds", time.perf_counter() - started)
+        return response_text
+
+    def _take_prefetch(self):
+        """Return the prefetch for the reply just appended, or None if there is none or it is stale."""
+        prefetch, self._prefetch = self._prefetch, None
+        if prefetch is None:
+            return None
+        if prefetch.history_length != len(self.conversation_history) - 1:
+            # The conversation changed since the question was asked
+            metrics.increment("counseling.prefetch.stale")
+            self._discard_draft(prefetch)
+            return None
+        metrics.increment("counseling.prefetch.state_used")
+        return prefetch
 
-        # Return the next question (empathetic response already included in the templates)
-        return f"{empathetic_response} {response_text}"
+    def _take_draft(self, prefetch):
+        """
+        Return the drafted change-topic question, or None if unavailable.
+
+        An unfinished draft is waited for at most PREFETCH_DRAFT_WAIT_SECONDS:
+        it runs at BATCH priority, so the interactive turn must not queue
+        behind batch work for it. Past that, it is cancelled and the caller
+        generates the question itself.
+        """
+        if prefetch is None or prefetch.draft is None:
+            return None
+        future, prefetch.draft = prefetch.draft, None
+        started = time.perf_counter()
+        try:
+            draft = future.result(timeout=config.PREFETCH_DRAFT_WAIT_SECONDS)
+        except Exception as e:
+            if not future.done():
+                # Timed out waiting (checked on the future: on Python 3.11+ a
+                # TimeoutError raised by the draft itself looks the same)
+                future.cancel()
+                metrics.increment("counseling.prefetch.draft_late")
+                return None
+            print(f"Change-topic draft failed, generating it now: {str(e)}")
+            metrics.increment("counseling.prefetch.draft_errors")
+            return None
+        metrics.observe("counseling.prefetch.draft_wait_seconds", time.perf_counter() - started)
+        metrics.increment("counseling.prefetch.draft_used")
+        return draft
+
+    def _discard_draft(self, prefetch):
+        """Drop an unused change-topic draft (cancelled if it has not started yet)."""
+        if prefetch is None or prefetch.draft is None:
+            return
+        future, prefetch.draft = prefetch.draft, None
+        future.cancel()
+        metrics.increment("counseling.prefetch.draft_discarded")
+
+    def _apply_turn_plan(self, plan):
+        """
+        Apply the decisions of a single-call TurnPlan, like the multi-call path does.
+
+        Args:
+            plan: TurnPlan returned by the turn planner
+
+        Returns:
+            The next message, or None if the interview is complete or escalated
+        """
+        self.last_turn_decisions = (plan.change_topic, plan.escalate_to_hr, plan.end_chat)
+
+        if plan.escalate_to_hr:
+            self.is_interview_complete = True
+            self.is_escalated_to_hr = True
+            return None
+
+        elif plan.end_chat:
+            self.is_interview_complete = True
+            return None
+
+        elif plan.change_topic:
+            if not self.current_topic:
+                self.current_topic = "general well-being"  # Default initial topic
+            self.explored_topics.add(self.current_topic)
+            self.current_topic = "new topic"  # This would be more specific in practice
+
+        next_question = plan.next_question.strip()
+        reply = f"{plan.empathetic_preface.strip()} {next_question}".strip()
+        self.conversation_history.append(SenderType.BOT, reply, prompt_text=next_question)
+        return reply
 
     def _extract_question(self, text):
         """Extract the question from the model response"""
@@ -414,7 +735,7 @@ class CounselingAgent:
             text = text[len("ESCALATED_TO_HR:") :].strip()
 
         # Simple heuristic: look for sentence ending with question mark
-        sentences = re.split(r"(?<=[.!?])\s+", text)
+        sentences = SENTENCE_SPLIT_PATTERN.split(text)
         for sentence in sentences:
             if "?" in sentence:
                 return sentence.strip()
@@ -430,12 +751,7 @@ class CounselingAgent:
             A detailed report on the employee
         """
         # Create a condensed conversation history
-        history_text = "\n".join(
-            [
-                f"{'Counselor' if item['role'] == 'counselor' else 'Employee'}: {item['content']}"
-                for item in self.conversation_history
-            ]
-        )
+        history_text = self.conversation_history.history_text()
 
         # Limit history to avoid token limits
         history_text = history_text[:1500]  # Limit the history to 1500 characters
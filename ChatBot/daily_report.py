@@ -1,6 +1,5 @@
 import datetime
-from enum import Enum
-from typing import List, Optional
+from typing import List, Optional, Union
 from pydantic import BaseModel, Field
 import os
 from dotenv import load_dotenv
@@ -9,21 +8,16 @@ from dotenv import load_dotenv
 from agno.agent import Agent
 
 # from agno.models.google import OpenAIChat
-from agno.models.openai import OpenAIChat
+from .llm_models import get_chat_model
 
 # Import configuration settings
-from .config import MODEL_ID, OPEN_AI_API_KEY
+from .config import MODEL_ID
+from .transcript import SenderType, Transcript
 
 # Load environment variables from .env file
 load_dotenv()
 
 
-class SenderType(str, Enum):
-    BOT = "bot"
-    EMPLOYEE = "employee"
-    HR = "hr"
-
-
 class Message(BaseModel):
     timestamp: datetime.datetime = Field(
         default_factory=lambda: datetime.datetime.now(datetime.timezone.utc),
@@ -62,7 +56,7 @@ class DailyReportAgent:
 
         # Create the agent with description and instructions
         self.agent = Agent(
-            model=OpenAIChat(id=model, api_key=OPEN_AI_API_KEY),
+            model=get_chat_model(model),
             description=self.description,
             instructions=self.instructions,
             markdown=True,
@@ -71,14 +65,14 @@ class DailyReportAgent:
         # print("Type of agent: ", type(self.agent))
 
     def generate_daily_report(
-        self, current_context: str, messages: List[Message]
+        self, current_context: str, messages: Union[Transcript, List[Message]]
     ) -> str:
         """
         Summarize the counseling conversation and create a report for HR using the Agno agent
 
         Args:
             current_context: The existing context about the employee
-            messages: List of Message objects in the conversation between employee and counseling bot
+            messages: Transcript of the conversation between employee and counseling bot (or a list of Message objects)
 
         Returns:
             str: A structured report on the counseling conversation
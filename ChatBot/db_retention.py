@@ -0,0 +1,235 @@
+import os
+import shutil
+import threading
+import time
+from datetime import timedelta
+from pathlib import Path
+
+from . import config
+from Common.metrics import metrics
+
+
+def directory_size(path):
+    """Total size in bytes of the files below a directory."""
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                # Removed by a concurrent compaction
+                pass
+    return total
+
+
+def chain_databases():
+    """Return {chain_id: db_uri} for the per-chain vector databases on disk."""
+    base = Path(config.DB_URI)
+    prefix = f"{base.name}_"
+    shared = {Path(config.QUESTIONS_DB_URI).resolve(), Path(config.EMPLOYEE_SHARED_DB_URI).resolve()}
+    databases = {}
+    if base.parent.exists():
+        for path in base.parent.glob(f"{prefix}*"):
+            chain_id = path.name[len(prefix):]
+            if path.is_dir() and path.resolve() not in shared and chain_id not in config.RESERVED_CHAIN_IDS:
+                databases[chain_id] = str(path)
+    return databases
+
+
+def last_used(db_uri):
+    """UNIX time a database was last used (marker file, else directory mtime)."""
+    from .knowledge_base import LAST_USED_MARKER
+
+    marker = os.path.join(db_uri, LAST_USED_MARKER)
+    path = marker if os.path.exists(marker) else db_uri
+    return os.path.getmtime(path)
+
+
+def expire_shared_chains(active_chain_ids, chain_last_activity, expire_before):
+    """
+    Delete the rows of expired chains from the shared employee table.
+
+    Returns:
+        List of chain ids whose rows were deleted
+    """
+    from .knowledge_base import (
+        LAST_USED_MARKER,
+        employee_lock_key,
+        get_connection,
+        get_db_lock,
+        invalidate_database,
+    )
+
+    db_uri = config.EMPLOYEE_SHARED_DB_URI
+    prefix = f"{LAST_USED_MARKER}."
+    deleted = []
+    for marker in sorted(Path(db_uri).glob(f"{prefix}*")):
+        chain_id = marker.name[len(prefix):]
+        if chain_id in active_chain_ids:
+            continue
+        with get_db_lock(employee_lock_key(db_uri, chain_id)):
+            if max(marker.stat().st_mtime, chain_last_activity.get(chain_id, 0)) >= expire_before:
+                continue
+            connection = get_connection(db_uri)
+            if "employee_data" in connection.table_names():
+                escaped = chain_id.replace("'", "''")
+                connection.open_table("employee_data").delete(f"chain_id = '{escaped}'")
+            marker.unlink()
+            deleted.append(chain_id)
+    if deleted:
+        invalidate_database(db_uri)
+    return deleted
+
+
+def compact_database(db_uri, keep_versions_for):
+    """
+    Compact every table of a database and prune versions older than keep_versions_for.
+
+    Args:
+        db_uri: Path of the vector database
+        keep_versions_for: timedelta of table versions to keep
+
+    Returns:
+        Number of tables compacted
+    """
+    import lancedb
+
+    connection = lancedb.connect(db_uri)
+    compacted = 0
+    for table_name in connection.table_names():
+        table = connection.open_table(table_name)
+        table.compact_files()
+        table.cleanup_old_versions(older_than=keep_versions_for)
+        compacted += 1
+    return compacted
+
+
+def enforce_retention(active_chain_ids=(), chain_last_activity=None):
+    """
+    Delete expired per-chain databases and compact the remaining ones.
+
+    A chain's database expires when the chain has no open session and was
+    last used (session start, report warm-up or session end) more than
+    KB_RETENTION_TTL_HOURS ago. It is rebuilt from the report on the next
+    session start. In the shared employee table, only the expired chain's
+    rows are deleted. Every database operation holds the database (or
+    chain) lock, so it never races a session start or a background warm-up.
+
+    Args:
+        active_chain_ids: Chains with an open session (never deleted)
+        chain_last_activity: Optional {chain_id: UNIX time} of the last
+            session activity known in memory
+
+    Returns:
+        Dict summarizing the run
+    """
+    from .knowledge_base import get_db_lock, invalidate_database
+
+    started = time.perf_counter()
+    chain_last_activity = chain_last_activity or {}
+    active_chain_ids = set(active_chain_ids)
+    expire_before = time.time() - config.KB_RETENTION_TTL_HOURS * 3600
+    keep_versions_for = timedelta(minutes=config.KB_VERSION_RETENTION_MINUTES)
+    deleted, compacted, reclaimed, failed = [], 0, 0, []
+
+    databases = chain_databases()
+    for chain_id, db_uri in sorted(databases.items()):
+        with get_db_lock(db_uri):
+            try:
+                size_before = directory_size(db_uri)
+                last_activity = max(last_used(db_uri), chain_last_activity.get(chain_id, 0))
+                if chain_id not in active_chain_ids and last_activity < expire_before:
+                    shutil.rmtree(db_uri)
+                    invalidate_database(db_uri)
+                    deleted.append(chain_id)
+                    reclaimed += size_before
+                    continue
+                compacted += compact_database(db_uri, keep_versions_for)
+                reclaimed += size_before - directory_size(db_uri)
+            except Exception as e:
+                print(f"Retention failed for {db_uri}: {str(e)}")
+                failed.append(chain_id)
+
+    if os.path.isdir(config.EMPLOYEE_SHARED_DB_URI):
+        try:
+            deleted += expire_shared_chains(active_chain_ids, chain_last_activity, expire_before)
+        except Exception as e:
+            print(f"Retention failed for {config.EMPLOYEE_SHARED_DB_URI}: {str(e)}")
+
+    for db_uri in (config.EMPLOYEE_SHARED_DB_URI, config.QUESTIONS_DB_URI):
+        if not os.path.isdir(db_uri):
+            continue
+        with get_db_lock(db_uri):
+            try:
+                size_before = directory_size(db_uri)
+                compacted += compact_database(db_uri, keep_versions_for)
+                reclaimed += size_before - directory_size(db_uri)
+            except Exception as e:
+                print(f"Retention failed for {db_uri}: {str(e)}")
+
+    remaining = [uri for chain_id, uri in databases.items() if chain_id not in deleted]
+    chain_bytes = sum(directory_size(uri) for uri in remaining)
+    if os.path.isdir(config.EMPLOYEE_SHARED_DB_URI):
+        chain_bytes += directory_size(config.EMPLOYEE_SHARED_DB_URI)
+    questions_bytes = directory_size(config.QUESTIONS_DB_URI) if os.path.isdir(config.QUESTIONS_DB_URI) else 0
+
+    metrics.set_gauge("kb.disk.databases", len(remaining))
+    metrics.set_gauge("kb.disk.chain_bytes", chain_bytes)
+    metrics.set_gauge("kb.disk.questions_bytes", questions_bytes)
+    metrics.set_gauge("kb.disk.total_bytes", chain_bytes + questions_bytes)
+    metrics.increment("kb.retention.runs")
+    metrics.increment("kb.retention.deleted_databases", len(deleted))
+    metrics.increment("kb.retention.compacted_tables", compacted)
+    metrics.increment("kb.retention.reclaimed_bytes", max(reclaimed, 0))
+    metrics.observe("kb.retention.seconds", time.perf_counter() - started)
+
+    summary = {
+        "deleted_chains": deleted,
+        "failed_chains": failed,
+        "compacted_tables": compacted,
+        "reclaimed_bytes": max(reclaimed, 0),
+        "remaining_databases": len(remaining),
+        "disk_bytes": chain_bytes + questions_bytes,
+    }
+    print(f"Vector database retention: {summary}")
+    return summary
+
+
+_retention_lock = threading.Lock()
+
+
+def run_retention(active_chain_ids=(), chain_last_activity=None):
+    """Run enforce_retention unless a run is already in progress (returns None then)."""
+    if not _retention_lock.acquire(blocking=False):
+        print("Vector database retention already running, skipping.")
+        return None
+    try:
+        return enforce_retention(active_chain_ids, chain_last_activity)
+    finally:
+        _retention_lock.release()
+
+
+def start_retention_thread(session_activity, interval=config.KB_RETENTION_INTERVAL_SECONDS):
+    """
+    Run retention periodically on a daemon thread.
+
+    Args:
+        session_activity: Callable returning (active_chain_ids, chain_last_activity)
+        interval: Seconds between runs (0 or less disables the thread)
+
+    Returns:
+        threading.Event that stops the thread when set (None if disabled)
+    """
+    if interval <= 0:
+        return None
+    stop = threading.Event()
+
+    def loop():
+        while not stop.wait(interval):
+            try:
+                run_retention(*session_activity())
+            except Exception as e:
+                print(f"Error in vector database retention: {str(e)}")
+
+    threading.Thread(target=loop, name="kb-retention", daemon=True).start()
+    return stop
@@ -1,25 +1,30 @@
 from agno.agent import Agent
-from agno.models.openai import OpenAIChat
-from typing import List, Dict
+from .llm_models import get_chat_model
 import os
 from dotenv import load_dotenv
 from . import config
+from .empathy_gate import get_empathy_gate
+from .transcript import SenderType, Transcript
+from Common.metrics import metrics
 
 # Load environment variables from .env file
 load_dotenv()
 
 class EmpathizerAgent:
-    def __init__(self, model_id=config.MODEL_ID):
+    def __init__(self, model_id=config.MODEL_ID, use_gate=None):
         """
         Initialize the empathizer agent with a lightweight model using Groq.
         
         Args:
             model_id: ID of the LLM to use (default: llama3-8b-8192 which is less powerful but fast)
+            use_gate: Only call the LLM when the local empathy gate scores the last
+                employee message as emotional (default: config.EMPATHY_GATE_ENABLED)
         """
+        if use_gate is None:
+            use_gate = config.EMPATHY_GATE_ENABLED
+        self.empathy_gate = get_empathy_gate() if use_gate else None
         
-        # Get Groq API key
-        api_key = config.OPEN_AI_API_KEY
-        model = OpenAIChat(id=model_id, api_key=api_key)
+        model = get_chat_model(model_id)
         
         # Agent description for context
         description = """
@@ -55,26 +60,28 @@ class EmpathizerAgent:
             markdown=True,
         )
     
-    def generate_empathetic_response(self, conversation_history: List[Dict[str, str]]) -> str:
+    def generate_empathetic_response(self, conversation_history: Transcript) -> str:
         """
         Generate an empathetic response based on the recent conversation history.
         
         Args:
-            conversation_history: List of conversation turns with 'role' and 'content' keys
+            conversation_history: Transcript of the session
         
         Returns:
             A short empathetic response (1-2 sentences)
         """
-        # Extract the last 2-3 employee messages for context
-        recent_messages = []
-        for item in reversed(conversation_history):
-            if item["role"] == "employee":
-                recent_messages.append(f"Employee: {item['content']}")
-                if len(recent_messages) >= 2:
-                    break
-        
-        # Reverse to maintain chronological order
-        recent_messages.reverse()
+        # Extract the last 2-3 employee messages for context (in chronological order)
+        employee_texts = conversation_history.recent_texts(SenderType.EMPLOYEE, 2)
+        recent_messages = [f"Employee: {text}" for text in employee_texts]
+
+        # Skip the LLM call when the last message carries no notable emotion
+        last_message = employee_texts[-1] if employee_texts else None
+        if self.empathy_gate is not None and last_message is not None:
+            score = self.empathy_gate.score(last_message)
+            if not score.needs_empathy:
+                metrics.increment("empathy_gate.calls_avoided")
+                return ""
+            metrics.increment("empathy_gate.llm_calls")
         
         # Create the prompt
         prompt = f"""
@@ -112,6 +119,9 @@ class EmpathizerAgent:
 
         # Return empty string if empathy is not needed
         if response_text == "NO_EMPATHY_NEEDED":
+            if self.empathy_gate is not None:
+                # The gate let through a message the LLM found unemotional
+                metrics.increment("empathy_gate.llm_no_empathy")
             return ""
 
         return response_text
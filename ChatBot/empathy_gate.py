@@ -0,0 +1,192 @@
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from . import config
+from .risk_screen import CRISIS_PATTERNS
+from Common.metrics import metrics
+
+# Emotion words by intensity; the strongest match sets the base score
+EMOTION_TIERS = [
+    (
+        1.0,
+        re.compile(
+            r"\b(hopeless|devastat\w*|miserable|furious|heartbroken|humiliat\w*|terrified|"
+            r"panic\w*|cry(ing)?|cried|tears|breaking\s+down|burn(ed|t)?\s*out|exhausted|"
+            r"can'?t\s+(take|handle|cope)|falling\s+apart|worthless|desperate|traumati\w*|"
+            # Grief
+            r"passed\s+away|funeral|griev\w*|grief|bereave\w*|miscarr\w*|"
+            r"lost\s+my\s+(mother|father|mom|mum|dad|parents?|wife|husband|partner|son|daughter|child|baby|"
+            r"brother|sister|grand\w+|best\s+friend))\b",
+            re.IGNORECASE,
+        ),
+    ),
+    (
+        0.6,
+        re.compile(
+            r"\b(stress(ed|ful)?|anxious|anxiety|frustrat\w*|upset|angry|worried|worry(ing)?|"
+            r"overwhelm(ed|ing)?|lonely|isolated|sad|hurt|disappoint\w*|unfair|ignored|"
+            r"undervalued|unappreciated|invisible|struggl\w*|scared|afraid|demotivated|"
+            r"drained|resent\w*|betrayed|bull(y|ied|ying)|harass\w*|discriminat\w*|"
+            r"can'?t\s+sleep|barely\s+sleep|fed\s+up|sick\s+of|tired\s+of|give\s+up|gave\s+up|"
+            r"nothing\s+(ever\s+)?chang\w*|(no\s*one|nobody)\s+(listens|cares)|"
+            r"(think\w*|thought)\s+(about|of)\s+(leaving|quitting|resigning)|"
+            r"died|death|diagnos\w*|rough|hard\s+time|tough\s+time|difficult\s+time|"
+            # Respect and recognition
+            r"disrespect\w*|(doesn'?t|don'?t|didn'?t|never)\s+respect|belittl\w*|"
+            r"(took|takes|taking|stole|steals)\s+(the\s+|all\s+the\s+)?credit|(no|zero|without)\s+(recognition|credit)|"
+            # Career setbacks
+            r"passed\s+over|overlooked|demoted|laid\s+off|fired|rejected|"
+            r"(denied|lost|missed\s+out\s+on|didn'?t\s+get)\s+(a\s+|the\s+|my\s+)?(promotion|raise|bonus))\b",
+            re.IGNORECASE,
+        ),
+    ),
+    (
+        0.3,
+        re.compile(
+            r"\b(annoy\w*|bother\w*|confus\w*|concern\w*|nervous|unsure|uneasy|down|"
+            r"tired|bored|stuck|uncomfortable|pressure)\b",
+            re.IGNORECASE,
+        ),
+    ),
+]
+
+# A negation just before an emotion word cancels it ("not stressed anymore")
+NEGATED_PATTERN = re.compile(r"\b(not|never|no\s+longer|no|isn'?t|wasn'?t|aren'?t|don'?t)\s+(\w+\s+)?$", re.IGNORECASE)
+
+# A negated positive word reads as a moderate emotion ("not happy", "don't feel appreciated")
+NEGATED_POSITIVE_PATTERN = re.compile(
+    r"\b(not|never|no\s+longer|(do|does|did|is|was|are|were|have|has)n'?t)\s+(\w+\s+)?"
+    r"(happy|okay|ok|good|great|fine|valued|appreciated|respected|recogni[sz]ed|supported|heard|motivated)\b",
+    re.IGNORECASE,
+)
+
+INTENSIFIER_PATTERN = re.compile(r"\b(really|so|very|extremely|completely|totally|constantly|always)\b|!", re.IGNORECASE)
+
+# Personal disclosure makes acknowledging the feeling more important
+DISCLOSURE_PATTERN = re.compile(
+    r"\b(i\s+feel|i'?m\s+feeling|i'?ve\s+been\s+feeling|i\s+felt|makes\s+me\s+feel|my\s+(family|health|mental))\b",
+    re.IGNORECASE,
+)
+
+# Exemplars for the optional embedding stage
+EMOTIONAL_EXEMPLARS = [
+    "I feel completely overwhelmed and stressed at work",
+    "I am really frustrated that nobody recognises my effort",
+    "I feel lonely and left out by my team",
+    "I am anxious about losing my job",
+    "It hurts that my manager ignores me",
+    "I am exhausted and burned out",
+    "I feel like I am not valued here",
+]
+
+
+@dataclass
+class EmpathyScore:
+    """Emotion intensity of an employee message as scored by the local gate."""
+
+    intensity: float
+    needs_empathy: bool
+    # Closest emotional exemplar similarity (None without the embedding stage)
+    similarity: Optional[float] = None
+    reasons: List[str] = field(default_factory=list)
+
+
+class EmpathyGate:
+    def __init__(self, threshold=None, use_embeddings=None):
+        """
+        Initialize the local empathy gate.
+
+        Args:
+            threshold: Emotion intensity from which the empathizer LLM is called
+                (default: config.EMPATHY_GATE_THRESHOLD)
+            use_embeddings: Also compare messages to emotional exemplars with the
+                knowledge base embedder (default: config.EMPATHY_GATE_EMBEDDINGS)
+        """
+        self.threshold = config.EMPATHY_GATE_THRESHOLD if threshold is None else threshold
+        self.use_embeddings = config.EMPATHY_GATE_EMBEDDINGS if use_embeddings is None else use_embeddings
+        self._exemplars = None
+        self._lock = threading.Lock()
+
+    def _emotional_similarity(self, text):
+        """Cosine similarity of text to the closest emotional exemplar."""
+        if self._exemplars is None:
+            with self._lock:
+                if self._exemplars is None:
+                    from .knowledge_base import ExemplarMatcher
+
+                    self._exemplars = ExemplarMatcher(EMOTIONAL_EXEMPLARS)
+        return self._exemplars.closest_similarity(text)
+
+    def _lexicon_intensity(self, text, reasons):
+        """Score 0..1 from the emotion lexicon, ignoring negated emotion words."""
+        if any(pattern.search(text) for pattern in CRISIS_PATTERNS):
+            reasons.append("crisis")
+            return 1.0
+
+        weights = []
+        for weight, pattern in EMOTION_TIERS:
+            for match in pattern.finditer(text):
+                if NEGATED_PATTERN.search(text[max(0, match.start() - 25) : match.start()]):
+                    continue
+                weights.append(weight)
+                reasons.append(match.group(0).lower())
+        for match in NEGATED_POSITIVE_PATTERN.finditer(text):
+            weights.append(0.6)
+            reasons.append(match.group(0).lower())
+        if not weights:
+            return 0.0
+
+        weights.sort(reverse=True)
+        # Further emotion words add a little on top of the strongest one
+        intensity = weights[0] + 0.1 * (len(weights) - 1)
+        if INTENSIFIER_PATTERN.search(text):
+            intensity *= 1.25
+        if DISCLOSURE_PATTERN.search(text):
+            intensity += 0.15
+        return min(intensity, 1.0)
+
+    def score(self, text):
+        """
+        Score how strongly an employee message expresses emotion.
+
+        Args:
+            text: The employee's message
+
+        Returns:
+            An EmpathyScore
+        """
+        started = time.perf_counter()
+        reasons = []
+        intensity = self._lexicon_intensity(text, reasons)
+        similarity = None
+        if intensity < self.threshold and self.use_embeddings:
+            similarity = self._emotional_similarity(text)
+            if similarity >= config.EMPATHY_GATE_SIMILARITY:
+                intensity = max(intensity, self.threshold)
+                reasons.append(f"emotional similarity {similarity:.2f}")
+
+        result = EmpathyScore(
+            intensity=intensity,
+            needs_empathy=intensity >= self.threshold,
+            similarity=similarity,
+            reasons=reasons,
+        )
+        metrics.observe("empathy_gate.seconds", time.perf_counter() - started)
+        return result
+
+
+_empathy_gate = None
+_empathy_gate_lock = threading.Lock()
+
+
+def get_empathy_gate():
+    """Return the shared empathy gate (exemplar embeddings are computed once per process)."""
+    global _empathy_gate
+    if _empathy_gate is None:
+        with _empathy_gate_lock:
+            if _empathy_gate is None:
+                _empathy_gate = EmpathyGate()
+    return _empathy_gate
@@ -2,97 +2,664 @@ from agno.knowledge.text import TextKnowledgeBase
 from agno.knowledge.pdf import PDFKnowledgeBase
 from agno.vectordb.lancedb import LanceDb, SearchType
 from agno.embedder.sentence_transformer import SentenceTransformerEmbedder
-from agno.document.chunking.agentic import AgenticChunking
+import pyarrow as pa
+from .report_chunking import get_chunking_strategy
+from . import config
+from Common.metrics import metrics
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import md5
+import json
+import math
 import os
+import threading
+import time
 
-class KnowledgeBaseManager:
-    def __init__(self, employee_data_path, questions_pdf_path, db_uri="tmp/counselling_db"):
+# Sentence-transformer models and query embeddings are shared process-wide
+_models = {}
+_models_lock = threading.Lock()
+_query_embeddings = OrderedDict()
+_query_embeddings_lock = threading.Lock()
+
+
+class CachedSentenceTransformerEmbedder(SentenceTransformerEmbedder):
+    """
+    SentenceTransformerEmbedder that loads its model once per process,
+    embeds batches of texts in a single encode call and keeps an LRU cache
+    of query embeddings.
+
+    The stock embedder reloads the model on every call. Vector search embeds
+    queries through get_embedding (cached), while document loading goes
+    through get_embedding_and_usage, which bypasses the cache so report
+    chunks do not evict the recurring session-start queries.
+    """
+
+    def _get_model(self):
+        model = _models.get(self.id)
+        if model is None:
+            with _models_lock:
+                model = _models.get(self.id)
+                if model is None:
+                    from sentence_transformers import SentenceTransformer
+
+                    model = _models[self.id] = SentenceTransformer(model_name_or_path=self.id)
+        return model
+
+    def encode(self, texts):
+        """Embed a list of texts in one batch, bypassing the query cache."""
+        return [embedding.tolist() for embedding in self._get_model().encode(texts)]
+
+    def get_embeddings(self, texts):
         """
-        Initialize the knowledge bases for employee data and counseling questions.
-        
+        Embed several query strings, encoding all cache misses in one batch.
+
         Args:
-            employee_data_path: Path to the employee.txt file containing employee data
-            questions_pdf_path: Path to the Questions.pdf containing question templates
-            db_uri: Path to store the vector database
+            texts: List of query strings
+
+        Returns:
+            List of embeddings in the same order as texts
         """
-        # Using SentenceTransformerEmbedder which doesn't need an API key or model specification
-        self.embedder = SentenceTransformerEmbedder()
-        
-        # Create knowledge base for employee data
-        self.employee_kb = TextKnowledgeBase(
-            path=employee_data_path,
-            chunking_strategy=AgenticChunking(),
-            vector_db=LanceDb(
-                table_name="employee_data",
-                uri=db_uri,
-                search_type=SearchType.vector,
-                embedder=self.embedder
+        embeddings = {}
+        with _query_embeddings_lock:
+            for text in texts:
+                if text in _query_embeddings:
+                    _query_embeddings.move_to_end(text)
+                    embeddings[text] = _query_embeddings[text]
+        missing = list(dict.fromkeys(text for text in texts if text not in embeddings))
+        metrics.increment("kb.query_embedding_cache.hits", len(texts) - len(missing))
+        metrics.increment("kb.query_embedding_cache.misses", len(missing))
+
+        if missing:
+            for text, embedding in zip(missing, self.encode(missing)):
+                embeddings[text] = embedding
+            with _query_embeddings_lock:
+                for text in missing:
+                    _query_embeddings[text] = embeddings[text]
+                while len(_query_embeddings) > config.QUERY_EMBEDDING_CACHE_SIZE:
+                    _query_embeddings.popitem(last=False)
+        return [embeddings[text] for text in texts]
+
+    def get_embedding(self, text):
+        if isinstance(text, str):
+            return self.get_embeddings([text])[0]
+        return self.encode(text)
+
+    def get_embedding_and_usage(self, text):
+        return self.encode([text])[0], None
+
+
+def cosine_similarity(a, b):
+    """Cosine similarity of two embeddings (0.0 if either is all zeros)."""
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+class ExemplarMatcher:
+    def __init__(self, exemplars):
+        """
+        Compare texts to a fixed set of exemplar sentences.
+
+        The exemplars are embedded once, with the same process-wide
+        sentence-transformer as the knowledge bases.
+
+        Args:
+            exemplars: Exemplar sentences
+        """
+        self.embedder = CachedSentenceTransformerEmbedder()
+        self.exemplar_embeddings = self.embedder.encode(list(exemplars))
+
+    def closest_similarity(self, text):
+        """Cosine similarity of text to the closest exemplar."""
+        embedding = self.embedder.encode([text])[0]
+        return max(cosine_similarity(embedding, exemplar) for exemplar in self.exemplar_embeddings)
+
+
+# One lock per database directory, so that a report being embedded in the
+# background and a session start for the same chain never write the same
+# tables concurrently
+_db_locks = {}
+_db_locks_guard = threading.Lock()
+
+
+def get_db_lock(db_uri):
+    """Return the (re-entrant) lock guarding a vector database directory."""
+    with _db_locks_guard:
+        lock = _db_locks.get(db_uri)
+        if lock is None:
+            lock = _db_locks[db_uri] = threading.RLock()
+        return lock
+
+
+def employee_lock_key(db_uri, chain_id=None):
+    """Lock key for a chain's employee data (per chain inside a shared table)."""
+    return f"{db_uri}#{chain_id}" if chain_id is not None else db_uri
+
+
+# Marker file whose modification time records the last use of a database
+# (".last_used.<chain_id>" for a chain inside the shared employee table)
+LAST_USED_MARKER = ".last_used"
+
+
+def touch_database(db_uri, chain_id=None):
+    """Record that a vector database (or a chain in it) was just used (read by db_retention)."""
+    name = f"{LAST_USED_MARKER}.{chain_id}" if chain_id is not None else LAST_USED_MARKER
+    marker = os.path.join(db_uri, name)
+    os.makedirs(db_uri, exist_ok=True)
+    with open(marker, "a"):
+        os.utime(marker)
+
+
+def table_row_count(vector_db):
+    """Number of rows in a LanceDb table (or chain scope), read from a fresh handle (0 if missing)."""
+    if not vector_db.exists():
+        return 0
+    table = vector_db.connection.open_table(vector_db.table_name)
+    return table.count_rows(getattr(vector_db, "row_filter", None))
+
+
+# Shared connections for the shared employee table, so that sessions do not
+# each open their own
+_connections = {}
+_connections_lock = threading.Lock()
+
+
+def get_connection(db_uri):
+    """Return the process-wide LanceDB connection for a database directory."""
+    with _connections_lock:
+        connection = _connections.get(db_uri)
+        if connection is None:
+            import lancedb
+
+            connection = _connections[db_uri] = lancedb.connect(uri=db_uri)
+        return connection
+
+
+class ChainScopedLanceDb(LanceDb):
+    """
+    One chain's view of an employee table shared by all chains.
+
+    Rows carry a chain_id column: searches are pre-filtered on it, and
+    drop() (used by load(recreate=True)) only deletes the chain's own rows.
+    Only vector search is supported.
+    """
+
+    def __init__(self, chain_id, **kwargs):
+        # Needed by _base_schema, which LanceDb.__init__ calls for a new table
+        self.chain_id = str(chain_id)
+        super().__init__(**kwargs)
+
+    @property
+    def row_filter(self):
+        escaped = self.chain_id.replace("'", "''")
+        return f"chain_id = '{escaped}'"
+
+    def _base_schema(self):
+        return super()._base_schema().append(pa.field("chain_id", pa.string()))
+
+    def _doc_id(self, content):
+        return md5(f"{self.chain_id}:{content}".encode()).hexdigest()
+
+    def doc_exists(self, document):
+        if self.table is None:
+            return False
+        try:
+            cleaned_content = document.content.replace("\x00", "\ufffd")
+            doc_id = self._doc_id(cleaned_content)
+            return len(self.table.search().where(f"{self._id}='{doc_id}'").limit(1).to_arrow()) > 0
+        except Exception:
+            return False
+
+    def insert(self, documents, filters=None):
+        data = []
+        for document in documents:
+            document.embed(embedder=self.embedder)
+            cleaned_content = document.content.replace("\x00", "\ufffd")
+            payload = {
+                "name": document.name,
+                "meta_data": document.meta_data,
+                "content": cleaned_content,
+                "usage": document.usage,
+            }
+            data.append(
+                {
+                    "id": self._doc_id(cleaned_content),
+                    "vector": document.embedding,
+                    "payload": json.dumps(payload),
+                    "chain_id": self.chain_id,
+                }
             )
+        if data and self.table is not None:
+            self.table.add(data)
+
+    def drop(self):
+        if self.exists():
+            self.connection.open_table(self.table_name).delete(self.row_filter)
+
+    def vector_search(self, query, limit=5):
+        query_embedding = self.embedder.get_embedding(query)
+        if query_embedding is None or self.table is None:
+            return []
+        results = (
+            self.table.search(query=query_embedding, vector_column_name=self._vector_col)
+            .where(self.row_filter, prefilter=True)
+            .limit(limit)
         )
-        
-        # Create knowledge base for questions
-        self.questions_kb = PDFKnowledgeBase(
-            chunking_strategy=AgenticChunking(),
-            path=questions_pdf_path,
-            vector_db=LanceDb(
-                table_name="question_templates",
+        if self.nprobes:
+            results.nprobes(self.nprobes)
+        return self._build_search_results(results.to_pandas())
+
+
+# Retrieval results keyed by (db_uri, table, chain scope, version, query,
+# num_documents). Versions are read once per scope and remembered until the
+# scope is reloaded, so reloading one chain of the shared employee table keeps
+# the other chains' results.
+_table_versions = {}
+_retrieval_results = OrderedDict()
+_retrieval_lock = threading.Lock()
+
+
+def _scope(vector_db):
+    return (vector_db.uri, vector_db.table_name, getattr(vector_db, "chain_id", None))
+
+
+def retrieval_cache_key(vector_db, query, num_documents):
+    return _scope(vector_db) + (table_version(vector_db), query, num_documents)
+
+
+def table_version(vector_db):
+    """Current version of a LanceDb table (None if missing), memoized until invalidated."""
+    key = _scope(vector_db)
+    with _retrieval_lock:
+        if key in _table_versions:
+            return _table_versions[key]
+    version = None
+    if vector_db.exists():
+        version = vector_db.connection.open_table(vector_db.table_name).version
+    with _retrieval_lock:
+        return _table_versions.setdefault(key, version)
+
+
+def invalidate_table(vector_db):
+    """Forget the version and cached retrieval results of a table (or chain scope) that was (re)loaded."""
+    key = _scope(vector_db)
+    with _retrieval_lock:
+        _table_versions.pop(key, None)
+        # A reloaded table may have been recreated without its indices
+        _indexed_tables.difference_update([k for k in _indexed_tables if k[:2] == key[:2]])
+        for cache_key in [k for k in _retrieval_results if k[:3] == key]:
+            del _retrieval_results[cache_key]
+
+
+def invalidate_database(db_uri):
+    """Forget the versions and cached retrieval results of every table of a deleted database."""
+    with _retrieval_lock:
+        for key in [k for k in _table_versions if k[0] == db_uri]:
+            del _table_versions[key]
+        _indexed_tables.difference_update([k for k in _indexed_tables if k[0] == db_uri])
+        for cache_key in [k for k in _retrieval_results if k[0] == db_uri]:
+            del _retrieval_results[cache_key]
+
+
+def cached_search(knowledge_base, query, num_documents):
+    """
+    Search a knowledge base, reusing the result of an identical earlier search.
+
+    Args:
+        knowledge_base: The AgentKnowledge to search
+        query: The query to search for
+        num_documents: Maximum number of documents to retrieve
+
+    Returns:
+        Retrieved content as a string
+    """
+    key = retrieval_cache_key(knowledge_base.vector_db, query, num_documents)
+    with _retrieval_lock:
+        if key in _retrieval_results:
+            _retrieval_results.move_to_end(key)
+            metrics.increment("kb.retrieval_cache.hits")
+            return _retrieval_results[key]
+    metrics.increment("kb.retrieval_cache.misses")
+
+    docs = knowledge_base.search(query=query, num_documents=num_documents)
+    content = "\n\n".join([doc.content for doc in docs]) if docs else ""
+    with _retrieval_lock:
+        # Only keep the result if the table was not reloaded meanwhile
+        if _table_versions.get(key[:3], key[3]) == key[3]:
+            _retrieval_results[key] = content
+            while len(_retrieval_results) > config.RETRIEVAL_CACHE_SIZE:
+                _retrieval_results.popitem(last=False)
+    return content
+
+
+def build_employee_kb(employee_data_path, db_uri, embedder, chunking=config.EMPLOYEE_KB_CHUNKING, chain_id=None):
+    """
+    Create the knowledge base holding a chain's employee report.
+
+    With a chain_id, the report goes into the employee table shared by all
+    chains (see config.EMPLOYEE_KB_LAYOUT); otherwise db_uri belongs to the chain.
+    """
+    if chain_id is None:
+        vector_db = LanceDb(
+            table_name="employee_data",
+            uri=db_uri,
+            search_type=SearchType.vector,
+            embedder=embedder
+        )
+    else:
+        # Creating the shared table must not race another chain's first load
+        with get_db_lock(db_uri):
+            vector_db = ChainScopedLanceDb(
+                chain_id,
+                table_name="employee_data",
                 uri=db_uri,
+                connection=get_connection(db_uri),
                 search_type=SearchType.vector,
-                embedder=self.embedder
+                embedder=embedder
+            )
+    return TextKnowledgeBase(
+        path=employee_data_path,
+        chunking_strategy=get_chunking_strategy(chunking),
+        vector_db=vector_db
+    )
+
+
+# Index types accepted in config.QUESTIONS_INDEX_TYPE, mapped to LanceDB names
+VECTOR_INDEX_TYPES = {"ivf_pq": "IVF_PQ", "hnsw": "IVF_HNSW_SQ"}
+
+
+# Tables whose indices were found complete: {(db_uri, table, search type, index type)}.
+# Session starts skip the database lock and list_indices for them.
+_indexed_tables = set()
+
+
+def _index_key(vector_db, index_type):
+    return (vector_db.uri, vector_db.table_name, vector_db.search_type, index_type)
+
+
+def search_indexes_ready(vector_db, index_type):
+    """
+    True if ensure_search_indexes already found every index of the table in place.
+
+    Also marks the full-text index as present on this LanceDb instance, as
+    ensure_search_indexes would, so agno does not rebuild it on first search.
+    """
+    with _retrieval_lock:
+        ready = _index_key(vector_db, index_type) in _indexed_tables
+    if ready and vector_db.search_type in (SearchType.hybrid, SearchType.keyword):
+        vector_db.fts_index_exists = True
+    return ready
+
+
+def _normalized_index_type(index_type):
+    """Compare index types across spellings: create_index takes "IVF_PQ", list_indices reports "IvfPq"."""
+    return str(index_type).replace("_", "").lower()
+
+
+def existing_indexes(table):
+    """Return {(column, normalized index type)} of the indices on a LanceDB table."""
+    return {
+        (column, _normalized_index_type(getattr(index, "index_type", "")))
+        for index in table.list_indices()
+        for column in getattr(index, "columns", [])
+    }
+
+
+def build_questions_vector_db(db_uri, embedder, search_type=config.QUESTIONS_SEARCH_TYPE):
+    """Create the LanceDb table holding the (shared) question templates."""
+    return LanceDb(
+        table_name="question_templates",
+        uri=db_uri,
+        search_type=SearchType(search_type),
+        embedder=embedder,
+        nprobes=config.QUESTIONS_INDEX_NPROBES,
+        # Native LanceDB full-text index, listed with the table's other indices
+        use_tantivy=False,
+    )
+
+
+def ensure_search_indexes(vector_db, index_type=config.QUESTIONS_INDEX_TYPE, min_rows=config.QUESTIONS_INDEX_MIN_ROWS):
+    """
+    Build the indices a LanceDb table needs for its search type, if missing.
+
+    Must be called with the table's database lock held. agno would otherwise
+    rebuild the full-text index on the first hybrid search of every LanceDb
+    instance, i.e. once per session.
+
+    Args:
+        vector_db: The LanceDb to index
+        index_type: "none", "ivf_pq" or "hnsw"
+        min_rows: Minimum number of rows before a vector index is built
+
+    Returns:
+        True if an index was built (False when every index already exists,
+        so repeated calls do not bump the table version)
+    """
+    if not vector_db.exists():
+        return False
+    table = vector_db.connection.open_table(vector_db.table_name)
+    existing = existing_indexes(table)
+    built = False
+    complete = True
+
+    if vector_db.search_type in (SearchType.hybrid, SearchType.keyword):
+        if ("payload", _normalized_index_type("FTS")) not in existing:
+            table.create_fts_index("payload", use_tantivy=False, replace=True)
+            built = True
+        vector_db.fts_index_exists = True
+
+    if index_type != "none":
+        lance_index_type = VECTOR_INDEX_TYPES[index_type]
+        row_count = table.count_rows()
+        indexed = (vector_db._vector_col, _normalized_index_type(lance_index_type)) in existing
+        if not indexed and row_count < min_rows:
+            # Checked again once the table has grown
+            complete = False
+        elif not indexed:
+            started = time.perf_counter()
+            # agno queries with the default L2 metric; the sentence-transformer
+            # embeddings are normalized, so L2 ranks like cosine
+            table.create_index(
+                metric="L2",
+                vector_column_name=vector_db._vector_col,
+                index_type=lance_index_type,
+                num_partitions=max(1, int(row_count ** 0.5)),
+                num_sub_vectors=max(1, vector_db.dimensions // 16),
+                replace=True,
             )
+            metrics.observe("kb.index_build_seconds", time.perf_counter() - started)
+            print(f"Built {lance_index_type} index on {vector_db.table_name} ({row_count} rows)")
+            built = True
+
+    if built:
+        invalidate_table(vector_db)
+    if complete:
+        with _retrieval_lock:
+            _indexed_tables.add(_index_key(vector_db, index_type))
+    return built
+
+
+def warm_employee_knowledge_base(chain_id, report_path):
+    """
+    Chunk and embed a freshly written employee report into its chain's table.
+
+    Called in the background by /report/analyze, so that /chatbot/start_session
+    finds a ready index and only does retrieval.
+
+    Args:
+        chain_id: Chain the report belongs to
+        report_path: Path of the report file that was just written
+    """
+    db_uri = config.employee_db_uri(chain_id)
+    scope = config.employee_chain_scope(chain_id)
+    started = time.perf_counter()
+    with get_db_lock(employee_lock_key(db_uri, scope)):
+        employee_kb = build_employee_kb(
+            str(report_path), db_uri, CachedSentenceTransformerEmbedder(), chain_id=scope
         )
-        
-        # Flag to track if knowledge bases are loaded
-        self.employee_kb_loaded = os.path.exists(os.path.join(db_uri, "employee_data"))
-        self.questions_kb_loaded = os.path.exists(os.path.join(db_uri, "question_templates"))
-    
+        # The report was (re)generated, so any previous index is stale
+        employee_kb.load(recreate=True)
+        invalidate_table(employee_kb.vector_db)
+        touch_database(db_uri, scope)
+    metrics.observe("kb.warm_seconds", time.perf_counter() - started)
+    print(f"Employee knowledge base warmed for chain {chain_id}")
+
+
+class KnowledgeBaseManager:
+    def __init__(
+        self,
+        employee_data_path,
+        questions_pdf_path,
+        db_uri="tmp/counselling_db",
+        employee_chunking=config.EMPLOYEE_KB_CHUNKING,
+        questions_chunking=config.QUESTIONS_KB_CHUNKING,
+        questions_db_uri=config.QUESTIONS_DB_URI,
+        chain_id=None,
+    ):
+        """
+        Initialize the knowledge bases for employee data and counseling questions.
+
+        Args:
+            employee_data_path: Path to the employee.txt file containing employee data
+            questions_pdf_path: Path to the Questions.pdf containing question templates
+            db_uri: Path to store the employee data vector database
+            employee_chunking: Chunking strategy name for the employee data (see report_chunking)
+            questions_chunking: Chunking strategy name for the question templates
+            questions_db_uri: Path to store the question templates vector database,
+                shared by all chains
+            chain_id: Chain whose rows to use when db_uri holds the employee
+                table shared by all chains (None: db_uri belongs to one chain)
+        """
+        self.db_uri = db_uri
+        self.questions_db_uri = questions_db_uri
+        self.chain_id = chain_id
+        self.employee_lock_key = employee_lock_key(db_uri, chain_id)
+
+        # Local sentence-transformer embeddings (no API key), model loaded once per process
+        self.embedder = CachedSentenceTransformerEmbedder()
+
+        # Opening the tables creates them when missing, so hold the database locks
+        with get_db_lock(self.employee_lock_key):
+            # Create knowledge base for employee data
+            self.employee_kb = build_employee_kb(
+                employee_data_path, db_uri, self.embedder, employee_chunking, chain_id
+            )
+            # Flag to track if knowledge bases are loaded (e.g. warmed at report generation)
+            self.employee_kb_loaded = table_row_count(self.employee_kb.vector_db) > 0
+            touch_database(db_uri, chain_id)
+
+        with get_db_lock(questions_db_uri):
+            # Create knowledge base for questions
+            self.questions_kb = PDFKnowledgeBase(
+                chunking_strategy=get_chunking_strategy(questions_chunking),
+                path=questions_pdf_path,
+                vector_db=build_questions_vector_db(questions_db_uri, self.embedder)
+            )
+            self.questions_kb_loaded = table_row_count(self.questions_kb.vector_db) > 0
+
     def load_knowledge_bases(self, force_reload=False):
         """
         Load both knowledge bases if they haven't been loaded yet or if force_reload is True
-        
+
         Args:
             force_reload: If True, reload the knowledge bases even if they exist
         """
-        if not self.employee_kb_loaded or force_reload:
-            print("Loading employee data knowledge base...")
-            self.employee_kb.load()
-            self.employee_kb_loaded = True
-        else:
-            print("Employee data knowledge base already loaded.")
-        
-        if not self.questions_kb_loaded or force_reload:
-            print("Loading question templates knowledge base...")
-            self.questions_kb.load()
-            self.questions_kb_loaded = True
-        else:
-            print("Question templates knowledge base already loaded.")
-        
+        # Waits for a background warm-up of the same chain to finish
+        with get_db_lock(self.employee_lock_key):
+            if force_reload or table_row_count(self.employee_kb.vector_db) == 0:
+                print("Loading employee data knowledge base...")
+                self.employee_kb.load(recreate=force_reload)
+                invalidate_table(self.employee_kb.vector_db)
+                self.employee_kb_loaded = True
+                metrics.increment("kb.employee.cold_loads")
+            else:
+                print("Employee data knowledge base already loaded.")
+                self.employee_kb_loaded = True
+                metrics.increment("kb.employee.warm_hits")
+
+        if self.chain_id is not None and not search_indexes_ready(
+            self.employee_kb.vector_db, config.EMPLOYEE_INDEX_TYPE
+        ):
+            # One index over all chains of the shared employee table; once it
+            # exists, session starts no longer take the shared database lock
+            with get_db_lock(self.db_uri):
+                ensure_search_indexes(
+                    self.employee_kb.vector_db,
+                    index_type=config.EMPLOYEE_INDEX_TYPE,
+                    min_rows=config.EMPLOYEE_INDEX_MIN_ROWS,
+                )
+
+        # The question table is shared, so another session may have loaded it
+        with get_db_lock(self.questions_db_uri):
+            if force_reload or table_row_count(self.questions_kb.vector_db) == 0:
+                print("Loading question templates knowledge base...")
+                self.questions_kb.load(recreate=force_reload)
+                invalidate_table(self.questions_kb.vector_db)
+                self.questions_kb_loaded = True
+            else:
+                print("Question templates knowledge base already loaded.")
+                self.questions_kb_loaded = True
+            ensure_search_indexes(self.questions_kb.vector_db)
+
         print("Knowledge bases ready for use.")
-    
+
     def retrieve_from_employee_data(self, query, num_documents=2):
         """
         Retrieve relevant chunks from employee data
-        
+
         Args:
             query: The query to search for
             num_documents: Maximum number of documents to retrieve
-            
+
         Returns:
             Retrieved content as a string
         """
-        docs = self.employee_kb.search(query=query, num_documents=num_documents)
-        return "\n\n".join([doc.content for doc in docs]) if docs else ""
-    
+        return cached_search(self.employee_kb, query, num_documents)
+
     def retrieve_from_questions(self, query, num_documents=2):
         """
         Retrieve relevant chunks from questions
-        
+
         Args:
             query: The query to search for
             num_documents: Maximum number of documents to retrieve
-            
+
         Returns:
             Retrieved content as a string
         """
-        docs = self.questions_kb.search(query=query, num_documents=num_documents)
-        return "\n\n".join([doc.content for doc in docs]) if docs else ""
\ No newline at end of file
+        return cached_search(self.questions_kb, query, num_documents)
+
+    def retrieve_many(self, requests):
+        """
+        Run several retrievals with a single embedding pass.
+
+        All query strings are embedded in one batched encode call and the
+        vector searches then run concurrently, each hitting the cached
+        query embedding.
+
+        Args:
+            requests: List of (source, query, num_documents) tuples, where
+                source is "employee" or "questions"
+
+        Returns:
+            List of retrieved contents (strings), in the order of requests
+        """
+        kbs = {"employee": self.employee_kb, "questions": self.questions_kb}
+        # Results cached from an earlier session need no query embedding
+        uncached = []
+        for source, query, num_documents in requests:
+            if retrieval_cache_key(kbs[source].vector_db, query, num_documents) not in _retrieval_results:
+                uncached.append(query)
+        if uncached:
+            self.embedder.get_embeddings(uncached)
+
+        retrievers = {
+            "employee": self.retrieve_from_employee_data,
+            "questions": self.retrieve_from_questions,
+        }
+        with ThreadPoolExecutor(max_workers=len(requests) or 1) as executor:
+            futures = [
+                executor.submit(retrievers[source], query, num_documents)
+                for source, query, num_documents in requests
+            ]
+            return [future.result() for future in futures]
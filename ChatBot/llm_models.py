@@ -0,0 +1,128 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Iterator, List, Optional
+
+from agno.models.message import Message
+from agno.models.openai import OpenAIChat
+
+from Common.client_registry import get_openai_client
+from Common.metrics import metrics
+from Common.rate_limiter import Priority, estimate_tokens, llm_governor
+from . import config
+
+
+def _total_tokens(usage) -> Optional[int]:
+    """Read total token usage from an OpenAI usage object, if present."""
+    return getattr(usage, "total_tokens", None) if usage is not None else None
+
+
+def _record_prompt_usage(usage) -> None:
+    """Record prompt tokens and how many of them the provider served from its prompt cache."""
+    prompt_tokens = getattr(usage, "prompt_tokens", None) if usage is not None else None
+    if not prompt_tokens:
+        return
+    details = getattr(usage, "prompt_tokens_details", None)
+    cached_tokens = getattr(details, "cached_tokens", None) or 0
+    metrics.increment("llm.prompt_tokens", prompt_tokens)
+    metrics.increment("llm.cached_prompt_tokens", cached_tokens)
+    metrics.observe("llm.prompt_cache_hit_ratio", cached_tokens / prompt_tokens)
+
+
+class LLMCallCounter:
+    """Model round-trips and tool calls requested by the model within a `count_llm_calls` block."""
+
+    def __init__(self):
+        self.model_calls = 0
+        self.tool_calls = 0
+
+
+_call_counter: ContextVar[Optional[LLMCallCounter]] = ContextVar("llm_call_counter", default=None)
+
+
+@contextmanager
+def count_llm_calls() -> Iterator[LLMCallCounter]:
+    """Count the governed model round-trips (and tool calls) made in this context."""
+    counter = LLMCallCounter()
+    token = _call_counter.set(counter)
+    try:
+        yield counter
+    finally:
+        _call_counter.reset(token)
+
+
+def _record_call(tool_calls: int) -> None:
+    metrics.increment("llm.tool_calls", tool_calls)
+    counter = _call_counter.get()
+    if counter is not None:
+        counter.model_calls += 1
+        counter.tool_calls += tool_calls
+
+
+@dataclass
+class GovernedOpenAIChat(OpenAIChat):
+    """
+    OpenAIChat whose requests are admitted by the process-wide LLM governor.
+
+    Every model round-trip (including tool-call iterations) takes one slot,
+    so the ChatBot agents share the same request and token budget as the
+    Pipeline1 chains.
+    """
+
+    # Priority class for this model; None uses the caller's `llm_priority`
+    priority: Optional[Priority] = None
+
+    def invoke(self, messages: List[Message]):
+        prompt_text = [str(m.content or "") for m in messages]
+        with llm_governor.slot(self.priority, estimate_tokens(*prompt_text)) as permit:
+            response = super().invoke(messages)
+            permit.record_usage(_total_tokens(getattr(response, "usage", None)))
+        _record_prompt_usage(getattr(response, "usage", None))
+        choices = getattr(response, "choices", None) or []
+        tool_calls = getattr(choices[0].message, "tool_calls", None) if choices else None
+        _record_call(len(tool_calls or []))
+        return response
+
+    def invoke_stream(self, messages: List[Message]) -> Iterator:
+        prompt_text = [str(m.content or "") for m in messages]
+        tool_calls = 0
+        with llm_governor.slot(self.priority, estimate_tokens(*prompt_text)) as permit:
+            for chunk in super().invoke_stream(messages):
+                # Usage is reported on the final chunk when include_usage is set
+                usage = getattr(chunk, "usage", None)
+                if usage is not None:
+                    permit.record_usage(_total_tokens(usage))
+                    _record_prompt_usage(usage)
+                # A tool call's id is only sent on its first delta
+                for choice in getattr(chunk, "choices", None) or []:
+                    for tool_call in getattr(choice.delta, "tool_calls", None) or []:
+                        tool_calls += bool(tool_call.id)
+                yield chunk
+        _record_call(tool_calls)
+
+
+def get_chat_model(model_id=None, temperature=None, api_key=None, **kwargs):
+    """
+    Create a governed OpenAI model backed by the shared, pooled OpenAI client.
+
+    agno agents write their tools and response format onto the model object,
+    so each caller gets its own lightweight model wrapper, while the HTTP
+    connections underneath are shared through the client registry.
+
+    Args:
+        model_id: ID of the OpenAI model (default: config.MODEL_ID)
+        temperature: Sampling temperature (default: provider default)
+        api_key: OpenAI API key (default: config.OPEN_AI_API_KEY)
+        **kwargs: Extra GovernedOpenAIChat fields (e.g. priority)
+
+    Returns:
+        A GovernedOpenAIChat instance
+    """
+    api_key = api_key or config.OPEN_AI_API_KEY
+    return GovernedOpenAIChat(
+        id=model_id or config.MODEL_ID,
+        temperature=temperature,
+        api_key=api_key,
+        client=get_openai_client(api_key),
+        **kwargs,
+    )
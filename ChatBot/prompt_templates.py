@@ -152,17 +152,20 @@ Also identify any new issues that emerged during the conversation.
 Focus on creating a structured report that covers all required sections and provides specific, personalized recommendations for each confirmed issue.
 """
 
-DECISION_MAKER_QUERY = """
-Based on the following counseling conversation, employee data, and previous context (if available), determine the appropriate next steps:
-
-CONVERSATION HISTORY:
-{conversation_history}
-
+# Per-turn prompts start with the session data, which stays the same for the
+# whole session, and end with the growing conversation history and the other
+# per-turn values, so the provider's automatic prompt caching can reuse the
+# prefix on every turn (see llm.cached_prompt_tokens in /metrics).
+SESSION_DATA_PREFIX = """
 EMPLOYEE DATA:
 {employee_data}
 
 CONTEXT FROM PREVIOUS SESSIONS (if any):
 {context}
+"""
+
+DECISION_MAKER_QUERY = SESSION_DATA_PREFIX + """
+Based on the employee data and previous context above and the counseling conversation below, determine the appropriate next steps.
 
 Make decisions on:
 
@@ -187,12 +190,15 @@ Make decisions on:
 Provide your analysis and reasoning, then conclude with a formal decision in this format:
 DECISION: change_topic=True/False, escalate_to_hr=True/False, end_chat=True/False
 
+CONVERSATION HISTORY:
+{conversation_history}
+
 # Your decision:
 DECISION: """
 
 # Topic-specific follow-up prompts
-CONTINUE_TOPIC_PROMPT = """
-You've identified that the current topic requires further exploration. Review the conversation history and employee data to create a follow-up question that:
+CONTINUE_TOPIC_PROMPT = SESSION_DATA_PREFIX + """
+You've identified that the current topic requires further exploration. Review the employee data above and the conversation history below to create a follow-up question that:
 1. Acknowledges what the employee just shared
 2. Deepens understanding of the current issue
 3. Shows empathy and creates a safe space for sharing
@@ -201,12 +207,6 @@ You've identified that the current topic requires further exploration. Review th
 CONVERSATION HISTORY:
 {conversation_history}
 
-EMPLOYEE DATA:
-{employee_data}
-
-CONTEXT FROM PREVIOUS SESSIONS (if any):
-{context}
-
 Current topic being discussed: {current_topic}
 
 **IMPORTANT**: Please don't repeat the empathetic response. Your response continues the message after the empathetic response.
@@ -214,8 +214,11 @@ Current topic being discussed: {current_topic}
 # Your next response as the empathetic, supportive HR professional:
 """
 
-CHANGE_TOPIC_PROMPT = """
-You've identified that it's time to explore a new topic. Review the conversation history and employee data to create a transition question that:
+CHANGE_TOPIC_PROMPT = SESSION_DATA_PREFIX + """
+QUESTION TEMPLATES:
+{question_templates}
+
+You've identified that it's time to explore a new topic. Review the employee data above and the conversation history below to create a transition question that:
 1. Acknowledges what the employee shared about the previous topic
 2. Gently transitions to a new unexplored issue from their data
 3. Frames the new question in an open-ended, non-judgmental way
@@ -224,15 +227,6 @@ You've identified that it's time to explore a new topic. Review the conversation
 CONVERSATION HISTORY:
 {conversation_history}
 
-EMPLOYEE DATA:
-{employee_data}
-
-CONTEXT FROM PREVIOUS SESSIONS (if any):
-{context}
-
-QUESTION TEMPLATES:
-{question_templates}
-
 Previous topic: {previous_topic}
 New topic to explore: {next_topic}
 
@@ -306,3 +300,32 @@ When ALL issues have either:
 
 THEN the session should be concluded with a thoughtful summary.
 """
+
+# Single-call turn planner (config.TURN_PLANNING_MODE = "single_call"): decisions,
+# empathetic preface and next question in one structured response
+TURN_PLANNER_DESCRIPTION = """
+You are an empathetic HR Professional running a counseling conversation. For every employee reply you decide the next step of the conversation and write your next message to the employee.
+"""
+
+TURN_PLANNER_INSTRUCTIONS = [
+    "Fill in the reasoning first, then the decisions, then the message.",
+    "change_topic: True if the current topic has been explored to some extent, the answers are becoming repetitive, resolved or slightly positive, or the employee is reluctant to discuss it.",
+    "end_chat: True if all key issues from the employee data have been explored a little, the conversation reached a natural conclusion, or the employee does not want to chat anymore.",
+    "escalate_to_hr: True ONLY for serious threats to self, others or the company (e.g. suicidal, homicidal, mass sabotage). Never escalate minor issues or general dissatisfaction.",
+    "empathetic_preface: one short sentence (at most 13 words) acknowledging the employee's emotions, ONLY if they express strong or vulnerable emotions; otherwise an empty string. Avoid clichés and don't start the same way as earlier messages.",
+    "next_question: if change_topic is True, a transition question that acknowledges the previous topic and gently introduces a new unexplored issue from the employee data; otherwise a follow-up question that deepens understanding of the current topic. Never repeat a previous question.",
+    "DO NOT HALLUCINATE ISSUES: Only ask about issues explicitly mentioned in the employee data.",
+    "The next_question must not repeat the empathetic_preface and must be under 200 characters, without markdown.",
+]
+
+TURN_PLANNER_QUERY = SESSION_DATA_PREFIX + """
+QUESTION TEMPLATES:
+{question_templates}
+
+CONVERSATION HISTORY:
+{conversation_history}
+
+{topic_status}
+
+Plan the next turn of the conversation.
+"""
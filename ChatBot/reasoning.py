@@ -0,0 +1,45 @@
+from agno.tools.thinking import ThinkingTools
+from . import config
+from .llm_models import get_chat_model
+
+# Added to the prompt of agents in "single_shot" mode
+SINGLE_SHOT_REASONING = (
+    "Before answering, silently reason step by step about the conversation and the "
+    "employee data, then give only your final answer in this same response."
+)
+
+
+def reasoning_agent_kwargs(role, model, model_id=None):
+    """
+    Build the agno Agent arguments for an agent role's reasoning mode.
+
+    Modes (config.REASONING_MODES):
+        off: one model round-trip, no reasoning tools
+        single_shot: one model round-trip, with reasoning requested in the prompt
+        tool: ThinkingTools, with at most config.REASONING_TOOL_CALL_LIMIT tool
+            calls per run (each one an extra round-trip)
+
+    Args:
+        role: Agent role, a key of config.REASONING_MODES
+        model: Model shared by the caller's agents (used unless mode is "tool")
+        model_id: ID of the model, for the dedicated model of a "tool" agent
+
+    Returns:
+        Dict of keyword arguments for Agent
+    """
+    mode = config.REASONING_MODES.get(role, config.DEFAULT_REASONING_MODE)
+    if mode == "off":
+        return {"model": model}
+    if mode == "single_shot":
+        return {"model": model, "additional_context": SINGLE_SHOT_REASONING}
+    if mode == "tool":
+        # agno writes tools, tool_choice and the call limit onto the model, so a
+        # tool-using agent gets its own; tool_choice="auto" re-enables tools on
+        # every run after agno switched them off at the limit
+        return {
+            "model": get_chat_model(model_id),
+            "tools": [ThinkingTools()],
+            "tool_call_limit": config.REASONING_TOOL_CALL_LIMIT,
+            "tool_choice": "auto",
+        }
+    raise ValueError(f"Unknown reasoning mode for {role}: {mode}")
@@ -0,0 +1,98 @@
+import re
+from typing import List, Optional, Tuple
+
+from agno.document.base import Document
+from agno.document.chunking.strategy import ChunkingStrategy
+
+from .report_parser import parse_report
+
+# Blank-line separated paragraphs
+PARAGRAPH_SPLIT_PATTERN = re.compile(r"\n\s*\n")
+
+
+class ReportStructureChunking(ChunkingStrategy):
+    """
+    Deterministic chunking for Pipeline1 employee reports.
+
+    Each `**Issue N:**` section (title, probable cause and its `*Q1:*`
+    questions) becomes one chunk, and the text before the first issue
+    becomes a preamble chunk. Sections longer than chunk_size, and
+    documents without issue headings (e.g. the question templates PDF),
+    are packed paragraph by paragraph instead. No LLM calls are made.
+    """
+
+    def __init__(self, chunk_size: int = 3000):
+        self.chunk_size = chunk_size
+
+    def _split_sections(self, text: str) -> List[Tuple[Optional[int], str]]:
+        """Split the text into (issue number, section text) pairs."""
+        report = parse_report(text)
+        sections = [(None, report.preamble)] if report.preamble else []
+        sections.extend((issue.number, issue.section) for issue in report.issues)
+        return sections
+
+    def _pack_paragraphs(self, text: str) -> List[str]:
+        """Pack paragraphs into pieces of at most chunk_size characters."""
+        if len(text) <= self.chunk_size:
+            return [text]
+        pieces, current = [], ""
+        for paragraph in PARAGRAPH_SPLIT_PATTERN.split(text):
+            paragraph = paragraph.strip()
+            if not paragraph:
+                continue
+            if current and len(current) + len(paragraph) + 2 > self.chunk_size:
+                pieces.append(current)
+                current = paragraph
+            else:
+                current = f"{current}\n\n{paragraph}" if current else paragraph
+        if current:
+            pieces.append(current)
+        return pieces
+
+    def chunk(self, document: Document) -> List[Document]:
+        chunks: List[Document] = []
+        for issue_number, section in self._split_sections(document.content):
+            for piece in self._pack_paragraphs(section):
+                chunk_number = len(chunks) + 1
+                meta_data = document.meta_data.copy()
+                meta_data["chunk"] = chunk_number
+                meta_data["chunk_size"] = len(piece)
+                if issue_number is not None:
+                    meta_data["issue"] = issue_number
+                chunk_id = None
+                if document.id:
+                    chunk_id = f"{document.id}_{chunk_number}"
+                elif document.name:
+                    chunk_id = f"{document.name}_{chunk_number}"
+                chunks.append(
+                    Document(id=chunk_id, name=document.name, meta_data=meta_data, content=piece)
+                )
+        return chunks
+
+
+def get_chunking_strategy(name: str) -> ChunkingStrategy:
+    """
+    Build a chunking strategy by name.
+
+    Args:
+        name: One of "structured" (ReportStructureChunking), "agentic"
+            (LLM-driven AgenticChunking), "document" or "fixed"
+
+    Returns:
+        A ChunkingStrategy instance
+    """
+    if name == "structured":
+        return ReportStructureChunking()
+    if name == "agentic":
+        from agno.document.chunking.agentic import AgenticChunking
+
+        return AgenticChunking()
+    if name == "document":
+        from agno.document.chunking.document import DocumentChunking
+
+        return DocumentChunking()
+    if name == "fixed":
+        from agno.document.chunking.fixed import FixedSizeChunking
+
+        return FixedSizeChunking()
+    raise ValueError(f"Unknown chunking strategy: {name}")
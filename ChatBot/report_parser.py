@@ -0,0 +1,120 @@
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import List, Tuple
+
+# Issue heading at the start of a line: "**Issue 1: Title**", "### *Issue 1: Title*"
+# or a bare "Issue 1: Title"; group 1 is the number, group 2 the rest of the line
+ISSUE_HEADING_PATTERN = re.compile(r"^[ \t]*(?:#+[ \t]*)?\**[ \t]*Issue[ \t]+(\d+)[ \t]*:(.*)$", re.MULTILINE)
+# "*This is probably due to* ..." paragraph of an issue
+CAUSE_PATTERN = re.compile(r"^[ \t]*\**This is probably due to\**[ \t]*", re.MULTILINE | re.IGNORECASE)
+# "*Q1:* question" lines of an issue
+QUESTION_PATTERN = re.compile(r"^[ \t]*\*?Q\d+:\*?\s*(.+)$", re.MULTILINE)
+PARAGRAPH_END_PATTERN = re.compile(r"\n[ \t]*\n")
+
+# Parsed reports kept per content hash
+REPORT_CACHE_SIZE = 256
+
+
+@dataclass(frozen=True)
+class ReportIssue:
+    """One "Issue N" section of a Pipeline1 employee report."""
+
+    number: int
+    title: str
+    # Text of the "This is probably due to" paragraph ("" if missing)
+    cause: str
+    questions: Tuple[str, ...]
+    # Full section text, heading included
+    section: str
+
+
+@dataclass(frozen=True)
+class ParsedReport:
+    """A Pipeline1 employee report, parsed once and shared by every session of its chain."""
+
+    text: str
+    # Text before the first issue (title lines and overall analysis)
+    preamble: str
+    issues: Tuple[ReportIssue, ...]
+
+    @property
+    def topics(self) -> List[str]:
+        """Issue titles, in report (urgency) order."""
+        return [issue.title for issue in self.issues]
+
+    @property
+    def questions(self) -> List[str]:
+        """Suggested questions of every issue."""
+        return [question for issue in self.issues for question in issue.questions]
+
+
+def _parse_issue(number: int, heading_rest: str, section: str) -> ReportIssue:
+    """Parse the title, probable cause and questions of one issue section."""
+    title = heading_rest.strip().strip("*").strip()
+    cause = ""
+    match = CAUSE_PATTERN.search(section)
+    if match:
+        # The cause runs to the end of its paragraph or the first question
+        ends = [
+            found.start()
+            for found in (
+                PARAGRAPH_END_PATTERN.search(section, match.end()),
+                QUESTION_PATTERN.search(section, match.end()),
+            )
+            if found
+        ]
+        cause = section[match.end() : min(ends, default=len(section))].strip()
+    questions = tuple(question.strip() for question in QUESTION_PATTERN.findall(section))
+    return ReportIssue(number=number, title=title, cause=cause, questions=questions, section=section)
+
+
+def _parse(text: str) -> ParsedReport:
+    headings = list(ISSUE_HEADING_PATTERN.finditer(text))
+    if not headings:
+        return ParsedReport(text=text, preamble=text.strip(), issues=())
+    issues = []
+    for i, heading in enumerate(headings):
+        end = headings[i + 1].start() if i + 1 < len(headings) else len(text)
+        section = text[heading.start() : end].strip()
+        issues.append(_parse_issue(int(heading.group(1)), heading.group(2), section))
+    return ParsedReport(text=text, preamble=text[: headings[0].start()].strip(), issues=tuple(issues))
+
+
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def parse_report(text: str) -> ParsedReport:
+    """
+    Parse a Pipeline1 employee report into its issues, causes and suggested questions.
+
+    Results are cached by content hash, so sessions of the same chain (and
+    the knowledge base chunker) share one parse.
+
+    Args:
+        text: Report text
+
+    Returns:
+        A ParsedReport (no issues if the text has no "Issue N:" headings)
+    """
+    key = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    with _cache_lock:
+        report = _cache.get(key)
+        if report is not None:
+            _cache.move_to_end(key)
+            return report
+    report = _parse(text)
+    with _cache_lock:
+        _cache[key] = report
+        while len(_cache) > REPORT_CACHE_SIZE:
+            _cache.popitem(last=False)
+    return report
+
+
+def parse_report_file(path) -> ParsedReport:
+    """Read and parse a report file (see parse_report)."""
+    with open(path, "r") as file:
+        return parse_report(file.read())
@@ -0,0 +1,194 @@
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from . import config
+from Common.metrics import metrics
+
+HIGH = "high"
+UNCERTAIN = "uncertain"
+BENIGN = "benign"
+
+# Unambiguous threats to self or others: escalate without asking the LLM
+CRISIS_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"\bsuicid(e|al)\b",
+        r"\b(kill(ing)?|hurt(ing)?|harm(ing)?|cut(ting)?)\s+my\s*self\b",
+        r"\bself[-\s]?harm",
+        r"\bend(ing)?\s+(it\s+all|my(\s+own)?\s+life)\b",
+        r"\b(want|wanted|wish)\s+(to\s+die|i\s+was\s+dead|i\s+were\s+dead)\b",
+        r"\bdon'?t\s+want\s+to\s+(live|be\s+alive|exist|wake\s+up)\b",
+        r"\bbetter\s+off\s+without\s+me\b",
+        r"\b(no|don'?t\s+see\s+the|what'?s\s+the)\s+(reason|point)\s+(to|in|of)\s+(live|living|going\s+on|keep(ing)?\s+going|carry(ing)?\s+on)\b",
+        r"\bcan'?t\s+go\s+on\s+living\b",
+        r"\b(nobody|no\s+one)\s+would\s+(notice|care|miss\s+me)\s+if\s+i\s+"
+        r"(died|was\s+dead|were\s+dead|killed\s+myself|was\s+gone\s+for\s+good)\b",
+        r"\b(kill|shoot|stab)\s+(him|her|them|someone|everyone|people|my\s+(boss|manager|colleagues?|co-?workers?|team))\b",
+        # "hurt"/"attack" are everyday workplace words ("the reorg hurt my team"): only with intent
+        r"\b(i'?ll|i\s+will|i'?m\s+going\s+to|i\s+am\s+going\s+to|gonna|want\s+to)\s+(hurt|attack|beat\s+up)\s+"
+        r"(him|her|them|someone|everyone|people|my\s+(boss|manager|colleagues?|co-?workers?|team))\b",
+        r"\b(bring|brought|have|got)\s+a\s+(gun|knife|weapon)\b",
+        r"\b(plant|build|make|bring|set\s+off|detonate)\s+(a\s+)?(bomb|explosives?)\b",
+        r"\bbomb\s+(threat|the\s+(office|building|company))\b",
+        r"\b(sexually\s+)?(assaulted|assault\s+me)\b",
+        r"\bsexual(ly)?\s+harass",
+    )
+]
+
+# Possible threats that are also everyday workplace talk ("I can't go on like
+# this with the workload", "I want to delete all the data from the legacy
+# system"): never benign, but left to the LLM decision maker
+CONCERN_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"\bcan'?t\s+go\s+on\b",
+        r"\b(nobody|no\s+one)\s+would\s+(notice|care|miss\s+me)\b",
+        r"\b(sabotag\w*|destroy|wipe|delete|leak)\s+(the\s+|all\s+(the\s+)?|our\s+)?"
+        r"(company|servers?|systems?|databases?|data|code\s*base|everything|client\s+data)\b",
+        r"\bsabotag\w*\b",
+    )
+]
+
+# Negative emotions or conflict: not high risk on their own, but never benign
+DISTRESS_PATTERN = re.compile(
+    r"\b(depress(ed|ion|ing)?|hopeless|worthless|helpless|panic|anxious|anxiety|exhausted|"
+    r"burn(ed|t)?\s*out|can'?t\s+sleep|barely\s+sleep|overwhelm(ed|ing)?|cry(ing)?|cried|"
+    r"isolated|lonely|alone|scared|afraid|angry|furious|hate|harass\w*|bull(y|ied|ying)|"
+    r"threat\w*|abus\w*|discriminat\w*|quit|resign\w*|leav(e|ing)\s+the\s+company|"
+    r"frustrat\w*|stress(ed|ful)?|upset|miserable|awful|terrible|unfair|pointless|empty|numb|"
+    r"disappear\w*|give\s+up|giving\s+up|done\s+with\s+everything|tired\s+of\s+(it|everything|life))\b",
+    re.IGNORECASE,
+)
+
+# The employee wants to stop: the decision maker should consider ending the chat
+CLOSING_PATTERN = re.compile(
+    r"\b(stop|bye|goodbye|gotta\s+go|have\s+to\s+go|need\s+to\s+go|meeting|later|enough|"
+    r"done\s+(talking|here)|don'?t\s+want\s+to\s+talk|rather\s+not)\b",
+    re.IGNORECASE,
+)
+
+# Negations can flip an otherwise positive reply ("not good")
+NEGATION_PATTERN = re.compile(r"\b(not|never|no\s+longer|hardly|nothing)\b|n't\b", re.IGNORECASE)
+
+# Positive or resolving replies: the decision maker would move to a new topic
+POSITIVE_PATTERN = re.compile(
+    r"\b(fine|good|great|better|okay|ok|resolved|fixed|sorted|happy|glad|thanks?|"
+    r"thank\s+you|all\s+good|no\s+(issues?|problems?|complaints?))\b",
+    re.IGNORECASE,
+)
+
+# Longer replies carry more than a lexicon can judge
+MAX_BENIGN_LENGTH = 200
+
+# Exemplars for the optional embedding similarity stage
+CRISIS_EXEMPLARS = [
+    "I want to kill myself",
+    "I have been thinking about ending my life",
+    "Everyone would be better off if I was gone",
+    "I don't see the point of living anymore",
+    "I have been hurting myself",
+    "I am going to hurt my manager",
+    "I want to make them all pay, I will bring a weapon to work",
+    "My manager sexually assaulted me",
+]
+
+
+@dataclass
+class ScreenResult:
+    """Outcome of the local pre-screen for one employee message."""
+
+    level: str
+    # Closest crisis exemplar similarity (None without the embedding stage)
+    similarity: Optional[float] = None
+    reasons: List[str] = field(default_factory=list)
+    # For benign turns: the reply reads as positive/resolved, so change topic
+    change_topic: bool = False
+
+
+class RiskScreen:
+    def __init__(self, use_embeddings=None):
+        """
+        Initialize the local escalation pre-screen.
+
+        Args:
+            use_embeddings: Compare messages to crisis exemplars with the knowledge
+                base embedder (default: config.RISK_SCREEN_EMBEDDINGS)
+        """
+        self.use_embeddings = config.RISK_SCREEN_EMBEDDINGS if use_embeddings is None else use_embeddings
+        self._exemplars = None
+        self._lock = threading.Lock()
+
+    def _crisis_similarity(self, text):
+        """Cosine similarity of text to the closest crisis exemplar."""
+        if self._exemplars is None:
+            with self._lock:
+                if self._exemplars is None:
+                    from .knowledge_base import ExemplarMatcher
+
+                    self._exemplars = ExemplarMatcher(CRISIS_EXEMPLARS)
+        return self._exemplars.closest_similarity(text)
+
+    def screen(self, text):
+        """
+        Classify an employee message as high risk, benign or uncertain.
+
+        Args:
+            text: The employee's message
+
+        Returns:
+            A ScreenResult
+        """
+        started = time.perf_counter()
+        reasons = [pattern.pattern for pattern in CRISIS_PATTERNS if pattern.search(text)]
+        similarity = None
+
+        if reasons:
+            level = HIGH
+        else:
+            if self.use_embeddings:
+                similarity = self._crisis_similarity(text)
+            if similarity is not None and similarity >= config.RISK_SCREEN_HIGH_SIMILARITY:
+                level = HIGH
+                reasons.append(f"crisis similarity {similarity:.2f}")
+            else:
+                if any(pattern.search(text) for pattern in CONCERN_PATTERNS):
+                    reasons.append("concern")
+                for name, pattern in (
+                    ("distress", DISTRESS_PATTERN),
+                    ("closing", CLOSING_PATTERN),
+                    ("negation", NEGATION_PATTERN),
+                ):
+                    if pattern.search(text):
+                        reasons.append(name)
+                if len(text) > MAX_BENIGN_LENGTH:
+                    reasons.append("long message")
+                if similarity is not None and similarity >= config.RISK_SCREEN_BENIGN_SIMILARITY:
+                    reasons.append(f"crisis similarity {similarity:.2f}")
+                level = UNCERTAIN if reasons else BENIGN
+
+        result = ScreenResult(
+            level=level,
+            similarity=similarity,
+            reasons=reasons,
+            change_topic=level == BENIGN and bool(POSITIVE_PATTERN.search(text)),
+        )
+        metrics.increment(f"risk_screen.{level}")
+        metrics.observe("risk_screen.seconds", time.perf_counter() - started)
+        return result
+
+
+_risk_screen = None
+_risk_screen_lock = threading.Lock()
+
+
+def get_risk_screen():
+    """Return the shared risk screen (exemplar embeddings are computed once per process)."""
+    global _risk_screen
+    if _risk_screen is None:
+        with _risk_screen_lock:
+            if _risk_screen is None:
+                _risk_screen = RiskScreen()
+    return _risk_screen
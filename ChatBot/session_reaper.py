@@ -0,0 +1,69 @@
+import threading
+import time
+
+from . import config
+
+
+def last_activity(session):
+    """UNIX time of a session's latest message (its start time if it has none)."""
+    timestamp = session["messages"].last_timestamp
+    if timestamp is None:
+        timestamp = session["start_time"].timestamp()
+    return timestamp
+
+
+def find_reapable_sessions(sessions, now=None, idle_timeout=None, ended_ttl=None):
+    """
+    Split the in-memory sessions into those to summarize and those to free.
+
+    Args:
+        sessions: {session_id: session} of the router
+        now: UNIX time to compare against (default: now)
+        idle_timeout: Seconds without a message after which a session that
+            was not ended is summarized (default: config.SESSION_IDLE_TIMEOUT_SECONDS)
+        ended_ttl: Seconds after end_session after which a session is freed
+            (default: config.SESSION_ENDED_TTL_SECONDS)
+
+    Returns:
+        Tuple of (idle session ids, oldest first; ended session ids)
+    """
+    now = time.time() if now is None else now
+    idle_timeout = config.SESSION_IDLE_TIMEOUT_SECONDS if idle_timeout is None else idle_timeout
+    ended_ttl = config.SESSION_ENDED_TTL_SECONDS if ended_ttl is None else ended_ttl
+
+    idle, ended = [], []
+    for session_id, session in list(sessions.items()):
+        if session.get("ended"):
+            if now - session["end_time"].timestamp() >= ended_ttl:
+                ended.append(session_id)
+            continue
+        activity = last_activity(session)
+        if now - activity >= idle_timeout:
+            idle.append((activity, session_id))
+    return [session_id for _, session_id in sorted(idle)], ended
+
+
+def start_reaper_thread(reap, interval=config.SESSION_REAPER_INTERVAL_SECONDS):
+    """
+    Run the idle-session reaper periodically on a daemon thread.
+
+    Args:
+        reap: Callable doing one reaper run
+        interval: Seconds between runs (0 or less disables the thread)
+
+    Returns:
+        threading.Event that stops the thread when set (None if disabled)
+    """
+    if interval <= 0:
+        return None
+    stop = threading.Event()
+
+    def loop():
+        while not stop.wait(interval):
+            try:
+                reap()
+            except Exception as e:
+                print(f"Error in session reaper: {str(e)}")
+
+    threading.Thread(target=loop, name="session-reaper", daemon=True).start()
+    return stop
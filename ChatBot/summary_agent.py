@@ -1,27 +1,22 @@
 import datetime
-from enum import Enum
-from typing import List, Optional
+from typing import List, Optional, Union
 from pydantic import BaseModel, Field
 import os
 from dotenv import load_dotenv
 
 # Import Agno framework - only Gemini
 from agno.agent import Agent
-from agno.models.openai import OpenAIChat
+from .llm_models import get_chat_model
+from Common.response_cache import cached_agent_run
 
 # Import configuration settings
-from .config import MODEL_ID, OPEN_AI_API_KEY
+from .config import MODEL_ID
+from .transcript import SenderType, Transcript
 
 # Load environment variables from .env file
 load_dotenv()
 
 
-class SenderType(str, Enum):
-    BOT = "bot"
-    EMPLOYEE = "employee"
-    HR = "hr"
-
-
 class Message(BaseModel):
     timestamp: datetime.datetime = Field(
         default_factory=lambda: datetime.datetime.now(datetime.timezone.utc),
@@ -52,21 +47,21 @@ class SummarizerAgent:
 
         # Only use Gemini model through Agno
         self.agent = Agent(
-            model=OpenAIChat(id=model, api_key=OPEN_AI_API_KEY),
+            model=get_chat_model(model),
             description=description,
             instructions=instructions,
             markdown=True,
         )
 
     def summarize_conversation(
-        self, current_context: str, messages: List[Message]
+        self, current_context: str, messages: Union[Transcript, List[Message]]
     ) -> str:
         """
         Summarize the conversation and create an updated context using the Agno agent with Gemini
 
         Args:
             current_context: The existing context string
-            messages: List of Message objects in the conversation
+            messages: Transcript of the session (or a list of Message objects)
 
         Returns:
             str: An updated context with the conversation summary
@@ -90,11 +85,9 @@ class SummarizerAgent:
         Please create an updated comprehensive context that includes ALL topics and issues discussed so far.
         """
 
-        # Use the Agno agent to generate the response
-        response = self.agent.run(prompt)
-
-        # Return the response content
-        return response.content.strip()
+        # Use the Agno agent to generate the response (retried end-session
+        # requests with the same messages are served from the response cache)
+        return cached_agent_run(self.agent, prompt, "summarizer").strip()
 
 
 # Test function with dummy data
@@ -0,0 +1,119 @@
+import time
+from array import array
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Iterator, Optional
+
+
+class SenderType(str, Enum):
+    BOT = "bot"
+    EMPLOYEE = "employee"
+    HR = "hr"
+
+
+# Sender types are stored as one byte per message
+_SENDERS = tuple(SenderType)
+_SENDER_CODES = {sender: code for code, sender in enumerate(_SENDERS)}
+
+# Speaker labels of the conversation history in the LLM prompts
+_HISTORY_LABELS = ("Counselor", "Employee", "HR")
+
+
+class TranscriptEntry:
+    """One message of a Transcript (created on access, not stored)."""
+
+    __slots__ = ("sender_type", "text", "timestamp")
+
+    def __init__(self, sender_type: SenderType, text: str, timestamp: datetime):
+        self.sender_type = sender_type
+        self.text = text
+        self.timestamp = timestamp
+
+    def __repr__(self):
+        return f"TranscriptEntry({self.sender_type.value!r}, {self.text!r}, {self.timestamp.isoformat()})"
+
+
+class Transcript:
+    def __init__(self):
+        """
+        Messages of one counseling session.
+
+        The single copy of the conversation: the router records it for the
+        session, the counseling agent builds its prompts from it, and the
+        summarizer and daily report agent read it at the end of the session.
+        Messages are kept column-wise (sender codes and epoch timestamps in
+        typed arrays, texts in lists), so a message costs its text plus
+        about 25 bytes instead of a dict with a datetime. Iterating yields
+        TranscriptEntry objects with the same fields as summary_agent.Message,
+        holding the text as delivered to the employee.
+        """
+        self._senders = array("B")
+        self._timestamps = array("d")
+        self._texts = []
+        # Text used in the prompt history instead, where it differs (e.g. only
+        # the question of a counselor reply, without its empathetic preface)
+        self._prompt_texts = []
+
+    def append(
+        self,
+        sender_type: SenderType,
+        text: str,
+        timestamp: Optional[float] = None,
+        prompt_text: Optional[str] = None,
+    ) -> None:
+        """
+        Add a message.
+
+        Args:
+            sender_type: Who sent the message
+            text: The message text as delivered
+            timestamp: Epoch seconds (default: now)
+            prompt_text: Text for the LLM prompt history, if not the delivered text
+        """
+        self._senders.append(_SENDER_CODES[SenderType(sender_type)])
+        self._timestamps.append(time.time() if timestamp is None else timestamp)
+        self._texts.append(text)
+        self._prompt_texts.append(prompt_text if prompt_text != text else None)
+
+    def __len__(self):
+        return len(self._texts)
+
+    def __getitem__(self, index: int) -> TranscriptEntry:
+        return TranscriptEntry(
+            _SENDERS[self._senders[index]],
+            self._texts[index],
+            datetime.fromtimestamp(self._timestamps[index], timezone.utc),
+        )
+
+    def __iter__(self) -> Iterator[TranscriptEntry]:
+        for index in range(len(self._texts)):
+            yield self[index]
+
+    @property
+    def last_sender(self) -> Optional[SenderType]:
+        """Sender of the latest message (None if there is none)."""
+        return _SENDERS[self._senders[-1]] if self._texts else None
+
+    @property
+    def last_timestamp(self) -> Optional[float]:
+        """Epoch seconds of the latest message (None if there is none)."""
+        return self._timestamps[-1] if self._texts else None
+
+    def recent_texts(self, sender_type: SenderType, count: int = 1) -> list:
+        """Texts of the latest count messages from sender_type, oldest first."""
+        code = _SENDER_CODES[SenderType(sender_type)]
+        texts = []
+        for index in range(len(self._texts) - 1, -1, -1):
+            if self._senders[index] == code:
+                texts.append(self._texts[index])
+                if len(texts) >= count:
+                    break
+        texts.reverse()
+        return texts
+
+    def history_text(self) -> str:
+        """The conversation as "Counselor: ..." / "Employee: ..." lines for the LLM prompts."""
+        return "\n".join(
+            f"{_HISTORY_LABELS[code]}: {text if prompt_text is None else prompt_text}"
+            for code, text, prompt_text in zip(self._senders, self._texts, self._prompt_texts)
+        )
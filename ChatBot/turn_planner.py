@@ -0,0 +1,71 @@
+from agno.agent import Agent
+from pydantic import BaseModel, Field, ValidationError
+from .llm_models import get_chat_model
+from .prompt_templates import TURN_PLANNER_DESCRIPTION, TURN_PLANNER_INSTRUCTIONS, TURN_PLANNER_QUERY
+
+
+class TurnPlan(BaseModel):
+    """Everything CounselingAgent needs for one turn, produced by a single LLM call."""
+
+    reasoning: str = Field(..., description="Short analysis of the employee's last reply")
+    change_topic: bool = Field(..., description="Move on to a new issue")
+    escalate_to_hr: bool = Field(..., description="The conversation needs immediate HR intervention")
+    end_chat: bool = Field(..., description="The conversation should be concluded")
+    empathetic_preface: str = Field(..., description="Short empathetic sentence, or an empty string")
+    next_question: str = Field(..., description="The next question to ask the employee")
+
+
+class TurnPlanner:
+    def __init__(self, model_id=None):
+        """
+        Initialize the turn planner agent.
+
+        Args:
+            model_id: ID of the OpenAI model to use
+        """
+        model = get_chat_model(model_id)
+
+        # The response model makes agno request OpenAI structured outputs
+        self.agent = Agent(
+            model=model,
+            description=TURN_PLANNER_DESCRIPTION,
+            instructions=TURN_PLANNER_INSTRUCTIONS,
+            response_model=TurnPlan,
+        )
+
+    def plan_turn(self, conversation_history, employee_data, context=None, question_templates="", topic_status=""):
+        """
+        Decide the next step and write the next message in one call.
+
+        Args:
+            conversation_history: Transcript of the session
+            employee_data: Employee information
+            context: Previous conversation context (if any)
+            question_templates: Retrieved question templates
+            topic_status: Topic tracking summary of the counseling agent
+
+        Returns:
+            A validated TurnPlan
+
+        Raises:
+            ValueError: If the response is not a valid TurnPlan
+        """
+        history_text = conversation_history.history_text()
+
+        query = TURN_PLANNER_QUERY.format(
+            conversation_history=history_text,
+            employee_data=employee_data,
+            context=context if context else "",
+            question_templates=question_templates,
+            topic_status=topic_status,
+        )
+
+        response = self.agent.run(query)
+        content = response.content if hasattr(response, "content") else response
+        if isinstance(content, TurnPlan):
+            return content
+        # agno returns the raw text when it could not parse the response
+        try:
+            return TurnPlan.model_validate_json(str(content))
+        except ValidationError as e:
+            raise ValueError(f"Invalid turn plan: {e}") from e
@@ -0,0 +1,46 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Set
+
+from . import config
+
+
+@dataclass
+class TopicState:
+    """Topic tracking for the next turn, as decided before the reply is read."""
+
+    current_topic: Optional[str]
+    topic_questions_count: Dict[str, int]
+    explored_topics: Set[str]
+    # Every topic explored: the interview ends on the next reply
+    complete: bool
+    # TOPIC TRACKING block of the next question agent's instructions
+    topic_status: str
+
+
+@dataclass
+class TurnPrefetch:
+    """Work done for the next turn while the employee is typing their reply."""
+
+    # Length of the conversation history the prefetch was computed for
+    history_length: int
+    topic_state: TopicState
+    # Change-topic question drafted without the reply (None in "state" mode)
+    draft: Optional[Future] = field(default=None)
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_prefetch_executor():
+    """Return the shared thread pool running the speculative drafts."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=config.PREFETCH_WORKERS, thread_name_prefix="turn-prefetch"
+                )
+    return _executor
@@ -0,0 +1,88 @@
+"""
+Registry of shared, connection-pooled LLM clients.
+
+Agents used to build a new client each, so every agent and every chat
+session opened its own HTTP connections and TLS sessions. The registry
+hands out one pooled `httpx.Client` per API key and one LangChain chat
+model per (model, temperature) pair, so keep-alive connections are reused
+across agents, sessions and both routers.
+"""
+
+import threading
+from typing import Dict, Optional, Tuple
+
+import httpx
+
+from .config import (
+    LLM_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+    LLM_HTTP_MAX_CONNECTIONS,
+    LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+)
+
+_lock = threading.Lock()
+_http_clients: Dict[Optional[str], httpx.Client] = {}
+_openai_clients: Dict[Optional[str], object] = {}
+_langchain_models: Dict[Tuple, object] = {}
+
+
+def get_http_client(api_key: Optional[str]) -> httpx.Client:
+    """Return the pooled HTTP client used for all requests made with `api_key`."""
+    with _lock:
+        client = _http_clients.get(api_key)
+        if client is None:
+            client = httpx.Client(
+                limits=httpx.Limits(
+                    max_connections=LLM_HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=LLM_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+                ),
+                # Same default as the OpenAI SDK; per-request timeouts still apply
+                timeout=httpx.Timeout(600.0, connect=5.0),
+                follow_redirects=True,
+            )
+            _http_clients[api_key] = client
+        return client
+
+
+def get_openai_client(api_key: Optional[str]):
+    """Return the shared OpenAI SDK client for `api_key`."""
+    from openai import OpenAI
+
+    http_client = get_http_client(api_key)
+    with _lock:
+        client = _openai_clients.get(api_key)
+        if client is None:
+            client = OpenAI(api_key=api_key, http_client=http_client)
+            _openai_clients[api_key] = client
+        return client
+
+
+def get_langchain_chat_model(model: str, temperature: float, api_key: Optional[str], **kwargs):
+    """
+    Return the shared LangChain ChatOpenAI for a (model, temperature) pair.
+
+    Args:
+        model: OpenAI model name
+        temperature: Sampling temperature
+        api_key: OpenAI API key
+        **kwargs: Extra ChatOpenAI parameters; they are part of the cache key
+
+    Returns:
+        A ChatOpenAI instance reused by every caller with the same configuration
+    """
+    from langchain_openai import ChatOpenAI
+
+    key = (model, temperature, api_key, tuple(sorted(kwargs.items())))
+    http_client = get_http_client(api_key)
+    with _lock:
+        llm = _langchain_models.get(key)
+        if llm is None:
+            llm = ChatOpenAI(
+                api_key=api_key,
+                model=model,
+                temperature=temperature,
+                http_client=http_client,
+                **kwargs,
+            )
+            _langchain_models[key] = llm
+        return llm
@@ -0,0 +1,25 @@
+# Settings shared by the ChatBot and Pipeline1 routers
+import os
+from dotenv import load_dotenv
+
+# Load environment variables from .env file
+load_dotenv()
+
+# Process-wide LLM rate limits (should match the provider quota for the API key)
+LLM_REQUESTS_PER_MINUTE = int(os.getenv("LLM_REQUESTS_PER_MINUTE", 500))
+LLM_TOKENS_PER_MINUTE = int(os.getenv("LLM_TOKENS_PER_MINUTE", 200000))
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", 16))
+
+# Completion tokens reserved per request when the real usage is not known yet
+LLM_ESTIMATED_COMPLETION_TOKENS = int(os.getenv("LLM_ESTIMATED_COMPLETION_TOKENS", 400))
+
+# Connection pool shared by all LLM clients (see client_registry.py)
+LLM_HTTP_MAX_CONNECTIONS = int(os.getenv("LLM_HTTP_MAX_CONNECTIONS", 100))
+LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS", 20))
+LLM_HTTP_KEEPALIVE_EXPIRY_SECONDS = float(os.getenv("LLM_HTTP_KEEPALIVE_EXPIRY_SECONDS", 120))
+
+# Exact-match cache of deterministic LLM responses (see response_cache.py),
+# used by the chat decision maker, the summarizer and the Pipeline1 domain agents
+RESPONSE_CACHE_ENABLED = os.getenv("RESPONSE_CACHE_ENABLED", "false").lower() == "true"
+RESPONSE_CACHE_PATH = os.getenv("RESPONSE_CACHE_PATH", "tmp/response_cache.sqlite3")
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", 10000))
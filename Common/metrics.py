@@ -0,0 +1,72 @@
+"""In-process metrics shared by the ChatBot and Pipeline1 routers."""
+
+import threading
+from collections import deque
+from typing import Any, Dict
+
+
+class _Summary:
+    """Running count/sum/max plus a bounded window for percentiles."""
+
+    def __init__(self, window: int = 1000):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.recent = deque(maxlen=window)
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+        self.recent.append(value)
+
+    def _percentile(self, values, fraction: float) -> float:
+        return values[min(len(values) - 1, int(fraction * len(values)))]
+
+    def to_dict(self) -> Dict[str, float]:
+        values = sorted(self.recent)
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "p50": self._percentile(values, 0.5) if values else 0.0,
+            "p95": self._percentile(values, 0.95) if values else 0.0,
+            "max": self.max,
+        }
+
+
+class MetricsRegistry:
+    """Thread-safe counters, gauges and summaries keyed by dotted names."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, float] = {}
+        self._gauges: Dict[str, float] = {}
+        self._summaries: Dict[str, _Summary] = {}
+
+    def increment(self, name: str, value: float = 1) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def set_gauge(self, name: str, value: float) -> None:
+        with self._lock:
+            self._gauges[name] = value
+
+    def observe(self, name: str, value: float) -> None:
+        with self._lock:
+            summary = self._summaries.get(name)
+            if summary is None:
+                summary = self._summaries[name] = _Summary()
+            summary.observe(value)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return a JSON-serializable copy of all metrics."""
+        with self._lock:
+            return {
+                "counters": dict(self._counters),
+                "gauges": dict(self._gauges),
+                "summaries": {name: s.to_dict() for name, s in self._summaries.items()},
+            }
+
+
+# Process-wide registry
+metrics = MetricsRegistry()
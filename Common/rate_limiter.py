@@ -0,0 +1,197 @@
+"""
+Process-wide LLM rate limiter and concurrency governor.
+
+Every LLM call made by the ChatBot agents and the Pipeline1 chains goes
+through the shared `llm_governor`, which enforces the provider quota with
+two token buckets (requests/min and tokens/min) and a cap on in-flight
+calls. Waiters are admitted strictly by priority class, so interactive
+counseling traffic is always served before queued batch report generation.
+"""
+
+import contextvars
+import heapq
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from enum import IntEnum
+from typing import Iterator, Optional
+
+from .config import (
+    LLM_ESTIMATED_COMPLETION_TOKENS,
+    LLM_MAX_CONCURRENCY,
+    LLM_REQUESTS_PER_MINUTE,
+    LLM_TOKENS_PER_MINUTE,
+)
+from .metrics import metrics
+
+
+class Priority(IntEnum):
+    """Priority classes, lower values are admitted first."""
+
+    INTERACTIVE = 0
+    BATCH = 1
+
+
+# Priority used when a call site does not pass one explicitly
+_current_priority: contextvars.ContextVar[Priority] = contextvars.ContextVar(
+    "llm_priority", default=Priority.INTERACTIVE
+)
+
+
+@contextmanager
+def llm_priority(priority: Priority) -> Iterator[None]:
+    """Run the enclosed LLM calls with the given priority class."""
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def estimate_tokens(*texts: str) -> int:
+    """Rough token estimate for a request (4 characters per token plus completion)."""
+    return sum(len(text) for text in texts) // 4 + LLM_ESTIMATED_COMPLETION_TOKENS
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at `per_minute` units per minute."""
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def seconds_until(self, amount: float) -> float:
+        """Seconds until `amount` units are available (0 if available now)."""
+        self._refill()
+        # Requests larger than the bucket only wait for a full bucket
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate
+
+    def take(self, amount: float) -> None:
+        self._refill()
+        self.tokens -= min(amount, self.capacity)
+
+    def adjust(self, delta: float) -> None:
+        """Debit (or refund) units after the real usage is known; may go negative."""
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens - delta)
+
+
+class LLMPermit:
+    """Admission ticket for a single LLM call."""
+
+    def __init__(self, priority: Priority, estimated_tokens: int):
+        self.priority = priority
+        self.estimated_tokens = estimated_tokens
+        self.actual_tokens: Optional[int] = None
+
+    def record_usage(self, total_tokens: Optional[int]) -> None:
+        """Record the token usage reported by the provider for this call."""
+        if total_tokens is not None:
+            self.actual_tokens = total_tokens
+
+
+class LLMGovernor:
+    def __init__(
+        self,
+        requests_per_minute: int = LLM_REQUESTS_PER_MINUTE,
+        tokens_per_minute: int = LLM_TOKENS_PER_MINUTE,
+        max_concurrency: int = LLM_MAX_CONCURRENCY,
+    ):
+        """
+        Initialize the governor.
+
+        Args:
+            requests_per_minute: Maximum LLM requests started per minute
+            tokens_per_minute: Maximum prompt + completion tokens per minute
+            max_concurrency: Maximum number of LLM calls in flight at once
+        """
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        self.max_concurrency = max_concurrency
+        self.in_flight = 0
+        self._waiters = []  # heap of (priority, sequence)
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+
+    def _admission_delay(self, ticket, estimated_tokens: int) -> Optional[float]:
+        """Seconds to wait before the ticket can be admitted, or None to wait for a notify."""
+        if self._waiters[0] != ticket or self.in_flight >= self.max_concurrency:
+            return None
+        return max(
+            self.requests.seconds_until(1), self.tokens.seconds_until(estimated_tokens)
+        )
+
+    def acquire(self, priority: Optional[Priority] = None, estimated_tokens: int = 0) -> LLMPermit:
+        """
+        Block until a call of the given priority may start.
+
+        Args:
+            priority: Priority class, defaults to the one set with `llm_priority`
+            estimated_tokens: Tokens reserved up front for this call
+
+        Returns:
+            A permit that must be passed to `release` when the call finishes
+        """
+        priority = _current_priority.get() if priority is None else priority
+        ticket = (int(priority), next(self._sequence))
+        started = time.monotonic()
+
+        with self._condition:
+            heapq.heappush(self._waiters, ticket)
+            metrics.set_gauge("llm.waiting", len(self._waiters))
+            try:
+                while True:
+                    delay = self._admission_delay(ticket, estimated_tokens)
+                    if delay == 0:
+                        break
+                    self._condition.wait(timeout=delay)
+            finally:
+                self._waiters.remove(ticket)
+                heapq.heapify(self._waiters)
+                metrics.set_gauge("llm.waiting", len(self._waiters))
+
+            self.requests.take(1)
+            self.tokens.take(estimated_tokens)
+            self.in_flight += 1
+            metrics.set_gauge("llm.in_flight", self.in_flight)
+            # Let the next waiter re-check its admission
+            self._condition.notify_all()
+
+        label = priority.name.lower()
+        metrics.increment(f"llm.requests.{label}")
+        metrics.observe(f"llm.queue_wait_seconds.{label}", time.monotonic() - started)
+        return LLMPermit(priority, estimated_tokens)
+
+    def release(self, permit: LLMPermit) -> None:
+        """Free the concurrency slot and settle the token estimate against real usage."""
+        with self._condition:
+            self.in_flight -= 1
+            if permit.actual_tokens is not None:
+                self.tokens.adjust(permit.actual_tokens - permit.estimated_tokens)
+                metrics.increment("llm.tokens", permit.actual_tokens)
+            metrics.set_gauge("llm.in_flight", self.in_flight)
+            self._condition.notify_all()
+
+    @contextmanager
+    def slot(self, priority: Optional[Priority] = None, estimated_tokens: int = 0) -> Iterator[LLMPermit]:
+        """Context manager wrapping `acquire`/`release` around a single LLM call."""
+        permit = self.acquire(priority, estimated_tokens)
+        try:
+            yield permit
+        finally:
+            self.release(permit)
+
+
+# Process-wide governor shared by both routers
+llm_governor = LLMGovernor()
@@ -0,0 +1,192 @@
+"""
+Opt-in exact-match cache of LLM responses, shared by the ChatBot and Pipeline1.
+
+Some calls are effectively deterministic for the same input: the chat
+decision maker on an identical history, the summarizer on a retried
+end-session request, the low-temperature Pipeline1 domain agents. Their
+responses are stored in a SQLite file keyed by a hash of the model, its
+parameters and the full prompt, so retries and replays are served without
+an LLM call. The cache is bounded to RESPONSE_CACHE_MAX_ENTRIES entries
+and evicts the least recently used ones. Disabled unless
+RESPONSE_CACHE_ENABLED is set.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from .config import RESPONSE_CACHE_ENABLED, RESPONSE_CACHE_MAX_ENTRIES, RESPONSE_CACHE_PATH
+from .metrics import metrics
+
+
+def make_cache_key(namespace: str, **parts: Any) -> str:
+    """Hash the parts that determine a response (model, parameters, prompt) into a cache key."""
+    payload = json.dumps({"namespace": namespace, **parts}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """Size-bounded LRU of response texts in a SQLite file."""
+
+    def __init__(self, path: str, max_entries: int):
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        # Several worker processes may share the file
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, namespace TEXT, value TEXT, created REAL, last_used REAL)"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)")
+
+    def get(self, namespace: str, key: str) -> Optional[str]:
+        """Return the cached response for key (and mark it recently used), or None."""
+        with self._lock:
+            row = self._connection.execute("SELECT value FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                self._connection.execute("UPDATE responses SET last_used = ? WHERE key = ?", (time.time(), key))
+        outcome = "hits" if row is not None else "misses"
+        metrics.increment(f"llm.response_cache.{outcome}")
+        metrics.increment(f"llm.response_cache.{namespace}.{outcome}")
+        return row[0] if row is not None else None
+
+    def put(self, namespace: str, key: str, value: str) -> None:
+        """Store a response, evicting the least recently used entries beyond max_entries."""
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses (key, namespace, value, created, last_used) VALUES (?, ?, ?, ?, ?)",
+                (key, namespace, value, now, now),
+            )
+            (count,) = self._connection.execute("SELECT COUNT(*) FROM responses").fetchone()
+            excess = count - self.max_entries
+            if excess > 0:
+                self._connection.execute(
+                    "DELETE FROM responses WHERE key IN "
+                    "(SELECT key FROM responses ORDER BY last_used ASC LIMIT ?)",
+                    (excess,),
+                )
+                metrics.increment("llm.response_cache.evictions", excess)
+            metrics.set_gauge("llm.response_cache.entries", min(count, self.max_entries))
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+
+
+_cache: Optional[ResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """Return the process-wide response cache, or None if it is disabled."""
+    global _cache
+    if not RESPONSE_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ResponseCache(RESPONSE_CACHE_PATH, RESPONSE_CACHE_MAX_ENTRIES)
+    return _cache
+
+
+def _agent_cache_parts(agent, prompt: str) -> Dict[str, Any]:
+    """Everything that shapes an agno agent's response besides sampling noise."""
+    model = agent.model
+    return {
+        "model": getattr(model, "id", None),
+        "params": {
+            name: getattr(model, name, None)
+            for name in ("temperature", "top_p", "seed", "max_tokens", "max_completion_tokens", "reasoning_effort")
+        },
+        "description": agent.description,
+        "instructions": agent.instructions,
+        "additional_context": agent.additional_context,
+        "expected_output": agent.expected_output,
+        "markdown": agent.markdown,
+        "tools": [getattr(tool, "name", type(tool).__name__) for tool in agent.tools or []],
+        "tool_choice": agent.tool_choice,
+        "prompt": prompt,
+    }
+
+
+def cached_agent_run(agent, prompt: str, namespace: str) -> str:
+    """
+    Run an agno Agent and return its text content, served from the cache when enabled.
+
+    Args:
+        agent: agno Agent without a response_model
+        prompt: The message passed to agent.run
+        namespace: Name of the call site (used in metrics)
+
+    Returns:
+        The response text
+    """
+    cache = get_response_cache()
+    key = make_cache_key(namespace, **_agent_cache_parts(agent, prompt)) if cache is not None else None
+    if cache is not None:
+        cached = cache.get(namespace, key)
+        if cached is not None:
+            return cached
+
+    response = agent.run(prompt)
+    text = response.content if hasattr(response, "content") else str(response)
+    if cache is not None and isinstance(text, str) and text:
+        cache.put(namespace, key, text)
+    return text
+
+
+def _chain_cache_parts(chain, prompt_input: Dict[str, Any]) -> Dict[str, Any]:
+    """Model, parameters and rendered prompt of a `prompt | llm` chain."""
+    first, last = getattr(chain, "first", None), getattr(chain, "last", chain)
+    try:
+        prompt = first.invoke(prompt_input).to_string()
+    except Exception:
+        # Not a prompt template: key on the raw input
+        prompt = prompt_input
+    return {
+        "model": getattr(last, "model_name", None),
+        "params": {name: getattr(last, name, None) for name in ("temperature", "top_p", "seed", "max_tokens")},
+        "prompt": prompt,
+    }
+
+
+def cached_chain_invoke(chain, prompt_input: Dict[str, Any], namespace: str, invoke=None):
+    """
+    Invoke a LangChain `prompt | llm` chain, served from the cache when enabled.
+
+    Args:
+        chain: The chain to invoke
+        prompt_input: Input of the prompt template
+        namespace: Name of the call site (used in metrics)
+        invoke: Optional callable(chain, prompt_input) making the actual call
+            (default: chain.invoke)
+
+    Returns:
+        The chain result (an AIMessage holding the cached text on a hit)
+    """
+    cache = get_response_cache()
+    call = invoke or (lambda c, i: c.invoke(i))
+    if cache is None:
+        return call(chain, prompt_input)
+
+    key = make_cache_key(namespace, **_chain_cache_parts(chain, prompt_input))
+    cached = cache.get(namespace, key)
+    if cached is not None:
+        from langchain_core.messages import AIMessage
+
+        return AIMessage(content=cached)
+
+    result = call(chain, prompt_input)
+    text = getattr(result, "content", None)
+    if isinstance(text, str) and text:
+        cache.put(namespace, key, text)
+    return result
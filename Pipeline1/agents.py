@@ -2,6 +2,8 @@
 
 from typing import Dict, Any, List, Union
 import json
+from Common.rate_limiter import Priority, estimate_tokens, llm_governor
+from Common.response_cache import cached_chain_invoke
 from .config import get_llm
 from .models import AgentReport
 from .prompt_templates import (
@@ -14,6 +16,28 @@ from .prompt_templates import (
     CONSOLIDATION_AGENT_PROMPT,
 )
 
+# Sections produced by the domain agents, in the order they are consolidated
+REPORT_SECTIONS = ("activity", "leave", "onboarding", "performance", "rewards")
+
+
+def _governed_invoke(chain, prompt_input: Dict[str, Any]):
+    estimated_tokens = estimate_tokens(*[str(value) for value in prompt_input.values()])
+    with llm_governor.slot(Priority.BATCH, estimated_tokens) as permit:
+        result = chain.invoke(prompt_input)
+        usage = getattr(result, "usage_metadata", None)
+        if usage:
+            permit.record_usage(usage.get("total_tokens"))
+        return result
+
+
+def invoke_chain(chain, prompt_input: Dict[str, Any], namespace: str = "pipeline1"):
+    """
+    Invoke a chain as a batch-priority call through the shared LLM governor.
+
+    Identical prompts are served from the response cache when it is enabled.
+    """
+    return cached_chain_invoke(chain, prompt_input, namespace, invoke=_governed_invoke)
+
 
 class BaseAgent:
     """Base agent class with common functionality."""
@@ -49,7 +73,7 @@ class BaseAgent:
             formatted_vibemeter_data = self.format_data(vibemeter_data)
             prompt_input["vibemeter_data"] = formatted_vibemeter_data
         # Generate report
-        result = self.chain.invoke(prompt_input)
+        result = invoke_chain(self.chain, prompt_input, namespace=f"pipeline1.{self.data_key}")
 
         # Extract content based on result type
         if hasattr(result, "content"):
@@ -132,17 +156,19 @@ class ConsolidationAgent:
     def process(self, reports: Dict[str, AgentReport]) -> Dict[str, Any]:
         """Process individual reports and generate a consolidated report."""
         # Create input for the prompt
-        prompt_input = {
-            "activity_report": reports["activity"].analysis,
-            "leave_report": reports["leave"].analysis,
-            "onboarding_report": reports["onboarding"].analysis,
-            "performance_report": reports["performance"].analysis,
-            "rewards_report": reports["rewards"].analysis,
-            # "vibemeter_report": reports["vibemeter"].analysis,
-        }
+        # Sections whose agent failed are marked as unavailable instead of
+        # failing the whole consolidation
+        prompt_input = {}
+        for section in REPORT_SECTIONS:
+            report = reports.get(section)
+            prompt_input[f"{section}_report"] = (
+                report.analysis
+                if report is not None
+                else f"No {section} analysis available (the {section} agent did not complete)."
+            )
 
         # Generate consolidated report
-        result = self.chain.invoke(prompt_input)
+        result = invoke_chain(self.chain, prompt_input, namespace="pipeline1.consolidation")
 
         # Extract content based on result type
         if hasattr(result, "content"):
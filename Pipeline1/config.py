@@ -1,8 +1,8 @@
 """Configuration for the employee analysis system."""
 
 import os
-from langchain_groq import ChatGroq
-from langchain_openai import ChatOpenAI
+# from langchain_groq import ChatGroq
+from Common.client_registry import get_langchain_chat_model
 # from langchain_google_genai import ChatGoogleGenerativeAI
 # from openai import OpenAI
 from dotenv import load_dotenv
@@ -11,17 +11,27 @@ load_dotenv()
 DEFAULT_MODEL = "gpt-4o-mini"  # You can choose a suitable Groq model
 DEFAULT_TEMPERATURE = 0.2
 
+# Per-node budgets for the analysis graph (see resilience.py)
+NODE_TIMEOUT_SECONDS = float(os.getenv("NODE_TIMEOUT_SECONDS", 90))
+NODE_MAX_RETRIES = int(os.getenv("NODE_MAX_RETRIES", 3))
+RETRY_BASE_DELAY_SECONDS = float(os.getenv("RETRY_BASE_DELAY_SECONDS", 1.0))
+RETRY_MAX_DELAY_SECONDS = float(os.getenv("RETRY_MAX_DELAY_SECONDS", 20.0))
+
+# Embed each new report into the chatbot's employee knowledge base right away
+PRECOMPUTE_EMPLOYEE_KB = os.getenv("PRECOMPUTE_EMPLOYEE_KB", "true").lower() == "true"
+
 # Initialize LLM
 def get_llm(model_name=None, temperature=None):
-    """Get the LLM instance based on configuration."""
-    model = model_name
+    """Get the shared LLM instance for the given model and temperature."""
+    model = model_name or DEFAULT_MODEL
     temp = temperature if temperature is not None else float(os.getenv("LLM_TEMPERATURE", DEFAULT_TEMPERATURE))
-    
+
     # client = OpenAI(api_key=os.getenv("GEMINI_API_KEY"))
-    model='gpt-4o-mini'
-    return ChatOpenAI(
-        api_key=os.getenv("OPEN_AI_API_KEY"),
+    return get_langchain_chat_model(
         model=model,
         temperature=temp,
-        max_retries=2
+        api_key=os.getenv("OPEN_AI_API_KEY"),
+        # Retries and timeouts are owned by the node budgets in resilience.py
+        max_retries=0,
+        timeout=NODE_TIMEOUT_SECONDS,
     )
@@ -1,8 +1,6 @@
 """LangGraph workflow implementation for the employee analysis system with parallel processing."""
 
 from typing import Dict, List, Any, Annotated, TypedDict, Literal
-from langchain_core.messages import HumanMessage
-from langgraph.graph import StateGraph, END
 from pydantic import BaseModel
 import json
 import os
@@ -10,6 +8,8 @@ import urllib.parse
 import urllib.request
 import concurrent.futures
 import asyncio
+import operator
+import threading
 
 from .agents import (
     ActivityAgent,
@@ -19,8 +19,10 @@ from .agents import (
     RewardsAgent,
     # VibemeterAgent,
     ConsolidationAgent,
+    REPORT_SECTIONS,
 )
 from .models import AgentReport
+from .resilience import run_with_budget
 
 
 # Define the state for our graph
@@ -33,17 +35,37 @@ class EmployeeAnalysisState(TypedDict):
     rewards_report: AgentReport
     # vibemeter_report: AgentReport
     consolidated_report: Dict[str, Any]
+    # Sections whose agent failed or timed out; appended to by parallel nodes
+    failed_sections: Annotated[List[str], operator.add]
     status: str
 
 
-# Initialize all agents
-activity_agent = ActivityAgent()
-leave_agent = LeaveAgent()
-onboarding_agent = OnboardingAgent()
-performance_agent = PerformanceAgent()
-rewards_agent = RewardsAgent()
-# vibemeter_agent = VibemeterAgent()
-consolidation_agent = ConsolidationAgent()
+# Agents and the compiled graph are built on first use rather than at import,
+# so importing the routers (app startup, test collection) stays cheap
+AGENT_CLASSES = {
+    "activity": ActivityAgent,
+    "leave": LeaveAgent,
+    "onboarding": OnboardingAgent,
+    "performance": PerformanceAgent,
+    "rewards": RewardsAgent,
+    # "vibemeter": VibemeterAgent,
+    "consolidation": ConsolidationAgent,
+}
+
+_agents: Dict[str, Any] = {}
+_graph = None
+_init_lock = threading.Lock()
+
+
+def get_agent(name: str):
+    """Return the shared agent instance for a section, creating it on first use."""
+    agent = _agents.get(name)
+    if agent is None:
+        with _init_lock:
+            agent = _agents.get(name)
+            if agent is None:
+                agent = _agents[name] = AGENT_CLASSES[name]()
+    return agent
 
 
 # Initial node that just passes the data through
@@ -53,40 +75,47 @@ def initialize_analysis(state: EmployeeAnalysisState) -> EmployeeAnalysisState:
     return {}
 
 
+def _run_domain_agent(agent, section: str, state: EmployeeAnalysisState) -> EmployeeAnalysisState:
+    """Run a domain agent within its node budget, recording the section as failed on error."""
+    try:
+        report = run_with_budget(
+            lambda: agent.process(state["employee_data"]), name=f"process_{section}"
+        )
+    except Exception as e:
+        print(f"Error processing {section} data: {type(e).__name__}: {str(e)}")
+        return {"failed_sections": [section]}
+    return {f"{section}_report": report}
+
+
 # Define agent functions that will be nodes in our graph
 def process_activity(state: EmployeeAnalysisState) -> EmployeeAnalysisState:
     """Process activity data and update state with report."""
     print("Processing activity data...")
-    report = activity_agent.process(state["employee_data"])
-    return {"activity_report": report}
+    return _run_domain_agent(get_agent("activity"), "activity", state)
 
 
 def process_leave(state: EmployeeAnalysisState) -> EmployeeAnalysisState:
     """Process leave data and update state with report."""
     print("Processing leave data...")
-    report = leave_agent.process(state["employee_data"])
-    return {"leave_report": report}
+    return _run_domain_agent(get_agent("leave"), "leave", state)
 
 
 def process_onboarding(state: EmployeeAnalysisState) -> EmployeeAnalysisState:
     """Process onboarding data and update state with report."""
     print("Processing onboarding data...")
-    report = onboarding_agent.process(state["employee_data"])
-    return {"onboarding_report": report}
+    return _run_domain_agent(get_agent("onboarding"), "onboarding", state)
 
 
 def process_performance(state: EmployeeAnalysisState) -> EmployeeAnalysisState:
     """Process performance data and update state with report."""
     print("Processing performance data...")
-    report = performance_agent.process(state["employee_data"])
-    return {"performance_report": report}
+    return _run_domain_agent(get_agent("performance"), "performance", state)
 
 
 def process_rewards(state: EmployeeAnalysisState) -> EmployeeAnalysisState:
     """Process rewards data and update state with report."""
     print("Processing rewards data...")
-    report = rewards_agent.process(state["employee_data"])
-    return {"rewards_report": report}
+    return _run_domain_agent(get_agent("rewards"), "rewards", state)
 
 
 # def process_vibemeter(state: EmployeeAnalysisState) -> EmployeeAnalysisState:
@@ -97,18 +126,39 @@ def process_rewards(state: EmployeeAnalysisState) -> EmployeeAnalysisState:
 
 
 def consolidate_reports(state: EmployeeAnalysisState) -> EmployeeAnalysisState:
-    """Consolidate all reports into a single analysis."""
+    """
+    Consolidate the available reports into a single analysis.
+
+    Sections whose agent failed are skipped (degraded mode) so that the LLM
+    calls already paid for are not thrown away. The run is only marked as
+    failed when no section succeeded or the consolidation itself fails.
+    """
     print("Consolidating all reports...")
     reports = {
-        "activity": state["activity_report"],
-        "leave": state["leave_report"],
-        "onboarding": state["onboarding_report"],
-        "performance": state["performance_report"],
-        "rewards": state["rewards_report"],
-        # "vibemeter": state["vibemeter_report"]
+        section: state[f"{section}_report"]
+        for section in REPORT_SECTIONS
+        if state.get(f"{section}_report") is not None
     }
-    consolidated_report = consolidation_agent.process(reports)
-    return {"consolidated_report": consolidated_report, "status": "complete"}
+    missing_sections = [section for section in REPORT_SECTIONS if section not in reports]
+
+    if not reports:
+        print("No section reports available, skipping consolidation.")
+        return {"status": "failed"}
+
+    if missing_sections:
+        print(f"Consolidating in degraded mode, missing: {', '.join(missing_sections)}")
+
+    try:
+        consolidated_report = run_with_budget(
+            lambda: get_agent("consolidation").process(reports), name="consolidate_reports"
+        )
+    except Exception as e:
+        print(f"Error consolidating reports: {type(e).__name__}: {str(e)}")
+        return {"status": "failed"}
+
+    consolidated_report["missing_sections"] = missing_sections
+    status = "degraded" if missing_sections else "complete"
+    return {"consolidated_report": consolidated_report, "status": status}
 
 
 # Helper function to process reports in parallel using ThreadPoolExecutor
@@ -152,11 +202,11 @@ def process_reports_in_parallel(employee_data):
 async def process_reports_async(employee_data):
     """Process all reports in parallel using asyncio."""
     # Run all agents concurrently
-    activity_task = activity_agent.aprocess(employee_data)
-    leave_task = leave_agent.aprocess(employee_data)
-    onboarding_task = onboarding_agent.aprocess(employee_data)
-    performance_task = performance_agent.aprocess(employee_data)
-    rewards_task = rewards_agent.aprocess(employee_data)
+    activity_task = get_agent("activity").aprocess(employee_data)
+    leave_task = get_agent("leave").aprocess(employee_data)
+    onboarding_task = get_agent("onboarding").aprocess(employee_data)
+    performance_task = get_agent("performance").aprocess(employee_data)
+    rewards_task = get_agent("rewards").aprocess(employee_data)
     # vibemeter_task = vibemeter_agent.aprocess(employee_data)
 
     # Gather results
@@ -185,7 +235,7 @@ async def process_reports_async(employee_data):
     }
 
     # Consolidate reports
-    consolidated_report = await consolidation_agent.aprocess(reports)
+    consolidated_report = await get_agent("consolidation").aprocess(reports)
 
     return {"reports": reports, "consolidated_report": consolidated_report}
 
@@ -193,6 +243,8 @@ async def process_reports_async(employee_data):
 # Create the graph
 def create_employee_analysis_graph():
     """Create and configure the LangGraph workflow with fan-out fan-in pattern."""
+    from langgraph.graph import StateGraph, END
+
     # Initialize the graph
     graph = StateGraph(EmployeeAnalysisState)
 
@@ -232,5 +284,18 @@ def create_employee_analysis_graph():
     return graph.compile()
 
 
-# Create a runnable graph
-employee_analysis_graph = create_employee_analysis_graph()
+def get_employee_analysis_graph():
+    """Return the compiled analysis graph, compiling it on first use."""
+    global _graph
+    if _graph is None:
+        with _init_lock:
+            if _graph is None:
+                _graph = create_employee_analysis_graph()
+    return _graph
+
+
+def __getattr__(name):
+    # Backwards compatibility for `from .langraph_workflow import employee_analysis_graph`
+    if name == "employee_analysis_graph":
+        return get_employee_analysis_graph()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
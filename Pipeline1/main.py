@@ -2,9 +2,11 @@
 
 import json
 import argparse
-from typing import Dict, Any
-from .langraph_workflow import employee_analysis_graph
+from pathlib import Path
+from typing import Dict, Any, Optional
+from .langraph_workflow import get_employee_analysis_graph
 from .models import EmployeeData
+from .report_catalog import get_report_catalog
 
 
 def load_employee_data(file_path: str) -> Dict[str, Any]:
@@ -14,8 +16,18 @@ def load_employee_data(file_path: str) -> Dict[str, Any]:
     return data
 
 
-def save_report_to_text(report: Dict[str, Any], output_file: str) -> None:
-    """Save the consolidated report to a text file."""
+def save_report_to_text(
+    report: Dict[str, Any],
+    output_file: str,
+    chain_id: Optional[str] = None,
+    employee_id: Optional[str] = None,
+) -> None:
+    """
+    Save the consolidated report to a text file.
+
+    When a chain_id is given the report is also recorded in the report
+    catalog of the output directory, which backs /report/list-reports.
+    """
     with open(output_file, "w") as file:
         file.write("=== EMPLOYEE MOOD AND BEHAVIOR ANALYSIS ===\n\n")
 
@@ -26,6 +38,11 @@ def save_report_to_text(report: Dict[str, Any], output_file: str) -> None:
             report.get("overall_analysis", "No overall analysis available.") + "\n\n"
         )
 
+    if chain_id:
+        get_report_catalog(Path(output_file).parent).record(
+            chain_id, output_file, employee_id=employee_id
+        )
+
 
 def format_report_for_display(report: Dict[str, Any]) -> str:
     """Format the consolidated report for human-readable display."""
@@ -66,7 +83,7 @@ def main():
 
     # Run the analysis
     print("Analyzing employee data...")
-    result = employee_analysis_graph.invoke(initial_state)
+    result = get_employee_analysis_graph().invoke(initial_state)
 
     # Extract the consolidated report
     consolidated_report = result.get("consolidated_report", {})
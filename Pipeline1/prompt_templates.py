@@ -1,6 +1,6 @@
 """Prompt templates for each agent in the employee analysis system."""
 
-from langchain.prompts import PromptTemplate
+from langchain_core.prompts import PromptTemplate
 
 # Define vibemeter score mapping for clarity throughout all prompts
 VIBEMETER_MAPPING = """
@@ -1,10 +1,13 @@
-from fastapi import HTTPException, APIRouter
+from fastapi import HTTPException, APIRouter, Query, BackgroundTasks
 from fastapi.responses import FileResponse
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from pathlib import Path
 from .main import save_report_to_text, format_report_for_display
-from .langraph_workflow import employee_analysis_graph
+from .langraph_workflow import get_employee_analysis_graph
+from .report_catalog import get_report_catalog
+from .config import PRECOMPUTE_EMPLOYEE_KB
 
 router = APIRouter()
 
@@ -13,13 +16,25 @@ REPORTS_DIR = Path(__file__).parent.parent / "emp_reports"
 REPORTS_DIR.mkdir(exist_ok=True)
 
 
+def warm_employee_knowledge_base(chain_id: str, report_path: str) -> None:
+    """Embed a new report into the chatbot's vector table for this chain."""
+    try:
+        # Imported here: the embedding stack is only needed once a report exists
+        from ChatBot.knowledge_base import warm_employee_knowledge_base as warm
+
+        warm(chain_id, report_path)
+    except Exception as e:
+        # The chatbot falls back to embedding at session start
+        print(f"Error warming knowledge base for chain {chain_id}: {str(e)}")
+
+
 class EmployeeDataRequest(BaseModel):
     employee_data: Dict[str, Any]
     chain_id: str
 
 
 @router.post("/analyze")
-async def analyze_employee_data(request: EmployeeDataRequest):
+async def analyze_employee_data(request: EmployeeDataRequest, background_tasks: BackgroundTasks):
     """
     Analyze employee data and generate a report.
     """
@@ -43,7 +58,9 @@ async def analyze_employee_data(request: EmployeeDataRequest):
         print("Starting employee analysis...", initial_state)
 
         # Run the analysis
-        result = employee_analysis_graph.invoke(initial_state)
+        # Run off the event loop: the graph blocks while the LLM governor
+        # queues its batch-priority calls behind interactive chat traffic
+        result = await run_in_threadpool(get_employee_analysis_graph().invoke, initial_state)
 
         print("Analysis complete.")
 
@@ -60,11 +77,19 @@ async def analyze_employee_data(request: EmployeeDataRequest):
         report_path = REPORTS_DIR / report_filename
 
         # Save the report
-        save_report_to_text(consolidated_report, str(report_path))
+        save_report_to_text(
+            consolidated_report, str(report_path), chain_id=chain_id, employee_id=emp_id
+        )
+
+        # Build the chatbot's employee index now rather than at session start
+        if PRECOMPUTE_EMPLOYEE_KB:
+            background_tasks.add_task(warm_employee_knowledge_base, chain_id, str(report_path))
 
         return {
             "summary": format_report_for_display(result),
             "report_path": str(report_path),
+            "status": result.get("status", "complete"),
+            "missing_sections": consolidated_report.get("missing_sections", []),
             "message": f"Report generated successfully for employee {emp_id}",
         }
 
@@ -94,22 +119,37 @@ async def download_report(chain_id: str):
 
 
 @router.get("/list-reports")
-async def list_reports():
+async def list_reports(
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+    employee_id: Optional[str] = None,
+    created_after: Optional[float] = None,
+    created_before: Optional[float] = None,
+):
     """
-    List all available reports.
+    List available reports from the report catalog, newest first.
+
+    Supports pagination (limit/offset) and filtering by employee and by
+    creation time (UNIX timestamps).
     """
     try:
-        reports = []
-        for report_file in REPORTS_DIR.glob("*_report.txt"):
-            chain_id = report_file.stem.replace("_report", "")
-            reports.append(
-                {
-                    "chain_id": chain_id,
-                    "report_path": str(report_file),
-                    "created_at": report_file.stat().st_ctime,
-                }
-            )
-        return {"reports": reports}
+        entries, total = get_report_catalog(REPORTS_DIR).list(
+            limit=limit,
+            offset=offset,
+            employee_id=employee_id,
+            created_after=created_after,
+            created_before=created_before,
+        )
+        reports = [
+            {
+                "chain_id": entry["chain_id"],
+                "employee_id": entry["employee_id"],
+                "report_path": entry["report_path"],
+                "created_at": entry["created_at"],
+            }
+            for entry in entries
+        ]
+        return {"reports": reports, "total": total, "limit": limit, "offset": offset}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -120,8 +160,4 @@ async def report_exists(chain_id: str):
     Get the report for a specific chain ID.
     """
 
-    report_path = REPORTS_DIR / f"{chain_id}_report.txt"
-    if report_path.exists():
-        return {"exists": True}
-    else:
-        return {"exists": False}
+    return {"exists": get_report_catalog(REPORTS_DIR).exists(chain_id)}
@@ -0,0 +1,168 @@
+"""SQLite catalog of generated reports, kept in sync by save_report_to_text."""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+CATALOG_FILENAME = "report_catalog.sqlite3"
+REPORT_SUFFIX = "_report.txt"
+
+
+class ReportCatalog:
+    def __init__(self, reports_dir: Union[str, Path], db_path: Optional[Union[str, Path]] = None):
+        """
+        Open (or create) the catalog for a reports directory.
+
+        On first use the catalog is backfilled from the report files already
+        in the directory; afterwards it is only updated by `record`, so
+        listing and lookups never scan the directory.
+
+        Args:
+            reports_dir: Directory holding the `<chain_id>_report.txt` files
+            db_path: Path of the SQLite file (default: <reports_dir>/report_catalog.sqlite3)
+        """
+        self.reports_dir = Path(reports_dir)
+        self.db_path = Path(db_path) if db_path else self.reports_dir / CATALOG_FILENAME
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS reports (
+                    chain_id TEXT PRIMARY KEY,
+                    employee_id TEXT,
+                    report_path TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+                """
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_reports_created ON reports (created_at)")
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_reports_employee ON reports (employee_id, created_at)"
+            )
+            self._conn.execute("CREATE TABLE IF NOT EXISTS catalog_meta (key TEXT PRIMARY KEY, value TEXT)")
+        self._backfill()
+
+    def _backfill(self) -> None:
+        """Index report files written before the catalog existed (runs once)."""
+        with self._lock:
+            done = self._conn.execute("SELECT 1 FROM catalog_meta WHERE key = 'backfilled'").fetchone()
+        if done:
+            return
+        for report_file in self.reports_dir.glob(f"*{REPORT_SUFFIX}"):
+            created_at = report_file.stat().st_ctime
+            self.record(report_file.name[: -len(REPORT_SUFFIX)], report_file, created_at=created_at)
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO catalog_meta VALUES ('backfilled', '1')")
+
+    def record(
+        self,
+        chain_id: str,
+        report_path: Union[str, Path],
+        employee_id: Optional[str] = None,
+        created_at: Optional[float] = None,
+    ) -> None:
+        """Insert or update the entry for a report that was just written."""
+        now = time.time()
+        created_at = created_at if created_at is not None else now
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                INSERT INTO reports (chain_id, employee_id, report_path, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (chain_id) DO UPDATE SET
+                    employee_id = COALESCE(excluded.employee_id, reports.employee_id),
+                    report_path = excluded.report_path,
+                    updated_at = excluded.updated_at
+                """,
+                (chain_id, employee_id, str(report_path), created_at, now),
+            )
+
+    def remove(self, chain_id: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM reports WHERE chain_id = ?", (chain_id,))
+
+    def get(self, chain_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM reports WHERE chain_id = ?", (chain_id,)).fetchone()
+        return dict(row) if row else None
+
+    def exists(self, chain_id: str) -> bool:
+        """
+        Check whether a report exists for a chain with an indexed lookup.
+
+        Stale entries (file deleted by hand) are pruned, and report files
+        that were copied in without going through `record` are adopted.
+        """
+        entry = self.get(chain_id)
+        if entry is not None:
+            if Path(entry["report_path"]).exists():
+                return True
+            self.remove(chain_id)
+            return False
+
+        report_path = self.reports_dir / f"{chain_id}{REPORT_SUFFIX}"
+        if report_path.exists():
+            self.record(chain_id, report_path, created_at=report_path.stat().st_ctime)
+            return True
+        return False
+
+    def list(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        employee_id: Optional[str] = None,
+        created_after: Optional[float] = None,
+        created_before: Optional[float] = None,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        List reports, newest first.
+
+        Args:
+            limit: Maximum number of reports to return
+            offset: Number of reports to skip
+            employee_id: Only return reports for this employee
+            created_after: Only return reports created at or after this UNIX timestamp
+            created_before: Only return reports created before this UNIX timestamp
+
+        Returns:
+            Tuple of (page of report entries, total number of matching reports)
+        """
+        clauses, params = [], []
+        if employee_id is not None:
+            clauses.append("employee_id = ?")
+            params.append(employee_id)
+        if created_after is not None:
+            clauses.append("created_at >= ?")
+            params.append(created_after)
+        if created_before is not None:
+            clauses.append("created_at < ?")
+            params.append(created_before)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        with self._lock:
+            total = self._conn.execute(f"SELECT COUNT(*) FROM reports {where}", params).fetchone()[0]
+            rows = self._conn.execute(
+                f"SELECT * FROM reports {where} ORDER BY created_at DESC, chain_id LIMIT ? OFFSET ?",
+                params + [limit, offset],
+            ).fetchall()
+        return [dict(row) for row in rows], total
+
+
+_catalogs: Dict[Path, ReportCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_report_catalog(reports_dir: Union[str, Path]) -> ReportCatalog:
+    """Return the shared catalog for a reports directory."""
+    reports_dir = Path(reports_dir).resolve()
+    with _catalogs_lock:
+        catalog = _catalogs.get(reports_dir)
+        if catalog is None:
+            catalog = _catalogs[reports_dir] = ReportCatalog(reports_dir)
+        return catalog
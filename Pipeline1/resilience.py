@@ -0,0 +1,113 @@
+"""Timeout and retry budgets for the nodes of the employee analysis graph."""
+
+import concurrent.futures
+import contextvars
+import random
+import time
+from typing import Callable, Optional, TypeVar
+
+from .config import (
+    NODE_MAX_RETRIES,
+    NODE_TIMEOUT_SECONDS,
+    RETRY_BASE_DELAY_SECONDS,
+    RETRY_MAX_DELAY_SECONDS,
+)
+
+T = TypeVar("T")
+
+# Errors raised by the OpenAI SDK that are worth retrying
+RETRYABLE_ERROR_NAMES = {
+    "RateLimitError",
+    "APITimeoutError",
+    "APIConnectionError",
+    "InternalServerError",
+}
+
+# Shared pool that runs node calls so that they can be abandoned on timeout
+_node_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=32, thread_name_prefix="analysis-node"
+)
+
+
+class NodeTimeoutError(TimeoutError):
+    """Raised when a node exhausts its time budget."""
+
+
+def is_retryable_error(error: BaseException) -> bool:
+    """Check whether an LLM error is transient (rate limit, timeout, 5xx)."""
+    if type(error).__name__ in RETRYABLE_ERROR_NAMES:
+        return True
+    status_code = getattr(error, "status_code", None)
+    return status_code == 429 or (isinstance(status_code, int) and status_code >= 500)
+
+
+def _retry_after_seconds(error: BaseException) -> Optional[float]:
+    """Read the Retry-After header from a provider error, if any."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt: int, error: Optional[BaseException] = None) -> float:
+    """Full-jitter exponential backoff, honouring Retry-After when given."""
+    cap = min(RETRY_MAX_DELAY_SECONDS, RETRY_BASE_DELAY_SECONDS * (2 ** attempt))
+    delay = random.uniform(0, cap)
+    retry_after = _retry_after_seconds(error) if error is not None else None
+    if retry_after is not None:
+        delay = max(delay, retry_after)
+    return delay
+
+
+def run_with_budget(
+    fn: Callable[[], T],
+    name: str,
+    timeout: float = NODE_TIMEOUT_SECONDS,
+    max_retries: int = NODE_MAX_RETRIES,
+) -> T:
+    """
+    Run a node call with an overall time budget and retries on transient errors.
+
+    Args:
+        fn: Zero-argument callable doing the actual work
+        name: Name of the node, used in log messages
+        timeout: Total seconds allowed for all attempts including backoff
+        max_retries: Maximum number of retries after the first attempt
+
+    Returns:
+        The return value of fn
+
+    Raises:
+        NodeTimeoutError: If the budget runs out before a successful attempt
+        Exception: The last error if it is not retryable or retries are exhausted
+    """
+    deadline = time.monotonic() + timeout
+    attempt = 0
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise NodeTimeoutError(f"{name} exceeded its {timeout:g}s budget")
+
+        # Copy the context so per-request settings (e.g. LLM priority) follow the call
+        future = _node_executor.submit(contextvars.copy_context().run, fn)
+        try:
+            return future.result(timeout=remaining)
+        except Exception as e:
+            # On Python 3.11+ the wait's TimeoutError is the builtin one a node
+            # may raise itself, so tell them apart by the call and the deadline
+            if not future.done() or (isinstance(e, TimeoutError) and time.monotonic() >= deadline):
+                # The worker thread is left to finish on its own; its result is dropped
+                future.cancel()
+                raise NodeTimeoutError(f"{name} exceeded its {timeout:g}s budget")
+            if attempt >= max_retries or not is_retryable_error(e):
+                raise
+            delay = backoff_delay(attempt, e)
+            if time.monotonic() + delay >= deadline:
+                raise
+            attempt += 1
+            print(f"{name} failed with {type(e).__name__}, retry {attempt}/{max_retries} in {delay:.1f}s")
+            time.sleep(delay)
@@ -2,7 +2,7 @@
 
 import json
 import os
-from langraph_workflow import employee_analysis_graph
+from langraph_workflow import get_employee_analysis_graph
 
 
 def load_employee_data(file_path: str) -> dict:
@@ -98,7 +98,7 @@ def main():
     initial_state = {"employee_data": employee_data, "status": "started"}
 
     # Run the analysis
-    result = employee_analysis_graph.invoke(initial_state)
+    result = get_employee_analysis_graph().invoke(initial_state)
 
     # Print the result summary
     print("\n=== ANALYSIS COMPLETE ===\n")
@@ -0,0 +1,97 @@
+"""
+Session construction time and memory with and without the agent pool.
+
+Compares, per session:
+
+- building a CounselingAgent from scratch (eight agno agents, empathizer,
+  decision maker and their model clients, then the session state)
+- taking a pre-built scaffold from a prewarmed CounselingAgentPool and
+  attaching the session state only
+
+and reports the construction time (p50 / mean, milliseconds) and the memory
+allocated per session (tracemalloc, KiB). Retrieval is served from the
+report text, so the vector store is not measured. No LLM requests are
+made, but the OpenAI client needs OPENAI_API_KEY to be set (any value).
+
+Usage:
+    python benchmarks/agent_pool.py
+    python benchmarks/agent_pool.py --sessions 50 --report emp_reports/CHAIN5B7DC5_report.txt
+"""
+
+import argparse
+import gc
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from ChatBot import config  # noqa: E402
+from ChatBot.agent_pool import CounselingAgentPool  # noqa: E402
+from ChatBot.counseling_agent import CounselingAgent  # noqa: E402
+
+
+class ReportKnowledge:
+    """Serves retrievals from the report text, keeping the vector store out of the measurements."""
+
+    def __init__(self, report_text):
+        self.report_text = report_text
+
+    def retrieve_many(self, requests):
+        return [self.report_text if source == "employee" else "" for source, _, _ in requests]
+
+
+def measure(build, sessions):
+    """Call build() once per session, keeping the results alive like concurrent sessions do."""
+    seconds, allocated, agents = [], [], []
+    for _ in range(sessions):
+        gc.collect()
+        before = tracemalloc.get_traced_memory()[0]
+        started = time.perf_counter()
+        agents.append(build())
+        seconds.append(time.perf_counter() - started)
+        allocated.append(tracemalloc.get_traced_memory()[0] - before)
+    return seconds, allocated, agents
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark CounselingAgent construction with and without the pool.")
+    parser.add_argument("--sessions", type=int, default=20, help="Number of sessions built per variant")
+    parser.add_argument(
+        "--report",
+        default=str(REPO_ROOT / "emp_reports" / "CHAIN5B7DC5_report.txt"),
+        help="Employee report attached to every session",
+    )
+    args = parser.parse_args()
+
+    report_path = Path(args.report)
+    knowledge = ReportKnowledge(report_path.read_text())
+    tracemalloc.start()
+
+    def from_scratch():
+        return CounselingAgent(model_id=config.MODEL_ID, kb_manager=knowledge, report_file_path=report_path)
+
+    pool = CounselingAgentPool(model_id=config.MODEL_ID, max_idle=args.sessions)
+    started = time.perf_counter()
+    pool.prewarm(args.sessions)
+    prewarm_seconds = time.perf_counter() - started
+
+    def from_pool():
+        return pool.acquire(knowledge, report_file_path=report_path)
+
+    print(f"{args.sessions} sessions, pool prewarmed in {prewarm_seconds:.2f}s (outside the session start)")
+    print(f"{'variant':<14} {'p50 [ms]':>9} {'mean [ms]':>10} {'KiB/session':>12}")
+    for name, build in (("from scratch", from_scratch), ("from pool", from_pool)):
+        seconds, allocated, agents = measure(build, args.sessions)
+        print(
+            f"{name:<14} {statistics.median(seconds) * 1000:>9.2f} {statistics.mean(seconds) * 1000:>10.2f} "
+            f"{statistics.mean(allocated) / 1024:>12.1f}"
+        )
+        del agents
+
+
+if __name__ == "__main__":
+    main()
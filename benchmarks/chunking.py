@@ -0,0 +1,106 @@
+"""
+Compare chunking strategies for the employee knowledge base.
+
+For every report in emp_reports/ and every strategy, builds the employee
+knowledge base from scratch in a temporary LanceDB (what a session start
+pays for) and measures:
+
+- build time: chunking + embedding + insert, in seconds
+- hit@k: each `*Qn:*` question of an issue is used as a query; a hit means
+  one of the top-k chunks contains that issue's heading
+- issue coverage: number of distinct issues in the top-1 chunk for the
+  query used by CounselingAgent.start_interview
+
+The "agentic" strategy makes LLM calls and needs OPENAI_API_KEY.
+
+Usage:
+    python benchmarks/chunking.py
+    python benchmarks/chunking.py --strategies structured document --k 2
+"""
+
+import argparse
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from agno.knowledge.text import TextKnowledgeBase  # noqa: E402
+from agno.vectordb.lancedb import LanceDb, SearchType  # noqa: E402
+from agno.embedder.sentence_transformer import SentenceTransformerEmbedder  # noqa: E402
+
+from ChatBot.report_chunking import get_chunking_strategy  # noqa: E402
+from ChatBot.report_parser import parse_report  # noqa: E402
+
+START_INTERVIEW_QUERY = "Please extract all the issues from the text"
+
+
+def issue_questions(text):
+    """Return [(issue number, [questions])] parsed from a report."""
+    return [(issue.number, list(issue.questions)) for issue in parse_report(text).issues]
+
+
+def benchmark_report(report_path, strategy, embedder, k):
+    db_dir = tempfile.mkdtemp(prefix="chunking_bench_")
+    try:
+        kb = TextKnowledgeBase(
+            path=str(report_path),
+            chunking_strategy=get_chunking_strategy(strategy),
+            vector_db=LanceDb(
+                table_name="employee_data", uri=db_dir, search_type=SearchType.vector, embedder=embedder
+            ),
+        )
+        started = time.perf_counter()
+        kb.load(recreate=True)
+        build_seconds = time.perf_counter() - started
+
+        text = Path(report_path).read_text()
+        hits, total = 0, 0
+        for issue_number, questions in issue_questions(text):
+            for question in questions:
+                docs = kb.search(query=question, num_documents=k)
+                total += 1
+                hits += any(f"Issue {issue_number}:" in doc.content for doc in docs)
+
+        top = kb.search(query=START_INTERVIEW_QUERY, num_documents=1)
+        coverage = len({issue.number for issue in parse_report(top[0].content).issues}) if top else 0
+        return build_seconds, hits, total, coverage
+    finally:
+        shutil.rmtree(db_dir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark knowledge base chunking strategies.")
+    parser.add_argument("--reports", default=str(REPO_ROOT / "emp_reports"), help="Directory of *_report.txt files")
+    parser.add_argument("--strategies", nargs="+", default=["structured", "document", "fixed", "agentic"])
+    parser.add_argument("--k", type=int, default=1, help="Number of chunks retrieved per query")
+    args = parser.parse_args()
+
+    reports = sorted(Path(args.reports).glob("*_report.txt"))
+    if not reports:
+        sys.exit(f"No reports found in {args.reports}")
+    embedder = SentenceTransformerEmbedder()
+
+    print(f"{'strategy':<12} {'build p50 [s]':>14} {'build max [s]':>14} {'hit@' + str(args.k):>8} {'coverage':>9}")
+    for strategy in args.strategies:
+        try:
+            results = [benchmark_report(report, strategy, embedder, args.k) for report in reports]
+        except Exception as e:
+            print(f"{strategy:<12} skipped: {type(e).__name__}: {e}")
+            continue
+        build_times = [r[0] for r in results]
+        hits = sum(r[1] for r in results)
+        total = sum(r[2] for r in results) or 1
+        coverage = statistics.mean(r[3] for r in results)
+        print(
+            f"{strategy:<12} {statistics.median(build_times):>14.3f} {max(build_times):>14.3f} "
+            f"{hits / total:>8.2%} {coverage:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+Calls avoided and latency of the local empathy gate in front of EmpathizerAgent.
+
+Replays the employee turns of the recorded transcripts in
+benchmarks/fixtures/counseling_transcripts.json. For every turn the local
+gate (ChatBot.empathy_gate) decides whether the empathizer LLM is needed.
+With --llm, the ungated EmpathizerAgent is also run on every turn, and the
+gated path is timed as gate + LLM call only where the gate lets the turn
+through. The gate is also run on the labeled messages in
+benchmarks/fixtures/empathy_gate_labeled.json. Reports:
+
+- LLM calls avoided by the gate
+- recall: labeled emotional messages the gate lets through to the
+  empathizer (every miss is a turn answered without empathy)
+- neutral skipped: labeled neutral messages the gate skips
+- with --llm: agreement with the LLM's own NO_EMPATHY_NEEDED decision and
+  the turns where the LLM empathized but the gate skipped it
+- empathy step latency per turn, ungated vs. gated (p50 / mean, seconds)
+
+--llm needs OPENAI_API_KEY.
+
+Usage:
+    python benchmarks/empathy_gate.py --verbose
+    python benchmarks/empathy_gate.py --llm --threshold 0.4 0.5 0.6
+"""
+
+import argparse
+import copy
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from ChatBot.empathy_gate import EmpathyGate  # noqa: E402
+from ChatBot.transcript import SenderType, Transcript  # noqa: E402
+
+
+def turn_histories(transcripts):
+    """Conversation history up to and including every employee reply."""
+    histories = []
+    for transcript in transcripts:
+        history = Transcript()
+        for turn in transcript["turns"]:
+            history.append(SenderType.BOT, turn["counselor"])
+            history.append(SenderType.EMPLOYEE, turn["employee"])
+            histories.append(copy.deepcopy(history))
+    return histories
+
+
+def run_llm(histories):
+    """Ungated empathizer output and latency for every turn."""
+    from ChatBot.empathizer_agent import EmpathizerAgent
+
+    empathizer = EmpathizerAgent(use_gate=False)
+    results = []
+    for history in histories:
+        started = time.perf_counter()
+        response = empathizer.generate_empathetic_response(history)
+        results.append({"empathized": bool(response), "seconds": time.perf_counter() - started})
+    return results
+
+
+def labeled_rates(gate, examples, verbose=False):
+    """Recall on the emotional examples and skip rate on the neutral ones."""
+    emotional = [e for e in examples if e["emotional"]]
+    neutral = [e for e in examples if not e["emotional"]]
+    passed = 0
+    for example in emotional:
+        if gate.score(example["text"]).needs_empathy:
+            passed += 1
+        elif verbose:
+            print(f"  missed: {example['text']}")
+    skipped = sum(not gate.score(e["text"]).needs_empathy for e in neutral)
+    return (
+        passed / len(emotional) if emotional else None,
+        skipped / len(neutral) if neutral else None,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the local empathy gate.")
+    parser.add_argument(
+        "--transcripts",
+        default=str(REPO_ROOT / "benchmarks" / "fixtures" / "counseling_transcripts.json"),
+        help="JSON file of recorded transcripts",
+    )
+    parser.add_argument(
+        "--labeled",
+        default=str(REPO_ROOT / "benchmarks" / "fixtures" / "empathy_gate_labeled.json"),
+        help="JSON list of {text, emotional} examples",
+    )
+    parser.add_argument("--threshold", type=float, nargs="+", default=[None], help="Gate thresholds (default: config)")
+    parser.add_argument("--embeddings", action="store_true", help="Enable the embedding stage of the gate")
+    parser.add_argument("--llm", action="store_true", help="Also run the ungated empathizer LLM on every turn")
+    parser.add_argument("--verbose", action="store_true", help="Print the gate decision for every turn")
+    args = parser.parse_args()
+
+    histories = turn_histories(json.loads(Path(args.transcripts).read_text()))
+    examples = json.loads(Path(args.labeled).read_text())
+    llm = run_llm(histories) if args.llm else None
+
+    print(
+        f"{len(histories)} employee turns, {len(examples)} labeled messages "
+        f"({sum(e['emotional'] for e in examples)} emotional)"
+    )
+    header = f"{'threshold':>9} {'avoided':>8} {'recall':>7} {'neutral skipped':>16} {'gate p50 [ms]':>14}"
+    if llm:
+        header += f" {'agreement':>10} {'missed':>7} {'ungated p50 [s]':>16} {'gated p50 [s]':>14} {'ungated mean':>13} {'gated mean':>11}"
+    print(header)
+
+    for threshold in args.threshold:
+        gate = EmpathyGate(threshold=threshold, use_embeddings=args.embeddings)
+        if args.embeddings:
+            # Load the model and exemplar embeddings outside the timings
+            gate.score("warm up")
+        decisions, gate_seconds = [], []
+        for history in histories:
+            started = time.perf_counter()
+            score = gate.score(history[-1].text)
+            gate_seconds.append(time.perf_counter() - started)
+            decisions.append(score.needs_empathy)
+            if args.verbose:
+                print(f"  [{score.intensity:.2f} {'LLM ' if score.needs_empathy else 'skip'}] {history[-1].text}")
+
+        avoided = sum(not d for d in decisions) / len(decisions)
+        recall, neutral_skipped = labeled_rates(gate, examples, args.verbose)
+        line = (
+            f"{gate.threshold:>9.2f} {avoided:>8.0%} {recall:>7.0%} {neutral_skipped:>16.0%} "
+            f"{statistics.median(gate_seconds) * 1000:>14.3f}"
+        )
+        if llm:
+            agreement = sum(d == r["empathized"] for d, r in zip(decisions, llm)) / len(llm)
+            missed = sum(r["empathized"] and not d for d, r in zip(decisions, llm))
+            ungated = [r["seconds"] for r in llm]
+            gated = [g + (r["seconds"] if d else 0.0) for d, g, r in zip(decisions, gate_seconds, llm)]
+            line += (
+                f" {agreement:>10.0%} {missed:>7} {statistics.median(ungated):>16.2f} {statistics.median(gated):>14.2f}"
+                f" {statistics.mean(ungated):>13.2f} {statistics.mean(gated):>11.2f}"
+            )
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
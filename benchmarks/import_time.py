@@ -0,0 +1,97 @@
+"""
+Import-time benchmark for the API entry point.
+
+Runs `python -X importtime -c "import <module>"` in fresh interpreters from
+the repository root and reports the median total import time together with
+the slowest imported packages. Use --max-seconds to fail (exit code 1) when
+startup regresses past a budget, e.g. in CI.
+
+Usage:
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --module ChatBot.chatbot --runs 5 --top 20
+    python benchmarks/import_time.py --max-seconds 4 --json import_time.json
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def profile_import(module: str) -> Tuple[float, Dict[str, float]]:
+    """
+    Import a module in a fresh interpreter with -X importtime.
+
+    Returns:
+        Tuple of (total seconds, {package: cumulative seconds}) for top-level imports
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{proc.stderr[-2000:]}")
+
+    total_us = 0
+    cumulative: Dict[str, float] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        # Format: "import time: <self us> | <cumulative us> | <indented package>"
+        self_us, cumulative_us, name = line.split(":", 1)[1].split("|")
+        total_us += int(self_us)
+        # Top-level imports have a single space before the package name
+        if not name[1:].startswith(" "):
+            cumulative[name.strip()] = int(cumulative_us) / 1e6
+    return total_us / 1e6, cumulative
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure import time of the API modules.")
+    parser.add_argument("--module", default="main", help="Module to import (default: main)")
+    parser.add_argument("--runs", type=int, default=3, help="Number of fresh-interpreter runs")
+    parser.add_argument("--top", type=int, default=15, help="Number of slowest packages to show")
+    parser.add_argument("--max-seconds", type=float, default=None, help="Fail if the median exceeds this")
+    parser.add_argument("--json", dest="json_path", default=None, help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    totals: List[float] = []
+    slowest: Dict[str, float] = {}
+    for _ in range(args.runs):
+        total, cumulative = profile_import(args.module)
+        totals.append(total)
+        for name, seconds in cumulative.items():
+            slowest[name] = max(slowest.get(name, 0.0), seconds)
+
+    median = statistics.median(totals)
+    top = sorted(slowest.items(), key=lambda item: item[1], reverse=True)[: args.top]
+
+    print(f"import {args.module}: median {median:.3f}s over {args.runs} runs "
+          f"(min {min(totals):.3f}s, max {max(totals):.3f}s)")
+    print(f"{'cumulative [s]':>15}  package")
+    for name, seconds in top:
+        print(f"{seconds:>15.3f}  {name}")
+
+    if args.json_path:
+        with open(args.json_path, "w") as file:
+            json.dump(
+                {"module": args.module, "runs": totals, "median_seconds": median, "slowest": dict(top)},
+                file,
+                indent=2,
+            )
+
+    if args.max_seconds is not None and median > args.max_seconds:
+        print(f"FAIL: median import time {median:.3f}s exceeds budget {args.max_seconds:.3f}s")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
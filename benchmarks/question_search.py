@@ -0,0 +1,154 @@
+"""
+Recall@k vs. latency of the question templates search settings.
+
+Builds a question bank in a temporary LanceDB, in the same row format as
+the question_templates table, from the `*Qn:*` questions of the reports in
+emp_reports/ (padded with synthetic combinations up to --rows). Each query
+is a question with some of its words dropped; a hit means the source
+question is among the top-k results. Every setting is measured on the same
+table:
+
+- vector, brute-force scan (no index)
+- vector with an IVF-PQ / HNSW index, for several nprobes values
+- hybrid full-text + vector search (with and without the IVF-PQ index)
+
+Usage:
+    python benchmarks/question_search.py
+    python benchmarks/question_search.py --rows 20000 --queries 300 --k 1 5
+"""
+
+import argparse
+import json
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from ChatBot.knowledge_base import (  # noqa: E402
+    CachedSentenceTransformerEmbedder,
+    build_questions_vector_db,
+    ensure_search_indexes,
+)
+from ChatBot.report_parser import parse_report  # noqa: E402
+
+
+
+def question_bank(reports_dir, rows, rng):
+    """Unique report questions, padded with synthetic pairs up to rows."""
+    questions = []
+    for report in sorted(Path(reports_dir).glob("*_report.txt")):
+        questions.extend(parse_report(report.read_text()).questions)
+    questions = list(dict.fromkeys(q for q in questions if q))
+    if not questions:
+        sys.exit(f"No questions found in {reports_dir}")
+    bank = list(questions)
+    seen = set(bank)
+    while len(bank) < rows:
+        combined = f"{rng.choice(questions)} {rng.choice(questions)}"
+        if combined not in seen:
+            seen.add(combined)
+            bank.append(combined)
+    return bank[:rows] if rows else bank
+
+
+def noisy(text, rng, drop=0.3):
+    """Drop a fraction of the words of a question, keeping at least three."""
+    words = text.split()
+    kept = [w for w in words if rng.random() >= drop]
+    return " ".join(kept if len(kept) >= 3 else words)
+
+
+def create_table(db_dir, bank, embedder, batch_size):
+    """Write the question bank with one batched encode call per batch."""
+    vector_db = build_questions_vector_db(db_dir, embedder, search_type="vector")
+    model = embedder._get_model()
+    rows = []
+    for start in range(0, len(bank), batch_size):
+        batch = bank[start : start + batch_size]
+        for offset, (text, vector) in enumerate(zip(batch, model.encode(batch))):
+            name = f"q{start + offset}"
+            payload = {"name": name, "meta_data": {}, "content": text, "usage": None}
+            rows.append({"vector": vector.tolist(), "id": name, "payload": json.dumps(payload)})
+    vector_db.table.add(rows)
+    return vector_db
+
+
+def measure(vector_db, queries, k):
+    """Return (recall@k, p50 latency [ms], p95 latency [ms])."""
+    hits, latencies = 0, []
+    for source, query in queries:
+        started = time.perf_counter()
+        docs = vector_db.search(query, limit=k)
+        latencies.append((time.perf_counter() - started) * 1000)
+        hits += any(doc.name == source for doc in docs)
+    latencies.sort()
+    p95 = latencies[min(len(latencies) - 1, int(0.95 * len(latencies)))]
+    return hits / len(queries), statistics.median(latencies), p95
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark question templates search settings.")
+    parser.add_argument("--reports", default=str(REPO_ROOT / "emp_reports"), help="Directory of *_report.txt files")
+    parser.add_argument("--rows", type=int, default=5000, help="Size of the question bank")
+    parser.add_argument("--queries", type=int, default=200, help="Number of queries")
+    parser.add_argument("--k", type=int, nargs="+", default=[1, 5], help="Number of results retrieved per query")
+    parser.add_argument("--nprobes", type=int, nargs="+", default=[5, 20, 50])
+    parser.add_argument("--batch-size", type=int, default=256, help="Encode batch size while building")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    bank = question_bank(args.reports, args.rows, rng)
+    sources = rng.sample(range(len(bank)), min(args.queries, len(bank)))
+    queries = [(f"q{i}", noisy(bank[i], rng)) for i in sources]
+
+    embedder = CachedSentenceTransformerEmbedder()
+    # Query embeddings are computed up front, so latencies cover search only
+    embedder.get_embeddings([query for _, query in queries])
+
+    db_dir = tempfile.mkdtemp(prefix="question_search_bench_")
+    try:
+        started = time.perf_counter()
+        vector_db = create_table(db_dir, bank, embedder, args.batch_size)
+        print(f"Question bank: {len(bank)} rows, built in {time.perf_counter() - started:.1f}s")
+
+        settings = [("vector, no index", "vector", "none", [None])]
+        settings += [(f"vector, {name}", "vector", name, args.nprobes) for name in ("ivf_pq", "hnsw")]
+        settings += [("hybrid, no index", "hybrid", "none", [None]), ("hybrid, ivf_pq", "hybrid", "ivf_pq", [20])]
+
+        header = f"{'setting':<20} {'nprobes':>8} {'build [s]':>10}"
+        for k in args.k:
+            header += f" {'recall@' + str(k):>10} {'p50 [ms]':>9} {'p95 [ms]':>9}"
+        print(header)
+        for label, search_type, index_type, nprobes_values in settings:
+            vector_db = build_questions_vector_db(db_dir, embedder, search_type=search_type)
+            table = vector_db.connection.open_table(vector_db.table_name)
+            for index in table.list_indices():
+                table.drop_index(index.name)
+            started = time.perf_counter()
+            ensure_search_indexes(vector_db, index_type=index_type, min_rows=0)
+            build_seconds = time.perf_counter() - started
+            # Session starts call this on every load: once built, it must not rebuild
+            version = vector_db.connection.open_table(vector_db.table_name).version
+            rebuilt = ensure_search_indexes(vector_db, index_type=index_type, min_rows=0)
+            if rebuilt or vector_db.connection.open_table(vector_db.table_name).version != version:
+                sys.exit(f"ensure_search_indexes rebuilt the existing indices for {label}")
+            for nprobes in nprobes_values:
+                vector_db.nprobes = nprobes
+                line = f"{label:<20} {nprobes or '-':>8} {build_seconds:>10.2f}"
+                for k in args.k:
+                    recall, p50, p95 = measure(vector_db, queries, k)
+                    line += f" {recall:>10.2%} {p50:>9.2f} {p95:>9.2f}"
+                print(line)
+    finally:
+        shutil.rmtree(db_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
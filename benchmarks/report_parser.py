@@ -0,0 +1,73 @@
+"""
+Session-start cost of extracting the topics of an employee report.
+
+For every report in emp_reports/, compares per session start:
+
+- regex: the previous CounselingAgent._extract_issues_from_data (uncompiled
+  lazy DOTALL patterns over the full report, whose topics were whole issue
+  sections)
+- parser: ChatBot.report_parser.parse_report, parsed on the first session
+  and served from the content-hash cache for the following ones
+
+and reports the time per session start (microseconds) and the topics each
+one extracts.
+
+Usage:
+    python benchmarks/report_parser.py
+    python benchmarks/report_parser.py --sessions 1000 --reports emp_reports
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from ChatBot.report_parser import _cache, parse_report  # noqa: E402
+
+
+def regex_issues(text):
+    """Topic extraction as done before ChatBot.report_parser."""
+    matches = re.findall(r"Issue \d+:(.*?)(?=Issue \d+:|$)", text, re.DOTALL)
+    if not matches:
+        matches = re.findall(r"\*\*Issue \d+:(.*?)(?=\*\*Issue \d+:|$)", text, re.DOTALL)
+    issues = [match.strip() for match in matches]
+    return issues if issues else ["general well-being"]
+
+
+def parser_issues(text):
+    topics = parse_report(text).topics
+    return topics if topics else ["general well-being"]
+
+
+def per_session_us(extract, text, sessions):
+    started = time.perf_counter()
+    for _ in range(sessions):
+        extract(text)
+    return (time.perf_counter() - started) / sessions * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark report topic extraction at session start.")
+    parser.add_argument("--reports", default=str(REPO_ROOT / "emp_reports"), help="Directory of *_report.txt files")
+    parser.add_argument("--sessions", type=int, default=1000, help="Session starts per report")
+    args = parser.parse_args()
+
+    print(f"{'report':<28} {'regex [us]':>11} {'parser [us]':>12} {'first parse [us]':>17}")
+    for path in sorted(Path(args.reports).glob("*_report.txt")):
+        text = path.read_text()
+        _cache.clear()
+        first = per_session_us(parser_issues, text, 1)
+        print(
+            f"{path.name:<28} {per_session_us(regex_issues, text, args.sessions):>11.1f} "
+            f"{per_session_us(parser_issues, text, args.sessions):>12.1f} {first:>17.1f}"
+        )
+        for before, after in zip(regex_issues(text), parser_issues(text)):
+            print(f"    {len(before):>5} chars -> {after}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Precision / recall and latency of the local escalation pre-screen.
+
+Runs ChatBot.risk_screen on the labeled messages in
+benchmarks/fixtures/risk_screen_labeled.json, with the lexicon only and with
+the optional embedding similarity stage, and reports:
+
+- precision / recall of the "high" level against the escalate label
+  (high-risk turns are escalated without an LLM call; only unambiguous
+  self-harm or violence phrases are meant to reach it)
+- to LLM: escalation messages classified uncertain, left to the LLM
+  decision maker
+- benign rate: share of non-escalation messages classified benign (turns
+  that may skip the LLM decision maker)
+- unsafe benign: escalation messages classified benign (must be 0)
+- screen latency per message (p50 / p95, milliseconds)
+
+The embedding stage loads the knowledge base sentence-transformer.
+
+Usage:
+    python benchmarks/risk_screen.py
+    python benchmarks/risk_screen.py --lexicon-only --verbose
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from ChatBot.risk_screen import BENIGN, HIGH, UNCERTAIN, RiskScreen  # noqa: E402
+
+
+def evaluate(screen, examples, verbose=False):
+    tp = fp = fn = benign = unsafe = deferred = 0
+    latencies = []
+    negatives = sum(not e["escalate"] for e in examples)
+    positives = len(examples) - negatives
+    for example in examples:
+        started = time.perf_counter()
+        result = screen.screen(example["text"])
+        latencies.append((time.perf_counter() - started) * 1000)
+        flagged = result.level == HIGH
+        tp += flagged and example["escalate"]
+        fp += flagged and not example["escalate"]
+        fn += not flagged and example["escalate"]
+        benign += result.level == BENIGN and not example["escalate"]
+        unsafe += result.level == BENIGN and example["escalate"]
+        deferred += result.level == UNCERTAIN and example["escalate"]
+        if verbose and flagged != example["escalate"]:
+            print(f"  {'FP' if flagged else 'FN'} [{result.level}] {example['text']}")
+    latencies.sort()
+    return {
+        "precision": tp / (tp + fp) if tp + fp else None,
+        "recall": tp / (tp + fn) if tp + fn else None,
+        "benign_rate": benign / negatives if negatives else None,
+        "unsafe_benign": unsafe,
+        "to_llm": deferred / positives if positives else None,
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": latencies[min(len(latencies) - 1, int(0.95 * len(latencies)))],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the local escalation pre-screen.")
+    parser.add_argument(
+        "--fixtures",
+        default=str(REPO_ROOT / "benchmarks" / "fixtures" / "risk_screen_labeled.json"),
+        help="JSON list of {text, escalate} examples",
+    )
+    parser.add_argument("--lexicon-only", action="store_true", help="Skip the embedding similarity stage")
+    parser.add_argument("--verbose", action="store_true", help="Print misclassified messages")
+    args = parser.parse_args()
+
+    examples = json.loads(Path(args.fixtures).read_text())
+    variants = [("lexicon", False)] + ([] if args.lexicon_only else [("lexicon+embeddings", True)])
+
+    print(f"{len(examples)} messages, {sum(e['escalate'] for e in examples)} labeled escalate")
+    print(
+        f"{'screen':<20} {'precision':>10} {'recall':>8} {'to LLM':>7} {'benign':>8} {'unsafe':>7} "
+        f"{'p50 [ms]':>9} {'p95 [ms]':>9}"
+    )
+    for name, use_embeddings in variants:
+        screen = RiskScreen(use_embeddings=use_embeddings)
+        if use_embeddings:
+            # Load the model and exemplar embeddings outside the timings
+            screen.screen("warm up")
+        r = evaluate(screen, examples, args.verbose)
+        fmt = lambda v: f"{v:.0%}" if v is not None else "-"  # noqa: E731
+        print(
+            f"{name:<20} {fmt(r['precision']):>10} {fmt(r['recall']):>8} {fmt(r['to_llm']):>7} {fmt(r['benign_rate']):>8} "
+            f"{r['unsafe_benign']:>7} {r['p50_ms']:>9.2f} {r['p95_ms']:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Memory held by the transcripts of concurrent chat sessions.
+
+Builds the conversation state of --sessions sessions from the recorded
+turns in benchmarks/fixtures/counseling_transcripts.json (cycled up to
+--turns exchanges per session), in two layouts:
+
+- dicts: the router's list of {"sender", "text", "timestamp"} dicts with
+  datetime timestamps, plus the counseling agent's own list of
+  {"role", "content"} dicts (the layout before ChatBot.transcript)
+- transcript: one ChatBot.transcript.Transcript shared by both
+
+and reports the memory allocated (tracemalloc) in total and per session.
+Bot messages are stored as the router received them (a string of their
+own), employee messages are shared, as in the real sessions.
+
+Usage:
+    python benchmarks/session_memory.py
+    python benchmarks/session_memory.py --sessions 10000 --turns 20
+"""
+
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+from datetime import datetime, timezone
+from itertools import cycle, islice
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from ChatBot.transcript import SenderType, Transcript  # noqa: E402
+
+
+def session_turns(transcripts, turns):
+    """(counselor, employee) pairs of one session, cycling through the recorded turns."""
+    recorded = [(turn["counselor"], turn["employee"]) for transcript in transcripts for turn in transcript["turns"]]
+    return list(islice(cycle(recorded), turns))
+
+
+def build_dicts(turns):
+    """The router's message dicts and the counseling agent's history of one session."""
+    messages, history = [], []
+    for question, reply in turns:
+        # Every session receives its own strings from the model and the client
+        question, reply = f" {question}"[1:], f" {reply}"[1:]
+        history.append({"role": "counselor", "content": question})
+        messages.append({"sender": "bot", "text": f" {question}"[1:], "timestamp": datetime.now(timezone.utc)})
+        history.append({"role": "employee", "content": reply})
+        messages.append({"sender": "employee", "text": reply, "timestamp": datetime.now(timezone.utc)})
+    return messages, history
+
+
+def build_transcript(turns):
+    """The shared transcript of one session."""
+    transcript = Transcript()
+    for question, reply in turns:
+        question, reply = f" {question}"[1:], f" {reply}"[1:]
+        transcript.append(SenderType.BOT, question)
+        transcript.append(SenderType.EMPLOYEE, reply)
+    return transcript
+
+
+def measure(build, turns, sessions):
+    """Bytes allocated by sessions live sessions built with build(turns)."""
+    gc.collect()
+    before = tracemalloc.get_traced_memory()[0]
+    state = [build(turns) for _ in range(sessions)]
+    gc.collect()
+    allocated = tracemalloc.get_traced_memory()[0] - before
+    del state
+    return allocated
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the memory of concurrent session transcripts.")
+    parser.add_argument("--sessions", type=int, default=10000, help="Number of concurrent sessions")
+    parser.add_argument("--turns", type=int, default=10, help="Counselor/employee exchanges per session")
+    parser.add_argument(
+        "--transcripts",
+        default=str(REPO_ROOT / "benchmarks" / "fixtures" / "counseling_transcripts.json"),
+        help="JSON file of recorded transcripts",
+    )
+    args = parser.parse_args()
+
+    turns = session_turns(json.loads(Path(args.transcripts).read_text()), args.turns)
+    text_bytes = sum(len(question) + len(reply) for question, reply in turns)
+    print(f"{args.sessions} sessions x {args.turns} exchanges ({text_bytes} characters of text per session)")
+
+    tracemalloc.start()
+    print(f"{'layout':<11} {'total [MiB]':>12} {'KiB/session':>12}")
+    for name, build in (("dicts", build_dicts), ("transcript", build_transcript)):
+        allocated = measure(build, turns, args.sessions)
+        print(f"{name:<11} {allocated / 2**20:>12.1f} {allocated / args.sessions / 1024:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
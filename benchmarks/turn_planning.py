@@ -0,0 +1,162 @@
+"""
+A/B benchmark of the two counseling turn planning modes.
+
+Replays the recorded transcripts in benchmarks/fixtures/ through
+CounselingAgent.process_response, once with TURN_PLANNING_MODE
+"multi_call" (empathizer + decision maker + question agent) and once with
+"single_call" (one structured TurnPlanner call). Both modes see exactly the
+same conversation state at every turn, so their decisions can be compared
+one to one. Reports per mode:
+
+- latency of a turn (p50 / p95 / mean, seconds)
+- LLM round-trips per turn (including reasoning tool-call iterations)
+- decision agreement with the multi-call path for change_topic,
+  escalate_to_hr and end_chat
+- share of prompt tokens served from the provider's prompt cache
+
+Retrieval is served from the report text itself, so only LLM time is
+measured. Needs OPENAI_API_KEY.
+
+Usage:
+    python benchmarks/turn_planning.py
+    python benchmarks/turn_planning.py --repeat 3 --json results.json
+"""
+
+import argparse
+import copy
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from ChatBot import config  # noqa: E402
+from ChatBot.counseling_agent import CounselingAgent  # noqa: E402
+from ChatBot.transcript import SenderType, Transcript  # noqa: E402
+from Common.metrics import metrics  # noqa: E402
+
+MODES = ("multi_call", "single_call")
+DECISIONS = ("change_topic", "escalate_to_hr", "end_chat")
+
+
+class ReportKnowledge:
+    """Serves retrievals from the report text, keeping the vector store out of the timings."""
+
+    def __init__(self, report_text):
+        self.report_text = report_text
+
+    def retrieve_many(self, requests):
+        return [self.report_text if source == "employee" else "" for source, _, _ in requests]
+
+
+def replay(transcript, mode):
+    """Run every employee turn of a transcript; return a list of per-turn results."""
+    report_path = REPO_ROOT / transcript["report"]
+    agent = CounselingAgent(
+        model_id=config.MODEL_ID,
+        kb_manager=ReportKnowledge(report_path.read_text()),
+        context=transcript.get("context", ""),
+        report_file_path=report_path,
+        turn_planning_mode=mode,
+    )
+    initial_topic = agent.issues[0] if agent.issues else None
+
+    results, history = [], Transcript()
+    for turn in transcript["turns"]:
+        history.append(SenderType.BOT, turn["counselor"])
+        # Reset the agent to the recorded conversation state
+        agent.conversation_history = copy.deepcopy(history)
+        agent.current_topic = initial_topic
+        agent.topic_questions_count = {initial_topic: 1}
+        agent.explored_topics = set()
+        agent.is_interview_complete = agent.is_escalated_to_hr = False
+        agent.last_turn_decisions = None
+
+        started = time.perf_counter()
+        agent.process_response(turn["employee"])
+        results.append(
+            {
+                "seconds": time.perf_counter() - started,
+                "llm_calls": agent.last_turn_llm_calls,
+                "tool_calls": agent.last_turn_tool_calls,
+                "decisions": agent.last_turn_decisions,
+            }
+        )
+        history.append(SenderType.EMPLOYEE, turn["employee"])
+    return results
+
+
+def prompt_token_counters():
+    counters = metrics.snapshot()["counters"]
+    return counters.get("llm.prompt_tokens", 0), counters.get("llm.cached_prompt_tokens", 0)
+
+
+def summarize(mode, results, baseline):
+    seconds = sorted(r["seconds"] for r in results)
+    p95 = seconds[min(len(seconds) - 1, int(0.95 * len(seconds)))]
+    summary = {
+        "mode": mode,
+        "turns": len(results),
+        "p50_seconds": statistics.median(seconds),
+        "p95_seconds": p95,
+        "mean_seconds": statistics.mean(seconds),
+        "llm_calls_per_turn": statistics.mean(r["llm_calls"] for r in results),
+    }
+    for i, name in enumerate(DECISIONS):
+        pairs = [(r["decisions"], b["decisions"]) for r, b in zip(results, baseline) if r["decisions"] and b["decisions"]]
+        summary[f"{name}_agreement"] = (
+            sum(r[i] == b[i] for r, b in pairs) / len(pairs) if pairs else None
+        )
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="A/B benchmark of counseling turn planning modes.")
+    parser.add_argument(
+        "--transcripts",
+        default=str(REPO_ROOT / "benchmarks" / "fixtures" / "counseling_transcripts.json"),
+        help="JSON file of recorded transcripts",
+    )
+    parser.add_argument("--repeat", type=int, default=1, help="Number of replays per transcript and mode")
+    parser.add_argument("--json", help="Write the per-turn results and summaries to this file")
+    args = parser.parse_args()
+
+    transcripts = json.loads(Path(args.transcripts).read_text())
+    results = {mode: [] for mode in MODES}
+    prompt_tokens = {mode: [0, 0] for mode in MODES}
+    for _ in range(args.repeat):
+        for transcript in transcripts:
+            for mode in MODES:
+                prompt_before, cached_before = prompt_token_counters()
+                results[mode].extend(replay(transcript, mode))
+                prompt_after, cached_after = prompt_token_counters()
+                prompt_tokens[mode][0] += prompt_after - prompt_before
+                prompt_tokens[mode][1] += cached_after - cached_before
+
+    summaries = [summarize(mode, results[mode], results["multi_call"]) for mode in MODES]
+    for s in summaries:
+        prompt, cached = prompt_tokens[s["mode"]]
+        s["cached_prompt_share"] = cached / prompt if prompt else None
+    print(
+        f"{'mode':<12} {'turns':>6} {'p50 [s]':>8} {'p95 [s]':>8} {'calls/turn':>11} {'cached':>7} "
+        + " ".join(f"{d:>15}" for d in DECISIONS)
+    )
+    for s in summaries:
+        agreement = " ".join(
+            f"{s[f'{d}_agreement']:>15.0%}" if s[f"{d}_agreement"] is not None else f"{'-':>15}" for d in DECISIONS
+        )
+        cached = f"{s['cached_prompt_share']:.0%}" if s["cached_prompt_share"] is not None else "-"
+        print(
+            f"{s['mode']:<12} {s['turns']:>6} {s['p50_seconds']:>8.2f} {s['p95_seconds']:>8.2f} "
+            f"{s['llm_calls_per_turn']:>11.1f} {cached:>7} {agreement}"
+        )
+
+    if args.json:
+        Path(args.json).write_text(json.dumps({"summaries": summaries, "turns": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,7 @@ from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from ChatBot.chatbot import router as chatbot_router
 from Pipeline1.report import router as report_router
+from Common.metrics import metrics
 
 app = FastAPI(
     title="Employee Analysis API",
@@ -21,5 +22,11 @@ app.add_middleware(
 app.include_router(chatbot_router, prefix="/chatbot")
 app.include_router(report_router, prefix="/report")
 
+
+@app.get("/metrics")
+async def get_metrics():
+    """Return process-wide metrics (LLM queue wait times, request counts, ...)."""
+    return metrics.snapshot()
+
 if __name__ == "__main__":
     uvicorn.run("main:app", host="127.0.0.1", port=8081, reload=True, timeout_keep_alive=86400)